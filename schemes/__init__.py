@@ -1,6 +1,9 @@
+import base64
+import hashlib
 import os
 from collections.abc import Callable, Mapping
 from datetime import timedelta
+from functools import lru_cache
 from logging import Logger
 from typing import Any
 
@@ -8,13 +11,14 @@ import alembic.config
 import flask_session
 import inject
 from alembic import command
+from alembic.runtime.migration import MigrationContext
 from flask import Config, Flask, Response, flash, redirect, render_template, request, url_for
+from flask.sessions import SessionInterface
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf import CSRFProtect
 from flask_wtf.csrf import CSRFError
 from govuk_frontend_wtf.main import WTFormsHelpers
 from inject import Binder
-from jinja2 import ChoiceLoader, FileSystemLoader, PackageLoader, PrefixLoader
 from sqlalchemy import Engine, event
 from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.engine.interfaces import DBAPIConnection
@@ -22,65 +26,96 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import ConnectionPoolEntry
 from werkzeug import Response as BaseResponse
 
+from schemes.assets import asset_url, configure_assets
 from schemes.config import LocalConfig
-from schemes.domain.authorities import AuthorityRepository
+from schemes.domain.authorities import Authority, AuthorityRepository
 from schemes.domain.reporting_window import DefaultReportingWindowService, ReportingWindowService
-from schemes.domain.schemes.schemes import SchemeRepository
-from schemes.domain.users import UserRepository
-from schemes.infrastructure.api.authorities import ApiAuthorityRepository
+from schemes.domain.schemes.schemes import SchemeRepository, SchemeSummary
+from schemes.domain.users import User, UserRepository
+from schemes.event_loops import EventLoopFlask
+from schemes.infrastructure.api.authorities import ApiAuthorityRepository, AuthorityModelCatalogue
+from schemes.infrastructure.api.funding_programmes import FundingProgrammeCatalogue
 from schemes.infrastructure.api.schemes.schemes import ApiSchemeRepository
+from schemes.infrastructure.caching.authorities import CachingAuthorityRepository, RequestScopedAuthorityRepository
+from schemes.infrastructure.caching.caches import StaleWhileRevalidateCache, TtlCache
+from schemes.infrastructure.caching.schemes import CachingSchemeRepository, RequestScopedSchemeRepository
+from schemes.infrastructure.caching.users import CachingUserRepository, RequestScopedUserRepository
 from schemes.infrastructure.clock import Clock, FakeClock, SystemClock
+from schemes.infrastructure.database import HEAD_REVISION
+from schemes.infrastructure.database.sessions import SessionSweeper
 from schemes.infrastructure.database.users import DatabaseUserRepository
 from schemes.oauth import OAuthExtension
-from schemes.sessions import RequestFilteringSessionInterface
-from schemes.views import clock, legal, start, users
+from schemes.sessions import CachingSessionInterface, RequestFilteringSessionInterface
+from schemes.startup import StartupTimer
+from schemes.templates import configure_jinja
+from schemes.views import caches, clock, legal, start, users
 from schemes.views.auth import bearer
-from schemes.views.filters import date, pounds, remove_exponent
 from schemes.views.schemes import schemes
 
 
 def create_app(test_config: Mapping[str, Any] | None = None) -> Flask:
+    startup = StartupTimer()
     env = os.getenv("FLASK_ENV", LocalConfig.name)
 
-    app = Flask(__name__, static_folder="views/static", template_folder="views/templates")
-    app.config.from_object(f"schemes.config.{env.title()}Config")
-    app.config.from_prefixed_env()
-    app.config.from_mapping(test_config)
+    with startup.phase("config"):
+        app = EventLoopFlask(__name__, static_folder="views/static", template_folder="views/templates")
+        app.config.from_object(f"schemes.config.{env.title()}Config")
+        app.config.from_prefixed_env()
+        app.config.from_mapping(test_config)
 
-    _configure_logger(app)
+        _configure_logger(app)
 
-    inject.configure(bindings(app), bind_in_runtime=False)
+        inject.configure(bindings(app), bind_in_runtime=False)
 
     logger = inject.instance(Logger)
     logger.info("Using environment '%s'", env)
 
-    app.config["SESSION_SQLALCHEMY"] = SQLAlchemy(app)
-    flask_session.Session(app)
-    app.session_interface = RequestFilteringSessionInterface(app.session_interface, f"{app.static_url_path}/")
-    _configure_jinja(app)
-    _configure_http(app)
-    _configure_error_pages(app)
-    csrf = CSRFProtect(app)
-    _configure_govuk_frontend(app)
-    WTFormsHelpers(app)
-    OAuthExtension(app)
-
-    app.register_blueprint(clock.bp, url_prefix="/clock")
-    csrf.exempt(clock.set_clock)
-    app.register_blueprint(start.bp)
-    app.register_blueprint(legal.bp)
-    app.register_blueprint(bearer.bp, url_prefix="/auth")
-    app.register_blueprint(schemes.bp, url_prefix="/schemes")
-    app.register_blueprint(users.bp, url_prefix="/users")
-    csrf.exempt(users.add_users)
-    csrf.exempt(users.clear)
-
-    _migrate_database()
+    with startup.phase("extensions"):
+        app.config["SESSION_SQLALCHEMY"] = SQLAlchemy(app)
+        if app.config["SESSION_SWEEP"]:
+            app.config["SESSION_CLEANUP_N_REQUESTS"] = None
+        flask_session.Session(app)
+        app.session_interface = RequestFilteringSessionInterface(
+            _create_caching_session_interface(app, app.session_interface), f"{app.static_url_path}/"
+        )
+        configure_jinja(app)
+        configure_assets(app)
+        _configure_http(app)
+        _configure_error_pages(app)
+        csrf = CSRFProtect(app)
+        _configure_govuk_frontend(app)
+        WTFormsHelpers(app)
+        OAuthExtension(app)
+
+    with startup.phase("blueprints"):
+        app.register_blueprint(clock.bp, url_prefix="/clock")
+        csrf.exempt(clock.set_clock)
+        app.register_blueprint(start.bp)
+        app.register_blueprint(legal.bp)
+        app.register_blueprint(bearer.bp, url_prefix="/auth")
+        app.register_blueprint(schemes.bp, url_prefix="/schemes")
+        app.register_blueprint(users.bp, url_prefix="/users")
+        csrf.exempt(users.add_users)
+        csrf.exempt(users.clear)
+        app.register_blueprint(caches.bp, url_prefix="/caches")
+        csrf.exempt(caches.clear)
+
+        _configure_cli(app)
+
+    with startup.phase("database"):
+        if app.config["MIGRATE_DATABASE"]:
+            _migrate_database()
+        else:
+            _check_database_revision()
+
+    _configure_startup_report(app, startup)
 
     return app
 
 
-def destroy_app(_app: Flask) -> None:
+def destroy_app(app: Flask) -> None:
+    if isinstance(app, EventLoopFlask):
+        app.event_loop.stop()
     inject.clear()
 
 
@@ -93,9 +128,14 @@ def bindings(app: Flask) -> Callable[[Binder], None]:
         binder.bind_to_constructor(ReportingWindowService, DefaultReportingWindowService)
         binder.bind_to_constructor(Engine, _create_engine)
         binder.bind_to_constructor(sessionmaker[Session], _create_session_maker)
-        binder.bind_to_constructor(AuthorityRepository, _create_api_authority_repository)
-        binder.bind_to_constructor(UserRepository, DatabaseUserRepository)
-        binder.bind_to_constructor(SchemeRepository, _create_api_scheme_repository)
+        binder.bind_to_constructor(CachingAuthorityRepository, _create_caching_authority_repository)
+        binder.bind_to_constructor(AuthorityRepository, _create_request_scoped_authority_repository)
+        binder.bind_to_constructor(CachingUserRepository, _create_caching_user_repository)
+        binder.bind_to_constructor(UserRepository, _create_request_scoped_user_repository)
+        binder.bind_to_constructor(FundingProgrammeCatalogue, _create_funding_programme_catalogue)
+        binder.bind_to_constructor(AuthorityModelCatalogue, _create_authority_model_catalogue)
+        binder.bind_to_constructor(CachingSchemeRepository, _create_caching_scheme_repository)
+        binder.bind_to_constructor(SchemeRepository, _create_request_scoped_scheme_repository)
 
     return _bindings
 
@@ -128,51 +168,94 @@ def _create_api_authority_repository(app: Flask) -> ApiAuthorityRepository:
 
 
 @inject.autoparams()
-def _create_api_scheme_repository(app: Flask) -> ApiSchemeRepository:
-    oauth = app.extensions["authlib.integrations.flask_client"]
-    return ApiSchemeRepository(oauth.ate)
+def _create_request_scoped_authority_repository(authorities: CachingAuthorityRepository) -> AuthorityRepository:
+    return RequestScopedAuthorityRepository(authorities)
 
 
-def _enforce_sqlite_foreign_keys(dbapi_connection: DBAPIConnection, _connection_record: ConnectionPoolEntry) -> None:
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+@inject.autoparams()
+def _create_caching_authority_repository(app: Flask) -> CachingAuthorityRepository:
+    cache = TtlCache[str, Authority](app.config["AUTHORITY_CACHE_TTL"], app.config["AUTHORITY_CACHE_MAX_SIZE"])
+    return CachingAuthorityRepository(_create_api_authority_repository(), cache)
 
 
-def _configure_jinja(app: Flask) -> None:
-    app.jinja_options["extensions"] = ["jinja2.ext.do"]
+@inject.autoparams()
+def _create_caching_user_repository(app: Flask) -> CachingUserRepository:
+    cache = TtlCache[str, User](app.config["USER_CACHE_TTL"], app.config["USER_CACHE_MAX_SIZE"])
+    return CachingUserRepository(DatabaseUserRepository(), cache)
 
-    app.jinja_env.filters[date.__name__] = date
-    app.jinja_env.filters[pounds.__name__] = pounds
-    app.jinja_env.filters[remove_exponent.__name__] = remove_exponent
 
-    default_loader = FileSystemLoader(os.path.join(app.root_path, str(app.template_folder)))
-    package_loaders = PrefixLoader(
-        {
-            "govuk_frontend_jinja": PackageLoader("govuk_frontend_jinja"),
-            "govuk_frontend_wtf": PackageLoader("govuk_frontend_wtf"),
-        }
+@inject.autoparams()
+def _create_request_scoped_user_repository(users: CachingUserRepository) -> UserRepository:
+    return RequestScopedUserRepository(users)
+
+
+@inject.autoparams()
+def _create_funding_programme_catalogue(app: Flask) -> FundingProgrammeCatalogue:
+    return FundingProgrammeCatalogue(app.config["FUNDING_PROGRAMME_TTL"])
+
+
+@inject.autoparams()
+def _create_authority_model_catalogue(app: Flask) -> AuthorityModelCatalogue:
+    return AuthorityModelCatalogue(app.config["AUTHORITY_CACHE_TTL"], app.config["AUTHORITY_CACHE_MAX_SIZE"])
+
+
+@inject.autoparams()
+def _create_api_scheme_repository(
+    app: Flask, funding_programmes: FundingProgrammeCatalogue, authority_models: AuthorityModelCatalogue
+) -> ApiSchemeRepository:
+    oauth = app.extensions["authlib.integrations.flask_client"]
+    return ApiSchemeRepository(oauth.ate, funding_programmes, authority_models)
+
+
+@inject.autoparams()
+def _create_caching_scheme_repository(app: Flask) -> CachingSchemeRepository:
+    cache = StaleWhileRevalidateCache[str, list[SchemeSummary]](
+        app.config["SCHEMES_CACHE_TTL"], app.config["SCHEMES_CACHE_STALE_TTL"], app.config["SCHEMES_CACHE_MAX_SIZE"]
     )
-    app.jinja_loader = ChoiceLoader([default_loader, package_loaders])
+    return CachingSchemeRepository(_create_api_scheme_repository(), cache)
+
+
+@inject.autoparams()
+def _create_request_scoped_scheme_repository(schemes: CachingSchemeRepository) -> SchemeRepository:
+    return RequestScopedSchemeRepository(schemes)
+
+
+def _create_caching_session_interface(app: Flask, delegate: SessionInterface) -> CachingSessionInterface:
+    cache = TtlCache[str, dict[str, Any]](app.config["SESSION_CACHE_TTL"], app.config["SESSION_CACHE_MAX_SIZE"])
+    return CachingSessionInterface(delegate, cache, app.config["SESSION_REFRESH_THRESHOLD"])
+
+
+def _enforce_sqlite_foreign_keys(dbapi_connection: DBAPIConnection, _connection_record: ConnectionPoolEntry) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
 
 def _configure_http(app: Flask) -> None:
     hsts_max_age = int(timedelta(days=365).total_seconds())
     csp_govuk_frontend = "'sha256-GUQ5ad8JK5KmEWmROf3LZd9ge94daqNvd8xy9YS1iDw='"
-    csp_govuk_frontend_init = "'sha256-qlEoMJwhtzSzuQBNcUtKL5nwWlPXO6xVXHxEUboRWW4='"
+    govuk_frontend_init = app.jinja_env.get_template("govuk_frontend_init.js")
 
     @app.after_request
     def set_headers(response: Response) -> Response:
+        # The inline script imports GOV.UK Frontend by its fingerprinted URL, so hash it as rendered
+        csp_govuk_frontend_init = _csp_hash(govuk_frontend_init.render())
         response.headers["Strict-Transport-Security"] = f"max-age={hsts_max_age}"
         response.headers["X-Content-Type-Options"] = "nosniff"
         response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
         response.content_security_policy.script_src = f"{csp_govuk_frontend} {csp_govuk_frontend_init} 'self';"
         response.content_security_policy.default_src = "'self';"
-        if not response.direct_passthrough:
+        if not (response.direct_passthrough or "Cache-Control" in response.headers):
             response.cache_control.no_store = True
         return response
 
 
+@lru_cache(maxsize=16)
+def _csp_hash(script: str) -> str:
+    digest = base64.b64encode(hashlib.sha256(script.encode()).digest()).decode()
+    return f"'sha256-{digest}'"
+
+
 def _configure_error_pages(app: Flask) -> None:
     @app.errorhandler(400)
     def bad_request(_error: Exception) -> Response:
@@ -202,20 +285,66 @@ def _configure_govuk_frontend(app: Flask) -> None:
         return {
             "assetPath": url_for("static", filename="govuk-frontend/assets"),
             "themeColor": "#006853",
-            "opengraphImageUrl": url_for(
-                "static", filename="ate-frontend/assets/ate-icons/ate-opengraph-image.png", _external=True
-            ),
+            "opengraphImageUrl": asset_url("ate-frontend/assets/ate-icons/ate-opengraph-image.png", _external=True),
             "oneLoginLink": app.config["GOVUK_PROFILE_URL"],
             "serviceName": "Update your capital schemes",
         }
 
 
+def _configure_startup_report(app: Flask, startup: StartupTimer) -> None:
+    logger = inject.instance(Logger)
+    logger.info(
+        "Started in %.1f ms after %.1f ms of CPU time importing modules (%s)",
+        startup.elapsed * 1000,
+        startup.cpu_time_before_startup * 1000,
+        ", ".join(f"{name}: {duration * 1000:.1f} ms" for name, duration in startup.phases.items()),
+    )
+
+    @app.after_request
+    def report_first_response(response: BaseResponse) -> BaseResponse:
+        elapsed = startup.first_response()
+        if elapsed is not None:
+            logger.info("Served first response %.1f ms after startup", elapsed * 1000)
+        return response
+
+
+def _configure_cli(app: Flask) -> None:
+    @app.cli.command("db-upgrade")
+    def db_upgrade() -> None:
+        """Upgrade the database to the latest revision."""
+        _migrate_database()
+
+    @app.cli.command("sessions-sweep")
+    def sessions_sweep() -> None:
+        """Delete expired sessions."""
+        SessionSweeper(app.config["SESSION_SWEEP_BATCH_SIZE"]).sweep()
+
+
 def _migrate_database() -> None:
     engine = inject.instance(Engine)
-
-    alembic_config = alembic.config.Config()
-    alembic_config.set_main_option("script_location", "schemes:infrastructure/database/migrations")
+    alembic_config = _create_alembic_config()
 
     with engine.connect() as connection:
         alembic_config.attributes["connection"] = connection
         command.upgrade(alembic_config, "head")
+
+
+def _check_database_revision() -> None:
+    engine = inject.instance(Engine)
+    logger = inject.instance(Logger)
+
+    with engine.connect() as connection:
+        revision = MigrationContext.configure(connection).get_current_revision()
+
+    if revision != HEAD_REVISION:
+        logger.warning(
+            "Database is at revision '%s' rather than '%s', run 'flask db-upgrade' to migrate it",
+            revision,
+            HEAD_REVISION,
+        )
+
+
+def _create_alembic_config() -> alembic.config.Config:
+    alembic_config = alembic.config.Config()
+    alembic_config.set_main_option("script_location", "schemes:infrastructure/database/migrations")
+    return alembic_config
@@ -0,0 +1,160 @@
+import gzip
+import json
+import mimetypes
+import os
+import sys
+from collections.abc import Mapping
+from datetime import timedelta
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Self
+
+import brotli
+from flask import Flask, Response, current_app, request, send_from_directory, url_for
+
+MANIFEST_FILENAME = "asset-manifest.json"
+
+_ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+_COMPRESSIBLE_SUFFIXES = {".css", ".ico", ".js", ".json", ".map", ".svg", ".txt"}
+_IMMUTABLE_MAX_AGE = int(timedelta(days=365).total_seconds())
+
+
+class AssetManifest:
+    """
+    Maps static filenames to copies named after a hash of their content, which can be cached indefinitely since any
+    change to a file changes its URL, together with the encodings that each copy has been precompressed with.
+    """
+
+    def __init__(self, assets: Mapping[str, str], encodings: Mapping[str, list[str]] | None = None):
+        encodings = encodings or {}
+        self._assets = dict(assets)
+        self._encodings = {fingerprinted: list(encodings.get(fingerprinted, [])) for fingerprinted in assets.values()}
+
+    @classmethod
+    def load(cls, static_folder: str) -> Self:
+        path = Path(static_folder, MANIFEST_FILENAME)
+        if not path.is_file():
+            return cls({})
+
+        assets: dict[str, str] = json.loads(path.read_text())
+        encodings = {
+            fingerprinted: [
+                encoding
+                for encoding, suffix in _ENCODING_SUFFIXES.items()
+                if Path(static_folder, fingerprinted + suffix).is_file()
+            ]
+            for fingerprinted in assets.values()
+        }
+        return cls(assets, encodings)
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def resolve(self, filename: str) -> str:
+        return self._assets.get(filename, filename)
+
+    def is_fingerprinted(self, filename: str) -> bool:
+        return filename in self._encodings
+
+    def encodings(self, filename: str) -> list[str]:
+        return self._encodings.get(filename, [])
+
+
+def configure_assets(app: Flask) -> None:
+    manifest = AssetManifest.load(app.static_folder) if app.static_folder else AssetManifest({})
+    app.extensions["assets"] = manifest
+    app.jinja_env.globals[asset_url.__name__] = asset_url
+
+    if app.static_folder and "static" in app.view_functions:
+        static_folder = app.static_folder
+
+        def static(filename: str) -> Response:
+            if not manifest.is_fingerprinted(filename):
+                return app.send_static_file(filename)
+            return _send_fingerprinted_asset(static_folder, filename, manifest.encodings(filename))
+
+        app.view_functions["static"] = static
+
+
+def asset_url(filename: str, **values: Any) -> str:
+    """
+    Builds the URL of a static file as `url_for("static", filename=filename, **values)` does, but to its fingerprinted
+    copy if it has one.
+    """
+    manifest: AssetManifest = current_app.extensions["assets"]
+    return url_for("static", filename=manifest.resolve(filename), **values)
+
+
+def _send_fingerprinted_asset(static_folder: str, filename: str, encodings: list[str]) -> Response:
+    encoding = request.accept_encodings.best_match(encodings) if encodings else None
+    response = send_from_directory(
+        static_folder,
+        filename + _ENCODING_SUFFIXES[encoding] if encoding else filename,
+        mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        max_age=_IMMUTABLE_MAX_AGE,
+    )
+    response.cache_control.immutable = True
+    if encoding:
+        response.content_encoding = encoding
+    if encodings:
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+def build_assets(static_folder: str) -> AssetManifest:
+    """
+    Copies every static file to a fingerprinted filename, precompresses the copies of text files with gzip and Brotli
+    where that makes them smaller, and writes a manifest of the copies. Assets from any previous build are replaced.
+    """
+    root = Path(static_folder)
+    _remove_assets(root)
+
+    assets: dict[str, str] = {}
+    for path in sorted(path for path in root.rglob("*") if path.is_file()):
+        content = path.read_bytes()
+        fingerprinted_path = path.with_name(f"{path.stem}.{sha256(content).hexdigest()[:8]}{path.suffix}")
+        fingerprinted_path.write_bytes(content)
+        if path.suffix in _COMPRESSIBLE_SUFFIXES:
+            _write_if_smaller(fingerprinted_path, "gzip", gzip.compress(content, compresslevel=9, mtime=0), content)
+            _write_if_smaller(fingerprinted_path, "br", brotli.compress(content, quality=11), content)
+        assets[path.relative_to(root).as_posix()] = fingerprinted_path.relative_to(root).as_posix()
+
+    (root / MANIFEST_FILENAME).write_text(json.dumps(assets, indent=2, sort_keys=True))
+    return AssetManifest.load(static_folder)
+
+
+def _remove_assets(root: Path) -> None:
+    manifest_path = root / MANIFEST_FILENAME
+    if not manifest_path.is_file():
+        return
+
+    assets: dict[str, str] = json.loads(manifest_path.read_text())
+    for fingerprinted in assets.values():
+        for suffix in ["", *_ENCODING_SUFFIXES.values()]:
+            (root / (fingerprinted + suffix)).unlink(missing_ok=True)
+    manifest_path.unlink()
+
+
+def _write_if_smaller(path: Path, encoding: str, compressed: bytes, content: bytes) -> None:
+    if len(compressed) < len(content):
+        path.with_name(path.name + _ENCODING_SUFFIXES[encoding]).write_bytes(compressed)
+
+
+def main() -> None:
+    """
+    Builds the assets in the static folder given as the only argument. This must be the folder that the server serves,
+    which is not that of the installed package when the server imports the package from its working directory.
+    """
+    if len(sys.argv) != 2:
+        sys.exit("Usage: schemes-build-assets STATIC_FOLDER")
+
+    static_folder = sys.argv[1]
+    if not os.path.isdir(static_folder):
+        sys.exit(f"Static folder {static_folder} not found; build the web assets with 'npm run build' first")
+
+    build_assets(static_folder)
+    manifest = AssetManifest.load(static_folder)
+    if not manifest:
+        sys.exit(f"No assets were fingerprinted in {static_folder}")
+
+    print(f"Fingerprinted {len(manifest)} assets in {static_folder}")
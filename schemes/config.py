@@ -13,13 +13,21 @@ class Config:
     SESSION_COOKIE_SAMESITE = "Lax"
     PERMANENT_SESSION_LIFETIME = timedelta(hours=1)
     SEND_FILE_MAX_AGE_DEFAULT = timedelta(hours=1)
+    PERSISTENT_EVENT_LOOP = True
+    TEMPLATE_CACHE_DIR: str | None = None
+    SCHEMES_PAGE_SIZE = 50
 
     # Flask-SQLAlchemy
     SQLALCHEMY_DATABASE_URI = "sqlite+pysqlite:///:memory:"
+    MIGRATE_DATABASE = True
 
     # Flask-Session
     SESSION_TYPE = "sqlalchemy"
+    SESSION_SERIALIZATION_FORMAT = "msgpack"
     SESSION_CLEANUP_N_REQUESTS = 100
+    SESSION_SWEEP = False
+    SESSION_SWEEP_BATCH_SIZE = 1000
+    SESSION_REFRESH_THRESHOLD = int(timedelta(minutes=5).total_seconds())
 
     # GOV.UK One Login
     GOVUK_SERVER_METADATA_URL = "https://oidc.integration.account.gov.uk/.well-known/openid-configuration"
@@ -32,6 +40,21 @@ class Config:
     ATE_SERVER_METADATA_URL = "https://dev.identity.api.activetravelengland.gov.uk/.well-known/openid-configuration"
     ATE_ISSUER = "https://dev.identity.api.activetravelengland.gov.uk/"
     ATE_AUDIENCE = "https://dev.api.activetravelengland.gov.uk"
+    ATE_MAX_CONNECTIONS = 10
+    ATE_KEEPALIVE_EXPIRY = int(timedelta(minutes=1).total_seconds())
+    ATE_TOKEN_REFRESH_LEEWAY = int(timedelta(minutes=5).total_seconds())
+
+    # Caching
+    AUTHORITY_CACHE_TTL = int(timedelta(hours=1).total_seconds())
+    AUTHORITY_CACHE_MAX_SIZE = 500
+    FUNDING_PROGRAMME_TTL = int(timedelta(hours=1).total_seconds())
+    SCHEMES_CACHE_TTL = int(timedelta(minutes=1).total_seconds())
+    SCHEMES_CACHE_STALE_TTL = int(timedelta(hours=1).total_seconds())
+    SCHEMES_CACHE_MAX_SIZE = 500
+    USER_CACHE_TTL = int(timedelta(minutes=5).total_seconds())
+    USER_CACHE_MAX_SIZE = 1000
+    SESSION_CACHE_TTL = int(timedelta(seconds=30).total_seconds())
+    SESSION_CACHE_MAX_SIZE = 1000
 
 
 class LocalConfig(Config):
@@ -42,6 +65,9 @@ class LocalConfig(Config):
 
 
 class GoogleConfig(Config):
+    # Flask
+    TEMPLATES_AUTO_RELOAD = False
+
     # Flask-SQLAlchemy
     SQLALCHEMY_ENGINE_OPTIONS: Mapping[str, Any] = {
         "pool_pre_ping": True,
@@ -1,12 +1,38 @@
-from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
 class DateRange:
-    date_from: datetime
-    date_to: datetime | None
+    """
+    Immutable range of dates, open-ended when there is no to date.
 
-    def __post_init__(self) -> None:
-        if not (self.date_to is None or self.date_from <= self.date_to):
-            raise ValueError(f"From date '{self.date_from}' must not be after to date '{self.date_to}'")
+    This is a slotted class rather than a frozen dataclass as it is created for every revision, and frozen dataclasses
+    are comparatively slow to construct.
+    """
+
+    __slots__ = ("_date_from", "_date_to")
+
+    def __init__(self, date_from: datetime, date_to: datetime | None):
+        if not (date_to is None or date_from <= date_to):
+            raise ValueError(f"From date '{date_from}' must not be after to date '{date_to}'")
+
+        self._date_from = date_from
+        self._date_to = date_to
+
+    @property
+    def date_from(self) -> datetime:
+        return self._date_from
+
+    @property
+    def date_to(self) -> datetime | None:
+        return self._date_to
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateRange):
+            return NotImplemented
+        return self._date_from == other._date_from and self._date_to == other._date_to
+
+    def __hash__(self) -> int:
+        return hash((self._date_from, self._date_to))
+
+    def __repr__(self) -> str:
+        return f"DateRange(date_from={self._date_from!r}, date_to={self._date_to!r})"
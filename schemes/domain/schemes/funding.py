@@ -15,6 +15,8 @@ class FinancialType(Enum):
 
 
 class FinancialRevision:
+    __slots__ = ("_id", "_effective", "_type", "_amount", "_source")
+
     # TODO: domain identifier should be mandatory for transient instances
     def __init__(self, id_: int | None, effective: DateRange, type_: FinancialType, amount: int, source: DataSource):
         self._id = id_
@@ -31,6 +31,8 @@ class Milestone(Enum):
 
 
 class MilestoneRevision:
+    __slots__ = ("_id", "_effective", "_milestone", "_observation_type", "_status_date", "_source")
+
     # TODO: domain identifier should be mandatory for transient instances
     def __init__(
         self,
@@ -124,6 +124,8 @@ class OutputTypeMeasure(Enum):
 
 
 class OutputRevision:
+    __slots__ = ("_effective", "_type_measure", "_value", "_observation_type")
+
     def __init__(
         self,
         effective: DateRange,
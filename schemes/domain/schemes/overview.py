@@ -34,6 +34,8 @@ class FundingProgrammes:
 
 
 class OverviewRevision:
+    __slots__ = ("_effective", "_name", "_authority_abbreviation", "_type", "_funding_programme")
+
     def __init__(
         self,
         effective: DateRange,
@@ -5,6 +5,8 @@ from schemes.domain.schemes.data_sources import DataSource
 
 
 class AuthorityReview:
+    __slots__ = ("_id", "_review_date", "_source")
+
     # TODO: domain identifier should be mandatory for transient instances
     def __init__(self, id_: int | None, review_date: datetime, source: DataSource):
         self._id = id_
@@ -48,5 +50,8 @@ class SchemeReviews:
         )
 
     def needs_review(self, reporting_window: ReportingWindow) -> bool:
-        last_reviewed = self.last_reviewed
-        return last_reviewed is None or last_reviewed < reporting_window.window.date_from
+        return needs_review(self.last_reviewed, reporting_window)
+
+
+def needs_review(last_reviewed: datetime | None, reporting_window: ReportingWindow) -> bool:
+    return last_reviewed is None or last_reviewed < reporting_window.window.date_from
@@ -1,10 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum, auto
 
+from schemes.domain.reporting_window import ReportingWindow
 from schemes.domain.schemes.funding import SchemeFunding
 from schemes.domain.schemes.milestones import Milestone, SchemeMilestones
 from schemes.domain.schemes.outputs import SchemeOutputs
 from schemes.domain.schemes.overview import FundingProgramme, SchemeOverview, SchemeType
-from schemes.domain.schemes.reviews import SchemeReviews
+from schemes.domain.schemes.reviews import SchemeReviews, needs_review
 
 
 class Status(Enum):
@@ -55,13 +58,17 @@ class Scheme:
 
     @property
     def is_updateable(self) -> bool:
-        is_active = self.status == Status.ACTIVE
-        is_eligible_for_authority_update = self._is_eligible_for_authority_update(self.overview.funding_programme)
-        return is_active and is_eligible_for_authority_update
+        return _is_updateable(self.status, self.overview.funding_programme)
 
-    @staticmethod
-    def _is_eligible_for_authority_update(funding_programme: FundingProgramme | None) -> bool:
-        return funding_programme.is_eligible_for_authority_update if funding_programme else True
+    @property
+    def summary(self) -> "SchemeSummary":
+        return SchemeSummary(
+            reference=self.reference,
+            status=self.status,
+            name=self.overview.name,
+            funding_programme=self.overview.funding_programme,
+            last_reviewed=self.reviews.last_reviewed,
+        )
 
     @property
     def milestones_eligible_for_authority_update(self) -> set[Milestone]:
@@ -75,6 +82,32 @@ class Scheme:
         return milestones
 
 
+@dataclass(frozen=True, slots=True)
+class SchemeSummary:
+    """
+    Read model of a scheme's current state for listing schemes, without the revision history of its aggregate.
+    """
+
+    reference: str
+    status: Status
+    name: str | None
+    funding_programme: FundingProgramme | None
+    last_reviewed: datetime | None
+
+    @property
+    def is_updateable(self) -> bool:
+        return _is_updateable(self.status, self.funding_programme)
+
+    def needs_review(self, reporting_window: ReportingWindow) -> bool:
+        return needs_review(self.last_reviewed, reporting_window)
+
+
+def _is_updateable(status: Status, funding_programme: FundingProgramme | None) -> bool:
+    is_active = status == Status.ACTIVE
+    is_eligible_for_authority_update = funding_programme.is_eligible_for_authority_update if funding_programme else True
+    return is_active and is_eligible_for_authority_update
+
+
 class SchemeRepository:
     async def add(self, *schemes: Scheme) -> None:
         raise NotImplementedError()
@@ -85,7 +118,7 @@ class SchemeRepository:
     async def get(self, reference: str) -> Scheme | None:
         raise NotImplementedError()
 
-    async def get_by_authority(self, authority_abbreviation: str) -> list[Scheme]:
+    async def get_summaries_by_authority(self, authority_abbreviation: str, fresh: bool = False) -> list[SchemeSummary]:
         raise NotImplementedError()
 
     async def update(self, scheme: Scheme) -> None:
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import os
+from asyncio import AbstractEventLoop
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from threading import Lock, Thread
+from typing import Any
+
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopThread:
+    """
+    Event loop that runs in a daemon thread and is started lazily, and again after a fork, in each process.
+
+    Callbacks registered with `on_stop` are run on the loop before it stops, to release resources bound to it.
+    """
+
+    def __init__(self, stop_timeout: float = 5) -> None:
+        self._loop: AbstractEventLoop | None = None
+        self._pid: int | None = None
+        self._lock = Lock()
+        self._stop_callbacks: list[Callable[[], Coroutine[Any, Any, None]]] = []
+        self._stop_timeout = stop_timeout
+
+    def run[T](self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    def on_stop(self, callback: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        self._stop_callbacks.append(callback)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._loop and self._pid == os.getpid():
+                for callback in self._stop_callbacks:
+                    self._run_stop_callback(self._loop, callback)
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+            self._pid = None
+
+    def _run_stop_callback(self, loop: AbstractEventLoop, callback: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        try:
+            asyncio.run_coroutine_threadsafe(callback(), loop).result(self._stop_timeout)
+        except Exception as error:
+            logger.warning("Cannot run event loop stop callback %r: %s", callback, error)
+
+    def _get_loop(self) -> AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                Thread(target=self._run_loop, args=(self._loop,), name="event-loop", daemon=True).start()
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+
+class EventLoopFlask(Flask):
+    """
+    Flask application that runs async views on one event loop per process rather than a new event loop per request.
+
+    The loop is shared by every thread of the process, so views must run blocking work, such as database queries and
+    template rendering, with `asyncio.to_thread` rather than on the loop.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.event_loop = EventLoopThread()
+
+    def async_to_sync(self, func: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
+        if not self.config["PERSISTENT_EVENT_LOOP"]:
+            return super().async_to_sync(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.event_loop.run(func(*args, **kwargs))
+
+        return wrapper
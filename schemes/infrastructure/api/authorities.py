@@ -1,9 +1,12 @@
+import time
+from collections.abc import Callable
 from typing import Annotated, Any
 
 from pydantic import AnyUrl, Field
 
 from schemes.domain.authorities import Authority, AuthorityRepository
 from schemes.infrastructure.api.base import BaseModel
+from schemes.infrastructure.caching.caches import TtlCache
 from schemes.oauth import AsyncBaseApp
 
 
@@ -17,19 +20,47 @@ class AuthorityModel(BaseModel):
         return Authority(abbreviation=self.abbreviation, name=self.full_name)
 
 
+class AuthorityModelCatalogue:
+    def __init__(self, ttl: int, max_size: int, timer: Callable[[], float] = time.monotonic):
+        self._by_url = TtlCache[str, AuthorityModel](ttl, max_size, timer)
+
+    def get_by_url(self, url: str) -> AuthorityModel | None:
+        return self._by_url.get(url)
+
+    def add(self, url: str, authority_model: AuthorityModel) -> None:
+        self._by_url.set(url, authority_model)
+
+    def invalidate(self) -> None:
+        self._by_url.clear()
+
+
 class ApiAuthorityRepository(AuthorityRepository):
     def __init__(self, remote_app: AsyncBaseApp):
         self._remote_app = remote_app
+        self._etags: dict[str, tuple[str, Authority]] = {}
 
     async def get(self, abbreviation: str) -> Authority | None:
-        response = await self._remote_app.get(f"/authorities/{abbreviation}", request=self._dummy_request())
+        etag_and_authority = self._etags.get(abbreviation)
+        headers = {"If-None-Match": etag_and_authority[0]} if etag_and_authority else {}
+        response = await self._remote_app.get(
+            f"/authorities/{abbreviation}", headers=headers, request=self._dummy_request()
+        )
+
+        if response.status_code == 304 and etag_and_authority:
+            return etag_and_authority[1]
 
         if response.status_code == 404:
+            self._etags.pop(abbreviation, None)
             return None
 
         response.raise_for_status()
-        authority_model = AuthorityModel.model_validate(response.json())
-        return authority_model.to_domain()
+        authority_model = AuthorityModel.model_validate_json(response.content)
+        authority = authority_model.to_domain()
+
+        if etag := response.headers.get("ETag"):
+            self._etags[abbreviation] = (etag, authority)
+
+        return authority
 
     # See: https://github.com/authlib/authlib/issues/818#issuecomment-3257950062
     @staticmethod
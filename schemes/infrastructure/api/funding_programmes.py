@@ -1,3 +1,7 @@
+import math
+import time
+from collections.abc import Callable
+from threading import Lock
 from typing import Annotated
 
 from pydantic import AnyUrl, Field
@@ -22,3 +26,63 @@ class FundingProgrammeItemModel(BaseModel):
     def to_domain(self) -> FundingProgramme:
         # TODO: is_eligible_for_authority_update
         return FundingProgramme(code=self.code, is_eligible_for_authority_update=True)
+
+
+class FundingProgrammeCatalogue:
+    def __init__(self, ttl: int, timer: Callable[[], float] = time.monotonic):
+        self._ttl = ttl
+        self._timer = timer
+        self._by_id: dict[AnyUrl, FundingProgrammeModel | FundingProgrammeItemModel] = {}
+        self._by_code: dict[str, FundingProgrammeModel | FundingProgrammeItemModel] = {}
+        self._eligible_for_authority_update: list[FundingProgrammeItemModel] | None = None
+        self._expires_at = math.inf
+        self._lock = Lock()
+
+    @property
+    def eligible_for_authority_update(self) -> list[FundingProgrammeItemModel] | None:
+        with self._lock:
+            self._expire()
+            return self._eligible_for_authority_update
+
+    def get_by_id(self, id_: AnyUrl) -> FundingProgrammeModel | FundingProgrammeItemModel | None:
+        with self._lock:
+            self._expire()
+            return self._by_id.get(id_)
+
+    def get_by_code(self, code: str) -> FundingProgrammeModel | FundingProgrammeItemModel | None:
+        with self._lock:
+            self._expire()
+            return self._by_code.get(code)
+
+    def add(self, *funding_programme_models: FundingProgrammeModel | FundingProgrammeItemModel) -> None:
+        with self._lock:
+            self._expire()
+            self._add(*funding_programme_models)
+
+    def update_eligible_for_authority_update(self, *funding_programme_models: FundingProgrammeItemModel) -> None:
+        with self._lock:
+            self._expire()
+            self._add(*funding_programme_models)
+            self._eligible_for_authority_update = list(funding_programme_models)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def _add(self, *funding_programme_models: FundingProgrammeModel | FundingProgrammeItemModel) -> None:
+        if self._expires_at == math.inf:
+            self._expires_at = self._timer() + self._ttl
+
+        for funding_programme_model in funding_programme_models:
+            self._by_id[funding_programme_model.id] = funding_programme_model
+            self._by_code[funding_programme_model.code] = funding_programme_model
+
+    def _expire(self) -> None:
+        if self._timer() >= self._expires_at:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._by_id.clear()
+        self._by_code.clear()
+        self._eligible_for_authority_update = None
+        self._expires_at = math.inf
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
 
@@ -27,7 +28,7 @@ class CapitalSchemeOverviewModel(BaseModel):
     def to_domain(
         self,
         authority_models: list[AuthorityModel],
-        funding_programme_item_models: list[FundingProgrammeModel] | list[FundingProgrammeItemModel],
+        funding_programme_models: Mapping[AnyUrl, FundingProgrammeModel | FundingProgrammeItemModel],
     ) -> OverviewRevision:
         # TODO: effective
         return OverviewRevision(
@@ -39,9 +40,5 @@ class CapitalSchemeOverviewModel(BaseModel):
                 if authority_model.id == self.bid_submitting_authority
             ),
             type_=self.type.to_domain(),
-            funding_programme=next(
-                funding_programme_item_model.to_domain()
-                for funding_programme_item_model in funding_programme_item_models
-                if funding_programme_item_model.id == self.funding_programme
-            ),
+            funding_programme=funding_programme_models[self.funding_programme].to_domain(),
         )
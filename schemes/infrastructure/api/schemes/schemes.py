@@ -1,10 +1,22 @@
+import asyncio
+import logging
+import time
+from collections.abc import Coroutine, Mapping
 from typing import Any
 
-from schemes.domain.schemes.schemes import Scheme, SchemeRepository
-from schemes.infrastructure.api.authorities import AuthorityModel
+from httpx import Response
+from pydantic import AnyUrl
+
+from schemes.domain.schemes.schemes import Scheme, SchemeRepository, SchemeSummary
+from schemes.infrastructure.api.authorities import AuthorityModel, AuthorityModelCatalogue
 from schemes.infrastructure.api.base import BaseModel
 from schemes.infrastructure.api.collections import CollectionModel
-from schemes.infrastructure.api.funding_programmes import FundingProgrammeItemModel, FundingProgrammeModel
+from schemes.infrastructure.api.dates import zoned_to_local
+from schemes.infrastructure.api.funding_programmes import (
+    FundingProgrammeCatalogue,
+    FundingProgrammeItemModel,
+    FundingProgrammeModel,
+)
 from schemes.infrastructure.api.schemes.authority_reviews import (
     CapitalSchemeAuthorityReviewModel,
     CreateCapitalSchemeAuthorityReviewModel,
@@ -16,6 +28,8 @@ from schemes.infrastructure.api.schemes.overviews import CapitalSchemeOverviewMo
 from schemes.infrastructure.api.schemes.statuses import CapitalSchemeStatusModel
 from schemes.oauth import AsyncBaseApp, ClientAsyncBaseApp
 
+logger = logging.getLogger(__name__)
+
 
 class CapitalSchemeModel(BaseModel):
     reference: str
@@ -29,10 +43,10 @@ class CapitalSchemeModel(BaseModel):
     def to_domain(
         self,
         authority_models: list[AuthorityModel],
-        funding_programme_item_models: list[FundingProgrammeModel] | list[FundingProgrammeItemModel],
+        funding_programme_models: Mapping[AnyUrl, FundingProgrammeModel | FundingProgrammeItemModel],
     ) -> Scheme:
         scheme = Scheme(reference=self.reference, status=self.status.status.to_domain())
-        scheme.overview.update_overview(self.overview.to_domain(authority_models, funding_programme_item_models))
+        scheme.overview.update_overview(self.overview.to_domain(authority_models, funding_programme_models))
         scheme.funding.update_financials(*[financial.to_domain() for financial in self.financials.items])
         scheme.milestones.update_milestones(*[milestone.to_domain() for milestone in self.milestones.items])
         scheme.outputs.update_outputs(*[output.to_domain() for output in self.outputs.items])
@@ -49,80 +63,115 @@ class CapitalSchemeItemModel(BaseModel):
     status: CapitalSchemeStatusModel
     authority_review: CapitalSchemeAuthorityReviewModel | None = None
 
-    def to_domain(
-        self, authority_models: list[AuthorityModel], funding_programme_item_models: list[FundingProgrammeItemModel]
-    ) -> Scheme:
-        scheme = Scheme(reference=self.reference, status=self.status.status.to_domain())
-        scheme.overview.update_overview(self.overview.to_domain(authority_models, funding_programme_item_models))
-        # TODO: financials, milestones, outputs
-
-        if self.authority_review:
-            scheme.reviews.update_authority_review(self.authority_review.to_domain())
-
-        return scheme
+    def to_summary(
+        self, funding_programme_models: Mapping[AnyUrl, FundingProgrammeModel | FundingProgrammeItemModel]
+    ) -> SchemeSummary:
+        return SchemeSummary(
+            reference=self.reference,
+            status=self.status.status.to_domain(),
+            name=self.overview.name,
+            funding_programme=funding_programme_models[self.overview.funding_programme].to_domain(),
+            last_reviewed=zoned_to_local(self.authority_review.review_date) if self.authority_review else None,
+        )
 
 
 class ApiSchemeRepository(SchemeRepository):
-    def __init__(self, remote_app: ClientAsyncBaseApp):
+    def __init__(
+        self,
+        remote_app: ClientAsyncBaseApp,
+        funding_programmes: FundingProgrammeCatalogue,
+        authority_models: AuthorityModelCatalogue,
+    ):
         self._remote_app = remote_app
+        self._funding_programmes = funding_programmes
+        self._authority_models = authority_models
 
     async def get(self, reference: str) -> Scheme | None:
         async with self._remote_app.client() as client:
-            response = await client.get(f"/capital-schemes/{reference}", request=self._dummy_request())
+            response = await self._get(client, f"/capital-schemes/{reference}")
 
             if response.status_code == 404:
                 return None
 
             response.raise_for_status()
-            capital_scheme_model = CapitalSchemeModel.model_validate(response.json())
+            capital_scheme_model = CapitalSchemeModel.model_validate_json(response.content)
 
             authority_url = capital_scheme_model.overview.bid_submitting_authority
-            authority_models = [await self._get_authority_model_by_url(client, str(authority_url))]
-
             funding_programme_url = capital_scheme_model.overview.funding_programme
-            funding_programme_models = [
-                await self._get_funding_programme_model_by_url(client, str(funding_programme_url))
-            ]
+            # Concurrent requests share the client, so are bounded by its connection pool (ATE_MAX_CONNECTIONS)
+            authority_model, funding_programme_model = await asyncio.gather(
+                self._get_authority_model_by_url(client, str(authority_url)),
+                self._get_funding_programme_model_by_url(client, funding_programme_url),
+            )
 
-            return capital_scheme_model.to_domain(authority_models, funding_programme_models)
+            return capital_scheme_model.to_domain(
+                [authority_model], {funding_programme_model.id: funding_programme_model}
+            )
 
-    async def get_by_authority(self, authority_abbreviation: str) -> list[Scheme]:
+    async def get_summaries_by_authority(self, authority_abbreviation: str, fresh: bool = False) -> list[SchemeSummary]:
         async with self._remote_app.client() as client:
             authority_url = f"/authorities/{authority_abbreviation}"
-            authority_model = await self._get_authority_model_by_url(client, authority_url)
-            funding_programme_items_model = await self._get_funding_programme_items_model(client)
-            funding_programme_codes = [
-                funding_programme_item_model.code
-                for funding_programme_item_model in funding_programme_items_model.items
-            ]
+            authority_model, funding_programme_item_models = await asyncio.gather(
+                self._get_authority_model_by_url(client, authority_url),
+                self._get_funding_programme_item_models_eligible_for_authority_update(client),
+            )
+            funding_programme_models = {
+                funding_programme_item_model.id: funding_programme_item_model
+                for funding_programme_item_model in funding_programme_item_models
+            }
 
             capital_scheme_items_model = await self._get_capital_scheme_items_model_by_url(
-                client, str(authority_model.bid_submitting_capital_schemes), funding_programme_codes
+                client,
+                str(authority_model.bid_submitting_capital_schemes),
+                [funding_programme_model.code for funding_programme_model in funding_programme_models.values()],
             )
             return [
-                capital_scheme_item_model.to_domain([authority_model], funding_programme_items_model.items)
+                capital_scheme_item_model.to_summary(funding_programme_models)
                 for capital_scheme_item_model in capital_scheme_items_model.items
             ]
 
     async def update(self, scheme: Scheme) -> None:
         async with self._remote_app.client() as client:
-            await self._update_financials(client, scheme)
-            await self._update_milestones(client, scheme)
-            await self._update_authority_reviews(client, scheme)
+            results = await asyncio.gather(
+                *self._update_financials(client, scheme),
+                *self._update_milestones(client, scheme),
+                *self._update_authority_reviews(client, scheme),
+                return_exceptions=True,
+            )
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise BaseExceptionGroup(f"Failed to update capital scheme {scheme.reference}", errors)
 
-    async def _get_funding_programme_items_model(
+    async def _get_funding_programme_item_models_eligible_for_authority_update(
         self, remote_app: AsyncBaseApp
-    ) -> CollectionModel[FundingProgrammeItemModel]:
-        response = await remote_app.get(
-            "/funding-programmes", params={"eligible-for-authority-update": "true"}, request=self._dummy_request()
-        )
-        response.raise_for_status()
-        return CollectionModel[FundingProgrammeItemModel].model_validate(response.json())
+    ) -> list[FundingProgrammeItemModel]:
+        funding_programme_item_models = self._funding_programmes.eligible_for_authority_update
 
-    async def _get_funding_programme_model_by_url(self, remote_app: AsyncBaseApp, url: str) -> FundingProgrammeModel:
-        response = await remote_app.get(url, request=self._dummy_request())
-        response.raise_for_status()
-        return FundingProgrammeModel.model_validate(response.json())
+        if funding_programme_item_models is None:
+            response = await self._get(
+                remote_app, "/funding-programmes", params={"eligible-for-authority-update": "true"}
+            )
+            response.raise_for_status()
+            funding_programme_item_models = (
+                CollectionModel[FundingProgrammeItemModel].model_validate_json(response.content).items
+            )
+            self._funding_programmes.update_eligible_for_authority_update(*funding_programme_item_models)
+
+        return funding_programme_item_models
+
+    async def _get_funding_programme_model_by_url(
+        self, remote_app: AsyncBaseApp, url: AnyUrl
+    ) -> FundingProgrammeModel | FundingProgrammeItemModel:
+        funding_programme_model = self._funding_programmes.get_by_id(url)
+
+        if funding_programme_model is None:
+            response = await self._get(remote_app, str(url))
+            response.raise_for_status()
+            funding_programme_model = FundingProgrammeModel.model_validate_json(response.content)
+            self._funding_programmes.add(funding_programme_model)
+
+        return funding_programme_model
 
     async def _get_capital_scheme_items_model_by_url(
         self,
@@ -130,29 +179,36 @@ class ApiSchemeRepository(SchemeRepository):
         url: str,
         funding_programme_codes: list[str],
     ) -> CollectionModel[CapitalSchemeItemModel]:
-        response = await remote_app.get(
-            url,
-            params={"funding-programme-code": funding_programme_codes, "status": "active"},
-            request=self._dummy_request(),
+        response = await self._get(
+            remote_app, url, params={"funding-programme-code": funding_programme_codes, "status": "active"}
         )
         response.raise_for_status()
-        return CollectionModel[CapitalSchemeItemModel].model_validate(response.json())
+        return CollectionModel[CapitalSchemeItemModel].model_validate_json(response.content)
 
     async def _get_capital_scheme_model_by_url(self, remote_app: AsyncBaseApp, url: str) -> CapitalSchemeModel:
-        response = await remote_app.get(url, request=self._dummy_request())
+        response = await self._get(remote_app, url)
         response.raise_for_status()
-        return CapitalSchemeModel.model_validate(response.json())
+        return CapitalSchemeModel.model_validate_json(response.content)
 
     async def _get_authority_model_by_url(self, remote_app: AsyncBaseApp, url: str) -> AuthorityModel:
-        response = await remote_app.get(url, request=self._dummy_request())
-        response.raise_for_status()
-        return AuthorityModel.model_validate(response.json())
+        authority_model = self._authority_models.get_by_url(url)
 
-    async def _update_financials(self, remote_app: AsyncBaseApp, scheme: Scheme) -> None:
-        for financial_revision in scheme.funding.financial_revisions:
-            if financial_revision.id is None:
-                financial_model = CapitalSchemeFinancialModel.from_domain(financial_revision)
-                await self._create_financial(remote_app, scheme.reference, financial_model)
+        if authority_model is None:
+            response = await self._get(remote_app, url)
+            response.raise_for_status()
+            authority_model = AuthorityModel.model_validate_json(response.content)
+            self._authority_models.add(url, authority_model)
+
+        return authority_model
+
+    def _update_financials(self, remote_app: AsyncBaseApp, scheme: Scheme) -> list[Coroutine[Any, Any, None]]:
+        return [
+            self._create_financial(
+                remote_app, scheme.reference, CapitalSchemeFinancialModel.from_domain(financial_revision)
+            )
+            for financial_revision in scheme.funding.financial_revisions
+            if financial_revision.id is None
+        ]
 
     async def _create_financial(
         self, remote_app: AsyncBaseApp, capital_scheme_reference: str, financial_model: CapitalSchemeFinancialModel
@@ -165,20 +221,22 @@ class ApiSchemeRepository(SchemeRepository):
         )
         response.raise_for_status()
 
-    async def _update_milestones(self, remote_app: AsyncBaseApp, scheme: Scheme) -> None:
+    def _update_milestones(self, remote_app: AsyncBaseApp, scheme: Scheme) -> list[Coroutine[Any, Any, None]]:
         new_milestone_revisions = [
             milestone_revision
             for milestone_revision in scheme.milestones.milestone_revisions
             if milestone_revision.id is None
         ]
-        if new_milestone_revisions:
-            milestones_model = CollectionModel[CapitalSchemeMilestoneModel](
-                items=[
-                    CapitalSchemeMilestoneModel.from_domain(milestone_revision)
-                    for milestone_revision in new_milestone_revisions
-                ]
-            )
-            await self._create_milestones(remote_app, scheme.reference, milestones_model)
+        if not new_milestone_revisions:
+            return []
+
+        milestones_model = CollectionModel[CapitalSchemeMilestoneModel](
+            items=[
+                CapitalSchemeMilestoneModel.from_domain(milestone_revision)
+                for milestone_revision in new_milestone_revisions
+            ]
+        )
+        return [self._create_milestones(remote_app, scheme.reference, milestones_model)]
 
     async def _create_milestones(
         self,
@@ -194,11 +252,14 @@ class ApiSchemeRepository(SchemeRepository):
         )
         response.raise_for_status()
 
-    async def _update_authority_reviews(self, remote_app: AsyncBaseApp, scheme: Scheme) -> None:
-        for authority_review in scheme.reviews.authority_reviews:
-            if authority_review.id is None:
-                authority_review_model = CreateCapitalSchemeAuthorityReviewModel.from_domain(authority_review)
-                await self._create_authority_review(remote_app, scheme.reference, authority_review_model)
+    def _update_authority_reviews(self, remote_app: AsyncBaseApp, scheme: Scheme) -> list[Coroutine[Any, Any, None]]:
+        return [
+            self._create_authority_review(
+                remote_app, scheme.reference, CreateCapitalSchemeAuthorityReviewModel.from_domain(authority_review)
+            )
+            for authority_review in scheme.reviews.authority_reviews
+            if authority_review.id is None
+        ]
 
     async def _create_authority_review(
         self,
@@ -215,6 +276,12 @@ class ApiSchemeRepository(SchemeRepository):
         response.raise_for_status()
 
     # See: https://github.com/authlib/authlib/issues/818#issuecomment-3257950062
+    async def _get(self, remote_app: AsyncBaseApp, url: str, **kwargs: Any) -> Response:
+        requested_at = time.perf_counter()
+        response = await remote_app.get(url, request=self._dummy_request(), **kwargs)
+        logger.debug("Fetched '%s' in %.1f ms", url, (time.perf_counter() - requested_at) * 1000)
+        return response
+
     @staticmethod
     def _dummy_request() -> Any:
         return object()
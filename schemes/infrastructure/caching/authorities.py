@@ -0,0 +1,56 @@
+from flask import has_app_context
+
+from schemes.domain.authorities import Authority, AuthorityRepository
+from schemes.infrastructure.caching.caches import RequestCache, TtlCache
+
+
+class CachingAuthorityRepository(AuthorityRepository):
+    def __init__(self, delegate: AuthorityRepository, cache: TtlCache[str, Authority]):
+        self._delegate = delegate
+        self._cache = cache
+
+    async def add(self, *authorities: Authority) -> None:
+        await self._delegate.add(*authorities)
+        for authority in authorities:
+            self._cache.delete(authority.abbreviation)
+
+    async def clear(self) -> None:
+        await self._delegate.clear()
+        self._cache.clear()
+
+    async def get(self, abbreviation: str) -> Authority | None:
+        authority = self._cache.get(abbreviation)
+
+        if authority is None:
+            authority = await self._delegate.get(abbreviation)
+            if authority:
+                self._cache.set(abbreviation, authority)
+
+        return authority
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+
+class RequestScopedAuthorityRepository(AuthorityRepository):
+    def __init__(self, delegate: AuthorityRepository):
+        self._delegate = delegate
+        self._authorities = RequestCache[str, Authority | None]("authorities")
+
+    async def add(self, *authorities: Authority) -> None:
+        await self._delegate.add(*authorities)
+        for authority in authorities:
+            self._authorities.delete(authority.abbreviation)
+
+    async def clear(self) -> None:
+        await self._delegate.clear()
+        self._authorities.clear()
+
+    async def get(self, abbreviation: str) -> Authority | None:
+        if not has_app_context():
+            return await self._delegate.get(abbreviation)
+
+        if abbreviation not in self._authorities:
+            self._authorities.set(abbreviation, await self._delegate.get(abbreviation))
+
+        return self._authorities.get(abbreviation)
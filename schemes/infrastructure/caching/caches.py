@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import time
+from asyncio import Task
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from threading import Lock
+
+from flask import g, has_app_context
+
+logger = logging.getLogger(__name__)
+
+
+class TtlCache[K: Hashable, V]:
+    def __init__(self, ttl: int, max_size: int, timer: Callable[[], float] = time.monotonic):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._timer = timer
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if self._timer() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._timer() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class StaleWhileRevalidateCache[K: Hashable, V]:
+    def __init__(self, ttl: int, stale_ttl: int, max_size: int, timer: Callable[[], float] = time.monotonic):
+        self._ttl = ttl
+        self._timer = timer
+        self._entries = TtlCache[K, tuple[float, V]](ttl + stale_ttl, max_size, timer)
+        # Loads in progress for each key, whose values are discarded if the key is deleted meanwhile
+        self._loads: dict[K, set[object]] = {}
+        self._loads_lock = Lock()
+        self._revalidations: dict[K, Task[None]] = {}
+
+    async def get(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return await self._load(key, load)
+
+        fresh_until, value = entry
+        if self._timer() >= fresh_until and not self._is_revalidating(key):
+            self._revalidations[key] = asyncio.create_task(self._revalidate(key, load))
+        return value
+
+    def delete(self, key: K) -> None:
+        with self._loads_lock:
+            self._loads.pop(key, None)
+            self._entries.delete(key)
+
+    def clear(self) -> None:
+        with self._loads_lock:
+            self._loads.clear()
+            self._entries.clear()
+
+    async def _load(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        token = object()
+        with self._loads_lock:
+            self._loads.setdefault(key, set()).add(token)
+
+        try:
+            value = await load()
+        except BaseException:
+            with self._loads_lock:
+                self._end_load(key, token)
+            raise
+
+        with self._loads_lock:
+            if self._end_load(key, token):
+                self._entries.set(key, (self._timer() + self._ttl, value))
+
+        return value
+
+    def _end_load(self, key: K, token: object) -> bool:
+        loads = self._loads.get(key)
+        if loads is None or token not in loads:
+            return False
+
+        loads.remove(token)
+        if not loads:
+            del self._loads[key]
+        return True
+
+    def _is_revalidating(self, key: K) -> bool:
+        revalidation = self._revalidations.get(key)
+        return revalidation is not None and not revalidation.done() and not revalidation.get_loop().is_closed()
+
+    async def _revalidate(self, key: K, load: Callable[[], Awaitable[V]]) -> None:
+        revalidation_started_at = time.perf_counter()
+        try:
+            await self._load(key, load)
+        except Exception as error:
+            logger.warning("Cannot revalidate cache entry '%s': %s", key, error)
+        else:
+            logger.debug(
+                "Revalidated cache entry '%s' in %.1f ms",
+                key,
+                (time.perf_counter() - revalidation_started_at) * 1000,
+            )
+        finally:
+            self._revalidations.pop(key, None)
+
+
+class RequestCache[K: Hashable, V]:
+    def __init__(self, name: str):
+        self._name = name
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries()
+
+    def get(self, key: K) -> V | None:
+        return self._entries().get(key)
+
+    def set(self, key: K, value: V) -> None:
+        self._entries()[key] = value
+
+    def delete(self, key: K) -> None:
+        self._entries().pop(key, None)
+
+    def clear(self) -> None:
+        self._entries().clear()
+
+    def _entries(self) -> dict[K, V]:
+        if not has_app_context():
+            return {}
+
+        entries: dict[K, V] = g.setdefault(self._name, {})
+        return entries
@@ -0,0 +1,74 @@
+from flask import has_app_context
+
+from schemes.domain.schemes.schemes import Scheme, SchemeRepository, SchemeSummary
+from schemes.infrastructure.caching.caches import RequestCache, StaleWhileRevalidateCache
+
+
+class CachingSchemeRepository(SchemeRepository):
+    def __init__(self, delegate: SchemeRepository, cache: StaleWhileRevalidateCache[str, list[SchemeSummary]]):
+        self._delegate = delegate
+        self._cache = cache
+
+    async def add(self, *schemes: Scheme) -> None:
+        await self._delegate.add(*schemes)
+        for scheme in schemes:
+            self._invalidate_authority(scheme)
+
+    async def clear(self) -> None:
+        await self._delegate.clear()
+        self._cache.clear()
+
+    async def get(self, reference: str) -> Scheme | None:
+        return await self._delegate.get(reference)
+
+    async def get_summaries_by_authority(self, authority_abbreviation: str, fresh: bool = False) -> list[SchemeSummary]:
+        if fresh:
+            self._cache.delete(authority_abbreviation)
+        return await self._cache.get(
+            authority_abbreviation, lambda: self._delegate.get_summaries_by_authority(authority_abbreviation)
+        )
+
+    async def update(self, scheme: Scheme) -> None:
+        try:
+            await self._delegate.update(scheme)
+        finally:
+            self._invalidate_authority(scheme)
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+    def _invalidate_authority(self, scheme: Scheme) -> None:
+        authority_abbreviation = scheme.overview.authority_abbreviation
+        if authority_abbreviation:
+            self._cache.delete(authority_abbreviation)
+
+
+class RequestScopedSchemeRepository(SchemeRepository):
+    def __init__(self, delegate: SchemeRepository):
+        self._delegate = delegate
+        self._schemes = RequestCache[str, Scheme | None]("schemes")
+
+    async def add(self, *schemes: Scheme) -> None:
+        await self._delegate.add(*schemes)
+        for scheme in schemes:
+            self._schemes.delete(scheme.reference)
+
+    async def clear(self) -> None:
+        await self._delegate.clear()
+        self._schemes.clear()
+
+    async def get(self, reference: str) -> Scheme | None:
+        if not has_app_context():
+            return await self._delegate.get(reference)
+
+        if reference not in self._schemes:
+            self._schemes.set(reference, await self._delegate.get(reference))
+
+        return self._schemes.get(reference)
+
+    async def get_summaries_by_authority(self, authority_abbreviation: str, fresh: bool = False) -> list[SchemeSummary]:
+        return await self._delegate.get_summaries_by_authority(authority_abbreviation, fresh)
+
+    async def update(self, scheme: Scheme) -> None:
+        await self._delegate.update(scheme)
+        self._schemes.delete(scheme.reference)
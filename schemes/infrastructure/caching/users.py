@@ -0,0 +1,56 @@
+from flask import has_app_context
+
+from schemes.domain.users import User, UserRepository
+from schemes.infrastructure.caching.caches import RequestCache, TtlCache
+
+
+class CachingUserRepository(UserRepository):
+    def __init__(self, delegate: UserRepository, cache: TtlCache[str, User]):
+        self._delegate = delegate
+        self._cache = cache
+
+    def add(self, *users: User) -> None:
+        self._delegate.add(*users)
+        for user in users:
+            self._cache.delete(user.email)
+
+    def clear(self) -> None:
+        self._delegate.clear()
+        self._cache.clear()
+
+    def get(self, email: str) -> User | None:
+        user = self._cache.get(email)
+
+        if user is None:
+            user = self._delegate.get(email)
+            if user:
+                self._cache.set(email, user)
+
+        return user
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+
+class RequestScopedUserRepository(UserRepository):
+    def __init__(self, delegate: UserRepository):
+        self._delegate = delegate
+        self._users = RequestCache[str, User | None]("users")
+
+    def add(self, *users: User) -> None:
+        self._delegate.add(*users)
+        for user in users:
+            self._users.delete(user.email)
+
+    def clear(self) -> None:
+        self._delegate.clear()
+        self._users.clear()
+
+    def get(self, email: str) -> User | None:
+        if not has_app_context():
+            return self._delegate.get(email)
+
+        if email not in self._users:
+            self._users.set(email, self._delegate.get(email))
+
+        return self._users.get(email)
@@ -1,6 +1,12 @@
-from sqlalchemy import String
+from datetime import datetime
+
+from sqlalchemy import LargeBinary, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Revision of the latest migration script, so that startup can check the database revision without loading every
+# script. Update this when adding a migration.
+HEAD_REVISION = "7a3c5e9d1f24"
+
 
 class Base(DeclarativeBase):
     pass
@@ -12,3 +18,16 @@ class UserEntity(Base):
     user_id: Mapped[int] = mapped_column(primary_key=True)
     email: Mapped[str] = mapped_column(String(length=256), unique=True)
     authority_abbreviation: Mapped[str]
+
+
+class SessionEntity(Base):
+    """
+    Flask-Session session, whose table is created by Flask-Session rather than by migrations.
+    """
+
+    __tablename__ = "sessions"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    session_id: Mapped[str | None] = mapped_column(String(length=255), unique=True)
+    data: Mapped[bytes | None] = mapped_column(LargeBinary)
+    expiry: Mapped[datetime | None] = mapped_column(index=True)
@@ -0,0 +1,25 @@
+"""Add sessions expiry index
+
+Revision ID: 7a3c5e9d1f24
+Revises: c1d744bc16bd
+Create Date: 2026-10-17 10:12:41.206173
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "7a3c5e9d1f24"
+down_revision: str | None = "c1d744bc16bd"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # table is created by Flask-Session on startup
+    op.create_index("ix_sessions_expiry", "sessions", ["expiry"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_expiry", "sessions")
@@ -0,0 +1,63 @@
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from logging import Logger
+
+import inject
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from schemes.infrastructure.database import SessionEntity
+
+
+def _utc_now() -> datetime:
+    # Flask-Session stores expiry as naive UTC
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class SessionSweeper:
+    """
+    Deletes expired Flask-Session sessions in bounded batches, each in its own transaction, so that sweeping a large
+    backlog of sessions does not hold locks for long.
+    """
+
+    @inject.autoparams("session_maker", "logger")
+    def __init__(
+        self,
+        batch_size: int,
+        session_maker: sessionmaker[Session],
+        logger: Logger,
+        now: Callable[[], datetime] = _utc_now,
+        timer: Callable[[], float] = time.perf_counter,
+    ):
+        self._batch_size = batch_size
+        self._session_maker = session_maker
+        self._logger = logger
+        self._now = now
+        self._timer = timer
+
+    def sweep(self) -> int:
+        started_at = self._timer()
+        now = self._now()
+        count = 0
+
+        while True:
+            batch_count = self._sweep_batch(now)
+            count += batch_count
+            if batch_count < self._batch_size:
+                break
+
+        self._logger.info("Swept %d expired sessions in %.3f seconds", count, self._timer() - started_at)
+        return count
+
+    def _sweep_batch(self, now: datetime) -> int:
+        expired_ids = (
+            select(SessionEntity.id)
+            .where(SessionEntity.expiry <= now)
+            .order_by(SessionEntity.expiry)
+            .limit(self._batch_size)
+        )
+        with self._session_maker() as session:
+            result = session.connection().execute(delete(SessionEntity).where(SessionEntity.id.in_(expired_ids)))
+            session.commit()
+            return result.rowcount
@@ -1,5 +1,8 @@
+from itertools import batched
+
 import inject
-from sqlalchemy import delete, select
+from sqlalchemy import Insert, delete, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, sessionmaker
 
 from schemes.domain.users import User, UserRepository
@@ -7,15 +10,21 @@ from schemes.infrastructure.database import UserEntity
 
 
 class DatabaseUserRepository(UserRepository):
+    # keep each statement well within SQLite's limit on bound parameters
+    _BATCH_SIZE = 1000
+
     @inject.autoparams()
     def __init__(self, session_maker: sessionmaker[Session]):
         self._session_maker = session_maker
 
     def add(self, *users: User) -> None:
+        # PostgreSQL cannot upsert the same row twice in one statement, so the last user with each email wins
+        users_by_email = {user.email: user for user in users}
+
         with self._session_maker() as session:
-            session.add_all(
-                UserEntity(email=user.email, authority_abbreviation=user.authority_abbreviation) for user in users
-            )
+            for batch in batched(users_by_email.values(), self._BATCH_SIZE):
+                rows = [{"email": user.email, "authority_abbreviation": user.authority_abbreviation} for user in batch]
+                session.execute(self._upsert(session).values(rows))
             session.commit()
 
     def clear(self) -> None:
@@ -28,3 +37,12 @@ class DatabaseUserRepository(UserRepository):
             result = session.scalars(select(UserEntity).where(UserEntity.email == email))
             row = result.one_or_none()
             return User(email=row.email, authority_abbreviation=row.authority_abbreviation) if row else None
+
+    @staticmethod
+    def _upsert(session: Session) -> Insert:
+        insert = postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        statement = insert(UserEntity)
+        return statement.on_conflict_do_update(
+            index_elements=[UserEntity.email],
+            set_={"authority_abbreviation": statement.excluded.authority_abbreviation},
+        )
@@ -1,17 +1,106 @@
+import asyncio
+import logging
+import time
+from asyncio import AbstractEventLoop, Task
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from datetime import timedelta
+from threading import Lock
 from typing import Any
 
 from authlib.integrations.base_client import InvalidTokenError
 from authlib.integrations.base_client.async_app import AsyncOAuth2Mixin, _http_request
 from authlib.integrations.base_client.async_openid import AsyncOpenIDMixin
-from authlib.integrations.flask_client import OAuth
+from authlib.integrations.flask_client import FlaskOAuth2App, OAuth
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 from authlib.oauth2 import ClientAuth
 from authlib.oauth2.rfc6749 import OAuth2Token
 from authlib.oauth2.rfc7523 import PrivateKeyJWT, private_key_jwt_sign
 from flask import Flask, Request
-from httpx import AsyncClient, Response, Timeout
+from httpx import AsyncClient, HTTPError, Limits
+from httpx import Request as HttpxRequest
+from httpx import Response, Timeout
+from requests import RequestException
+from werkzeug.datastructures import ResponseCacheControl
+from werkzeug.http import parse_cache_control_header
+
+from schemes.event_loops import EventLoopFlask
+
+logger = logging.getLogger(__name__)
+
+
+class _ServerMetadataCache:
+    """
+    Caches authorization server metadata for the lifetime given by its HTTP cache headers.
+
+    The last known good metadata continues to be used if it cannot be refreshed.
+    """
+
+    server_metadata: dict[str, Any]
+    _server_metadata_url: str | None
+    default_server_metadata_max_age = timedelta(hours=1)
+    server_metadata_retry_interval = timedelta(minutes=1)
+
+    def _is_server_metadata_stale(self) -> bool:
+        expires_at: float = self.server_metadata.get("_expires_at", 0)
+        return self._server_metadata_url is not None and time.time() >= expires_at
+
+    def _update_server_metadata(self, metadata: dict[str, Any], cache_control_header: str | None) -> None:
+        cache_control = parse_cache_control_header(cache_control_header, cls=ResponseCacheControl)
+        max_age = (
+            timedelta(seconds=cache_control.max_age)
+            if cache_control.max_age is not None
+            else self.default_server_metadata_max_age
+        )
+        loaded_at = time.time()
+        # Refetch the key set published by the refreshed metadata
+        self.server_metadata.pop("jwks", None)
+        self.server_metadata.update(
+            metadata | {"_loaded_at": loaded_at, "_expires_at": loaded_at + max_age.total_seconds()}
+        )
+
+    def _retry_server_metadata_later(self, error: Exception) -> None:
+        if "_loaded_at" not in self.server_metadata:
+            raise error
+
+        logger.warning(
+            "Cannot refresh server metadata '%s', using last known good: %s", self._server_metadata_url, error
+        )
+        self.server_metadata["_expires_at"] = time.time() + self.server_metadata_retry_interval.total_seconds()
+
+
+class _ServerMetadataCacheOAuth2Mixin(_ServerMetadataCache):
+    client_cls: Any
+    client_kwargs: dict[str, Any]
+
+    def load_server_metadata(self) -> dict[str, Any]:
+        if self._is_server_metadata_stale():
+            try:
+                with self.client_cls(**self.client_kwargs) as session:
+                    response = session.request("GET", self._server_metadata_url, withhold_token=True)
+                    response.raise_for_status()
+                    self._update_server_metadata(response.json(), response.headers.get("Cache-Control"))
+            except (RequestException, ValueError) as error:
+                self._retry_server_metadata_later(error)
+
+        return self.server_metadata
+
+
+class _ServerMetadataCacheAsyncOAuth2Mixin(_ServerMetadataCache):
+    client_cls: Any
+    client_kwargs: dict[str, Any]
+
+    async def load_server_metadata(self) -> dict[str, Any]:
+        if self._is_server_metadata_stale():
+            try:
+                async with self.client_cls(**self.client_kwargs) as client:
+                    response = await client.request("GET", self._server_metadata_url, withhold_token=True)
+                    response.raise_for_status()
+                    self._update_server_metadata(response.json(), response.headers.get("Cache-Control"))
+            except (HTTPError, ValueError) as error:
+                self._retry_server_metadata_later(error)
+
+        return self.server_metadata
 
 
 class _AccessTokenParamsAsyncOAuth2Client(AsyncOAuth2Client):  # type: ignore
@@ -24,8 +113,11 @@ class _AccessTokenParamsAsyncOAuth2Client(AsyncOAuth2Client):  # type: ignore
     async def ensure_active_token(self, token: OAuth2Token = None) -> None:
         access_token_params = self.metadata.get("access_token_params") or {}
 
+        lock_requested_at = time.perf_counter()
+
         # Copy of AsyncOAuth2Client.ensure_active_token:
         async with self._token_refresh_lock:
+            logger.debug("Waited %.1f ms for access token lock", (time.perf_counter() - lock_requested_at) * 1000)
             if self.token.is_expired(leeway=self.leeway):
                 refresh_token = token.get("refresh_token")
                 url = self.metadata.get("token_endpoint")
@@ -75,16 +167,116 @@ class _AsyncBaseAppAdapter(AsyncBaseApp):
 
 # Workaround: https://github.com/authlib/authlib/issues/822
 class ClientAsyncOAuth2Mixin(AsyncOAuth2Mixin):  # type: ignore
+    """
+    An OAuth2 remote app that pools its HTTP client.
+
+    HTTP clients are bound to the event loop that created them, so a client is pooled for each event loop and
+    discarded once that loop has closed. Each client keeps its own pool of connections, so the client pool hits and
+    misses count reuse of clients, whereas the request and connection counts show reuse of connections. Every new
+    connection is logged with these counts.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._clients: dict[AbstractEventLoop, AsyncOAuth2Client] = {}
+        self._clients_lock = Lock()
+        self._client_pool_hits = 0
+        self._client_pool_misses = 0
+        self._request_count = 0
+        self._connection_count = 0
+
+    @property
+    def client_pool_hits(self) -> int:
+        return self._client_pool_hits
+
+    @property
+    def client_pool_misses(self) -> int:
+        return self._client_pool_misses
+
+    @property
+    def request_count(self) -> int:
+        return self._request_count
+
+    @property
+    def connection_count(self) -> int:
+        return self._connection_count
+
+    async def request(self, method: str, url: str, token: OAuth2Token | None = None, **kwargs: Any) -> Response:
+        async with self.client() as client:
+            return await client.request(method, url, token, **kwargs)
+
     @asynccontextmanager
     async def client(self) -> AsyncIterator[AsyncBaseApp]:
+        yield _AsyncBaseAppAdapter(self, await self._get_pooled_client())
+
+    async def _get_pooled_client(self) -> AsyncOAuth2Client:
         metadata = await self.load_server_metadata()
-        async with self._get_oauth_client(**metadata) as client:
-            yield _AsyncBaseAppAdapter(self, client)
+        loop = asyncio.get_running_loop()
+
+        with self._clients_lock:
+            for closed_loop in [client_loop for client_loop in self._clients if client_loop.is_closed()]:
+                del self._clients[closed_loop]
+
+            client = self._clients.get(loop)
+            if client:
+                client.metadata.update(metadata)
+                self._client_pool_hits += 1
+            else:
+                client = self._clients[loop] = self._get_oauth_client(**metadata)
+                client.event_hooks = client.event_hooks | {
+                    "request": [*client.event_hooks["request"], self._trace_request]
+                }
+                self._client_pool_misses += 1
+                logger.debug(
+                    "Created pooled HTTP client for '%s' (client pool hits: %d, misses: %d)",
+                    self.name,
+                    self._client_pool_hits,
+                    self._client_pool_misses,
+                )
+
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled client for the running event loop, which must be called before that loop stops.
+        """
+        with self._clients_lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+
+        if client:
+            await client.aclose()
+
+    async def _trace_request(self, request: HttpxRequest) -> None:
+        with self._clients_lock:
+            self._request_count += 1
+        # See: https://www.encode.io/httpcore/extensions/#trace
+        request.extensions["trace"] = self._trace_connection
+
+    async def _trace_connection(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name != "connection.connect_tcp.complete":
+            return
+
+        with self._clients_lock:
+            self._connection_count += 1
+            logger.info(
+                "Opened HTTP connection for '%s' (requests: %d, connections: %d, client pool hits: %d, misses: %d)",
+                self.name,
+                self._request_count,
+                self._connection_count,
+                self._client_pool_hits,
+                self._client_pool_misses,
+            )
+
+
+class _ServerMetadataCacheFlaskOAuth2App(_ServerMetadataCacheOAuth2Mixin, FlaskOAuth2App):  # type: ignore
+    pass
 
 
 # Workaround: https://github.com/authlib/authlib/issues/818
 # Workaround: https://github.com/authlib/authlib/issues/822
-class _ClientAccessTokenParamsAsyncFlaskOAuth2App(ClientAsyncOAuth2Mixin, AsyncOpenIDMixin, ClientAsyncBaseApp):  # type: ignore
+class _ClientAccessTokenParamsAsyncFlaskOAuth2App(
+    _ServerMetadataCacheAsyncOAuth2Mixin, ClientAsyncOAuth2Mixin, AsyncOpenIDMixin, ClientAsyncBaseApp  # type: ignore
+):
     # Workaround: https://github.com/authlib/authlib/issues/783
     client_cls = _AccessTokenParamsAsyncOAuth2Client
 
@@ -119,18 +311,24 @@ class _ExpiresInPrivateKeyJWT(PrivateKeyJWT):  # type: ignore
 
 
 class OAuthExtension(OAuth):  # type: ignore
+    ate_token_refresh_leeway_max_fraction = 0.5
+
     def __init__(self, app: Flask):
         super().__init__(app)
         self._ate_token: OAuth2Token | None = None
+        self._ate_token_refresh_leeway = app.config["ATE_TOKEN_REFRESH_LEEWAY"]
+        self._ate_token_refresh: Task[None] | None = None
 
         self.register(
             name="govuk",
+            client_cls=_ServerMetadataCacheFlaskOAuth2App,
             client_id=app.config["GOVUK_CLIENT_ID"],
             client_secret=app.config["GOVUK_CLIENT_SECRET"].encode(),
             server_metadata_url=app.config["GOVUK_SERVER_METADATA_URL"],
             client_kwargs={
                 "scope": "openid email",
                 "token_endpoint_auth_method": PrivateKeyJWT(),
+                "default_timeout": 10,
             },
         )
 
@@ -157,14 +355,44 @@ class OAuthExtension(OAuth):  # type: ignore
                 "access_token_params": access_token_params,
                 "http2": True,
                 "timeout": Timeout(10),
+                "limits": Limits(
+                    max_connections=app.config["ATE_MAX_CONNECTIONS"],
+                    keepalive_expiry=app.config["ATE_KEEPALIVE_EXPIRY"],
+                ),
             },
         )
 
+        if isinstance(app, EventLoopFlask):
+            app.event_loop.on_stop(self.ate.aclose)
+
     async def _fetch_ate_token(self, request: Request) -> OAuth2Token:
         if not self._ate_token:
             self._ate_token = await self.ate.fetch_access_token()
+        elif self._is_ate_token_expiring(self._ate_token) and not self._is_refreshing_ate_token():
+            self._ate_token_refresh = asyncio.create_task(self._refresh_ate_token())
         return self._ate_token
 
+    def _is_ate_token_expiring(self, token: OAuth2Token) -> bool:
+        # Cap the leeway for short-lived tokens, which would otherwise be refreshed on every request
+        leeway = self._ate_token_refresh_leeway
+        expires_in = token.get("expires_in")
+        if expires_in is not None:
+            leeway = min(leeway, int(expires_in * self.ate_token_refresh_leeway_max_fraction))
+        return bool(token.is_expired(leeway=leeway))
+
+    def _is_refreshing_ate_token(self) -> bool:
+        refresh = self._ate_token_refresh
+        return refresh is not None and not refresh.done() and not refresh.get_loop().is_closed()
+
+    async def _refresh_ate_token(self) -> None:
+        refresh_started_at = time.perf_counter()
+        try:
+            self._ate_token = await self.ate.fetch_access_token()
+        except Exception as error:
+            logger.warning("Cannot refresh ATE API access token: %s", error)
+        else:
+            logger.debug("Refreshed ATE API access token in %.1f ms", (time.perf_counter() - refresh_started_at) * 1000)
+
     async def _update_ate_token(
         self, token: OAuth2Token, refresh_token: str | None = None, access_token: str | None = None
     ) -> None:
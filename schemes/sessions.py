@@ -1,5 +1,15 @@
+import secrets
+import time
+from collections.abc import Callable
+from copy import deepcopy
+from typing import Any
+
 from flask import Flask, Request, Response
 from flask.sessions import SessionInterface, SessionMixin
+from flask_session.base import ServerSideSession
+from werkzeug.exceptions import HTTPException
+
+from schemes.infrastructure.caching.caches import TtlCache
 
 
 class DelegatingSessionInterface(SessionInterface):
@@ -9,13 +19,23 @@ class DelegatingSessionInterface(SessionInterface):
     def open_session(self, app: Flask, request: Request) -> SessionMixin | None:
         return self._delegate.open_session(app, request)
 
-    def save_session(self, app: Flask, session: SessionMixin, response: Response) -> None:
+    def save_session(self, app: Flask, session: ServerSideSession, response: Response) -> None:
         return self._delegate.save_session(app, session, response)
 
 
+def session_exempt[F: Callable[..., Any]](view: F) -> F:
+    """
+    Marks a view as not using the session, so that sessions are not opened for requests to it.
+    """
+    setattr(view, "session_exempt", True)
+    return view
+
+
 class RequestFilteringSessionInterface(DelegatingSessionInterface):
     """
-    Session interface decorator that avoids opening sessions for specific paths.
+    Session interface decorator that avoids opening sessions for specific paths and for views marked as session exempt.
+
+    Sessions are opened before requests are routed, so requests are matched to views here.
 
     See: https://github.com/pallets-eco/flask-session/issues/254
     """
@@ -25,7 +45,111 @@ class RequestFilteringSessionInterface(DelegatingSessionInterface):
         self._exclude_path_prefix = exclude_path_prefix
 
     def open_session(self, app: Flask, request: Request) -> SessionMixin | None:
-        if request.path.startswith(self._exclude_path_prefix):
+        if request.path.startswith(self._exclude_path_prefix) or self._is_session_exempt(app, request):
             return self.make_null_session(app)
 
         return super().open_session(app, request)
+
+    @staticmethod
+    def _is_session_exempt(app: Flask, request: Request) -> bool:
+        url_adapter = app.create_url_adapter(request)
+        if url_adapter is None:
+            return False
+
+        try:
+            rule, _ = url_adapter.match(return_rule=True)
+        except HTTPException:
+            return False
+
+        view = app.view_functions.get(rule.endpoint)
+        return getattr(view, "session_exempt", False)
+
+
+class CachingSessionInterface(DelegatingSessionInterface):
+    """
+    Server-side session interface decorator that caches sessions within the worker, and that only saves sessions that
+    have not been modified once their expiry needs refreshing.
+
+    Each save gives the session a new version, which is stored in the session and in a cookie alongside the session
+    cookie. A cached session is only served while its version matches the cookie, so a session saved by another worker
+    is read from the store again. The time that a session was last saved is likewise stored in the session itself so
+    that it is known by every worker.
+    """
+
+    REFRESHED_AT_KEY = "_refreshed_at"
+    VERSION_KEY = "_version"
+
+    def __init__(
+        self,
+        delegate: SessionInterface,
+        cache: TtlCache[str, dict[str, Any]],
+        refresh_threshold: int,
+        clock: Callable[[], float] = time.time,
+        new_version: Callable[[], str] = lambda: secrets.token_urlsafe(8),
+    ):
+        super().__init__(delegate)
+        self._cache = cache
+        self._refresh_threshold = refresh_threshold
+        self._clock = clock
+        self._new_version = new_version
+
+    def open_session(self, app: Flask, request: Request) -> ServerSideSession:
+        sid = request.cookies.get(app.config["SESSION_COOKIE_NAME"])
+        version = request.cookies.get(self._get_version_cookie_name(app))
+
+        if sid and version and (data := self._cache.get(sid)) is not None and data.get(self.VERSION_KEY) == version:
+            return ServerSideSession(deepcopy(data), sid=sid)
+
+        session: ServerSideSession = super().open_session(app, request)
+
+        if sid and session and session.sid == sid:
+            self._cache.set(sid, deepcopy(dict(session)))
+
+        return session
+
+    def save_session(self, app: Flask, session: ServerSideSession, response: Response) -> None:
+        if session and not session.modified and not self._needs_refresh(session):
+            if session.accessed:
+                response.vary.add("Cookie")
+            return
+
+        if session:
+            session[self.REFRESHED_AT_KEY] = int(self._clock())
+            session[self.VERSION_KEY] = self._new_version()
+
+        super().save_session(app, session, response)
+
+        if session:
+            self._cache.set(session.sid, deepcopy(dict(session)))
+            self._set_version_cookie(app, session, response)
+        else:
+            self._cache.delete(session.sid)
+            response.delete_cookie(
+                self._get_version_cookie_name(app),
+                domain=self.get_cookie_domain(app),
+                path=self.get_cookie_path(app),
+                secure=self.get_cookie_secure(app),
+                httponly=self.get_cookie_httponly(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+
+    def _needs_refresh(self, session: ServerSideSession) -> bool:
+        # avoid marking the session as accessed
+        refreshed_at = dict.get(session, self.REFRESHED_AT_KEY)
+        return refreshed_at is None or self._clock() - refreshed_at >= self._refresh_threshold
+
+    def _set_version_cookie(self, app: Flask, session: ServerSideSession, response: Response) -> None:
+        response.set_cookie(
+            self._get_version_cookie_name(app),
+            session[self.VERSION_KEY],
+            expires=self.get_expiration_time(app, session),
+            domain=self.get_cookie_domain(app),
+            path=self.get_cookie_path(app),
+            secure=self.get_cookie_secure(app),
+            httponly=self.get_cookie_httponly(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+    @staticmethod
+    def _get_version_cookie_name(app: Flask) -> str:
+        return f"{app.config['SESSION_COOKIE_NAME']}_version"
@@ -0,0 +1,49 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from threading import Lock
+
+
+class StartupTimer:
+    """
+    Times the phases of application startup and the time from startup to the first response.
+
+    The CPU time consumed by the process before startup is also recorded, which is mostly spent importing modules.
+    """
+
+    def __init__(
+        self, timer: Callable[[], float] = time.perf_counter, cpu_timer: Callable[[], float] = time.process_time
+    ):
+        self._timer = timer
+        self._started_at = timer()
+        self._cpu_time_before_startup = cpu_timer()
+        self._phases: dict[str, float] = {}
+        self._lock = Lock()
+        self._responded = False
+
+    @property
+    def cpu_time_before_startup(self) -> float:
+        return self._cpu_time_before_startup
+
+    @property
+    def phases(self) -> dict[str, float]:
+        return dict(self._phases)
+
+    @property
+    def elapsed(self) -> float:
+        return self._timer() - self._started_at
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = self._timer()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._timer() - started_at
+
+    def first_response(self) -> float | None:
+        with self._lock:
+            if self._responded:
+                return None
+            self._responded = True
+        return self.elapsed
@@ -0,0 +1,62 @@
+import os
+import sys
+
+from flask import Flask
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache, FileSystemLoader, PackageLoader, PrefixLoader
+
+from schemes.views.filters import date, pounds, remove_exponent
+
+
+class _RelocatableBytecodeCache(FileSystemBytecodeCache):
+    """
+    Bytecode cache keyed by template name alone, rather than also by file path, so that templates compiled when
+    building the image are reused wherever the package is imported from. Stale entries are still detected by their
+    source checksum.
+    """
+
+    def get_cache_key(self, name: str, filename: str | None = None) -> str:
+        return super().get_cache_key(name)
+
+
+def configure_jinja(app: Flask) -> None:
+    app.jinja_options["extensions"] = ["jinja2.ext.do"]
+
+    if cache_dir := app.config["TEMPLATE_CACHE_DIR"]:
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_options["bytecode_cache"] = _RelocatableBytecodeCache(cache_dir)
+
+    app.jinja_env.filters[date.__name__] = date
+    app.jinja_env.filters[pounds.__name__] = pounds
+    app.jinja_env.filters[remove_exponent.__name__] = remove_exponent
+
+    default_loader = FileSystemLoader(os.path.join(app.root_path, str(app.template_folder)))
+    package_loaders = PrefixLoader(
+        {
+            "govuk_frontend_jinja": PackageLoader("govuk_frontend_jinja"),
+            "govuk_frontend_wtf": PackageLoader("govuk_frontend_wtf"),
+        }
+    )
+    app.jinja_loader = ChoiceLoader([default_loader, package_loaders])
+
+
+def compile_templates(app: Flask) -> list[str]:
+    """
+    Compiles every template so that the bytecode cache is populated ahead of the first request.
+    """
+    template_names = app.jinja_env.list_templates()
+    for template_name in template_names:
+        app.jinja_env.get_template(template_name)
+    return template_names
+
+
+def main() -> None:
+    app = Flask("schemes", template_folder="views/templates")
+    app.config.from_object("schemes.config.Config")
+    app.config.from_prefixed_env()
+
+    if not app.config["TEMPLATE_CACHE_DIR"]:
+        sys.exit("FLASK_TEMPLATE_CACHE_DIR must be set to compile templates")
+
+    configure_jinja(app)
+    template_names = compile_templates(app)
+    print(f"Compiled {len(template_names)} templates into {app.config['TEMPLATE_CACHE_DIR']}")
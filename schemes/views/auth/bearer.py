@@ -1,6 +1,8 @@
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
 from functools import wraps
 from logging import Logger
+from typing import Any
 from urllib.parse import urlencode, urljoin
 
 import inject
@@ -35,7 +37,7 @@ def callback(users: UserRepository, logger: Logger) -> BaseResponse:
             logger.warning("User '%s' unauthorized sign in attempt", user.email)
             return redirect(url_for("auth.forbidden"))
 
-        session["user"] = user
+        session["user"] = _compact_user(user)
         session["id_token"] = token["id_token"]
 
         logger.info("User '%s' successfully signed in", user.email)
@@ -81,7 +83,8 @@ def bearer_auth[**P, T](func: Callable[P, T]) -> Callable[P, T | Response]:
 def async_bearer_auth[**P, T](func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T | Response]]:
     @wraps(func)
     async def decorated_function(*args: P.args, **kwargs: P.kwargs) -> T | Response:
-        response = _check_bearer()
+        # Redirecting to sign in may fetch the server metadata with a blocking request
+        response = await asyncio.to_thread(_check_bearer)
         return response if response else await func(*args, **kwargs)
 
     return decorated_function
@@ -105,6 +108,11 @@ def _get_oauth() -> OAuth:
     return current_app.extensions["authlib.integrations.flask_client"]
 
 
+def _compact_user(user: Mapping[str, Any]) -> dict[str, Any]:
+    # only store the claims that are used to keep the session small
+    return {"email": user["email"]}
+
+
 def _check_bearer() -> Response | None:
     if "user" not in session:
         oauth = _get_oauth()
@@ -112,4 +120,8 @@ def _check_bearer() -> Response | None:
         response: Response = oauth.govuk.authorize_redirect(callback_url)
         return response
 
+    # migrate sessions that store every user info claim
+    if session["user"].keys() != {"email"}:
+        session["user"] = _compact_user(session["user"])
+
     return None
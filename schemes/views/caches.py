@@ -0,0 +1,29 @@
+import inject
+from flask import Blueprint, Response
+
+from schemes.infrastructure.api.authorities import AuthorityModelCatalogue
+from schemes.infrastructure.api.funding_programmes import FundingProgrammeCatalogue
+from schemes.infrastructure.caching.authorities import CachingAuthorityRepository
+from schemes.infrastructure.caching.schemes import CachingSchemeRepository
+from schemes.infrastructure.caching.users import CachingUserRepository
+from schemes.views.auth.api_key import api_key_auth
+
+bp = Blueprint("caches", __name__)
+
+
+@bp.delete("")
+@api_key_auth
+@inject.autoparams()
+def clear(
+    authorities: CachingAuthorityRepository,
+    authority_models: AuthorityModelCatalogue,
+    funding_programmes: FundingProgrammeCatalogue,
+    schemes: CachingSchemeRepository,
+    users: CachingUserRepository,
+) -> Response:
+    authorities.invalidate()
+    authority_models.invalidate()
+    funding_programmes.invalidate()
+    schemes.invalidate()
+    users.invalidate()
+    return Response(status=204)
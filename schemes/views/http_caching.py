@@ -0,0 +1,33 @@
+from collections.abc import Callable
+from functools import wraps
+
+from flask import Response, make_response, request
+from flask.typing import ResponseReturnValue
+
+from schemes.sessions import session_exempt
+
+
+def public_cache[**P](max_age: int) -> Callable[[Callable[P, ResponseReturnValue]], Callable[P, Response]]:
+    """
+    Allows responses from a view to be cached publicly for `max_age` seconds and revalidated by their ETag.
+
+    Such views cannot depend on the user, so they are also marked as session exempt. Responses to requests with
+    credentials, such as when HTTP Basic Auth is enabled, are only cached privately.
+    """
+
+    def decorator(func: Callable[P, ResponseReturnValue]) -> Callable[P, Response]:
+        @wraps(func)
+        def decorated_function(*args: P.args, **kwargs: P.kwargs) -> Response:
+            response = make_response(func(*args, **kwargs))
+            if request.authorization:
+                response.cache_control.private = True
+            else:
+                response.cache_control.public = True
+            response.cache_control.max_age = max_age
+            response.add_etag()
+            response.make_conditional(request)
+            return response
+
+        return session_exempt(decorated_function)
+
+    return decorator
@@ -1,29 +1,38 @@
+from datetime import timedelta
+
 from flask import Blueprint, Response, render_template, send_from_directory
 
 from schemes.views.auth.basic import basic_auth
+from schemes.views.http_caching import public_cache
 
 bp = Blueprint("legal", __name__)
 
+_MAX_AGE = int(timedelta(hours=1).total_seconds())
+
 
 @bp.get("/privacy")
 @basic_auth
+@public_cache(_MAX_AGE)
 def privacy() -> str:
     return render_template("legal/privacy.html")
 
 
 @bp.get("/accessibility")
 @basic_auth
+@public_cache(_MAX_AGE)
 def accessibility() -> str:
     return render_template("legal/accessibility.html")
 
 
 @bp.get("/cookies")
 @basic_auth
+@public_cache(_MAX_AGE)
 def cookies() -> str:
     return render_template("legal/cookies.html")
 
 
 @bp.get("/.well-known/security.txt")
 @basic_auth
+@public_cache(_MAX_AGE)
 def security() -> Response:
     return send_from_directory(directory="views/templates/legal", path="security.txt")
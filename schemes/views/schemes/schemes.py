@@ -1,17 +1,32 @@
+import asyncio
+import math
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import ClassVar, Self
 
 import inject
-from flask import Blueprint, Response, abort, flash, redirect, render_template, session, url_for
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    after_this_request,
+    current_app,
+    flash,
+    get_flashed_messages,
+    redirect,
+    render_template,
+    request,
+    session,
+    url_for,
+)
 from werkzeug import Response as BaseResponse
 
 from schemes.dicts import as_shallow_dict
 from schemes.domain.authorities import Authority, AuthorityRepository
 from schemes.domain.reporting_window import ReportingWindow, ReportingWindowService
 from schemes.domain.schemes.overview import FundingProgramme, FundingProgrammes, SchemeType
-from schemes.domain.schemes.schemes import Scheme, SchemeRepository
+from schemes.domain.schemes.schemes import Scheme, SchemeRepository, SchemeSummary
 from schemes.domain.users import UserRepository
 from schemes.infrastructure.clock import Clock
 from schemes.views.auth.bearer import async_bearer_auth
@@ -28,9 +43,12 @@ from schemes.views.schemes.milestones import (
 )
 from schemes.views.schemes.outputs import SchemeOutputsContext
 from schemes.views.schemes.reviews import SchemeReviewContext, SchemeReviewForm
+from schemes.views.streaming import stream_template
 
 bp = Blueprint("schemes", __name__)
 
+_SCHEMES_UPDATED_COOKIE = "schemes_updated"
+
 
 @bp.get("")
 @async_bearer_auth
@@ -41,20 +59,33 @@ async def index(
     reporting_window_service: ReportingWindowService,
     authorities: AuthorityRepository,
     schemes: SchemeRepository,
-) -> str:
+) -> Response:
     user_info = session["user"]
-    user = users.get(user_info["email"])
+    user = await asyncio.to_thread(users.get, user_info["email"])
     assert user
     now = clock.now
     reporting_window = reporting_window_service.get_by_date(now)
     authority = await authorities.get(user.authority_abbreviation)
     assert authority
+    schemes_updated = _SCHEMES_UPDATED_COOKIE in request.cookies
+    if schemes_updated:
+        _unmark_schemes_updated()
     authority_schemes = [
-        scheme for scheme in await schemes.get_by_authority(authority.abbreviation) if scheme.is_updateable
+        scheme
+        for scheme in await schemes.get_summaries_by_authority(authority.abbreviation, fresh=schemes_updated)
+        if scheme.is_updateable
     ]
+    page = request.args.get("page", 1, type=int)
+    page_size = current_app.config["SCHEMES_PAGE_SIZE"]
+
+    context = SchemesContext.from_domain(now, reporting_window, authority, authority_schemes, page, page_size)
+    if not 1 <= page <= context.pagination.page_count:
+        abort(404)
 
-    context = SchemesContext.from_domain(now, reporting_window, authority, authority_schemes)
-    return render_template("schemes.html", **as_shallow_dict(context))
+    return Response(
+        stream_template("schemes.html", messages=get_flashed_messages(), **as_shallow_dict(context)),
+        mimetype="text/html",
+    )
 
 
 @dataclass(frozen=True)
@@ -91,19 +122,45 @@ class SchemeRowContext:
     last_reviewed: datetime | None
 
     @classmethod
-    def from_domain(cls, reporting_window: ReportingWindow, scheme: Scheme) -> Self:
-        funding_programme = scheme.overview.funding_programme
+    def from_domain(cls, reporting_window: ReportingWindow, scheme: SchemeSummary) -> Self:
+        funding_programme = scheme.funding_programme
         assert funding_programme
-        name = scheme.overview.name
+        name = scheme.name
         assert name is not None
 
         return cls(
             reference=scheme.reference,
             funding_programme=FundingProgrammeContext.from_domain(funding_programme),
             name=name,
-            needs_review=scheme.reviews.needs_review(reporting_window),
-            last_reviewed=scheme.reviews.last_reviewed,
+            needs_review=scheme.needs_review(reporting_window),
+            last_reviewed=scheme.last_reviewed,
+        )
+
+
+@dataclass(frozen=True)
+class PaginationContext:
+    page: int
+    page_count: int
+
+    @property
+    def pages(self) -> list[int | None]:
+        """
+        Page numbers to link to, being the first, last, current and adjacent pages, with None for each gap.
+        """
+        page_numbers = sorted(
+            {1, self.page - 1, self.page, self.page + 1, self.page_count} & set(range(1, self.page_count + 1))
         )
+        pages: list[int | None] = []
+        for index, page_number in enumerate(page_numbers):
+            if index > 0 and page_number - page_numbers[index - 1] > 1:
+                pages.append(None)
+            pages.append(page_number)
+        return pages
+
+    @classmethod
+    def from_count(cls, page: int, count: int, page_size: int | None) -> Self:
+        page_count = math.ceil(count / page_size) if page_size else 1
+        return cls(page=page, page_count=max(page_count, 1))
 
 
 @dataclass(frozen=True)
@@ -111,16 +168,25 @@ class SchemesContext:
     reporting_window_days_left: int | None
     authority_name: str
     schemes: list[SchemeRowContext]
+    pagination: PaginationContext
 
     @classmethod
     def from_domain(
-        cls, now: datetime, reporting_window: ReportingWindow, authority: Authority, schemes: list[Scheme]
+        cls,
+        now: datetime,
+        reporting_window: ReportingWindow,
+        authority: Authority,
+        schemes: list[SchemeSummary],
+        page: int = 1,
+        page_size: int | None = None,
     ) -> Self:
-        needs_review = any(scheme.reviews.needs_review(reporting_window) for scheme in schemes)
+        needs_review = any(scheme.needs_review(reporting_window) for scheme in schemes)
+        page_schemes = schemes[(page - 1) * page_size : page * page_size] if page_size else schemes
         return cls(
             reporting_window_days_left=reporting_window.days_left(now) if needs_review else None,
             authority_name=authority.name,
-            schemes=[SchemeRowContext.from_domain(reporting_window, scheme) for scheme in schemes],
+            schemes=[SchemeRowContext.from_domain(reporting_window, scheme) for scheme in page_schemes],
+            pagination=PaginationContext.from_count(page, len(schemes), page_size),
         )
 
 
@@ -136,7 +202,7 @@ async def get(
     schemes: SchemeRepository,
 ) -> Response:
     user_info = session["user"]
-    user = users.get(user_info["email"])
+    user = await asyncio.to_thread(users.get, user_info["email"])
     assert user
     now = clock.now
     reporting_window = reporting_window_service.get_by_date(now)
@@ -152,7 +218,7 @@ async def get(
 
     context = SchemeContext.from_domain(reporting_window, authority, scheme)
     context.review.form.validate_on_submit()
-    return Response(render_template("scheme/index.html", **as_shallow_dict(context)))
+    return Response(await asyncio.to_thread(render_template, "scheme/index.html", **as_shallow_dict(context)))
 
 
 @dataclass(frozen=True)
@@ -225,7 +291,7 @@ class SchemeContext:
 @inject.autoparams()
 async def spend_to_date_form(reference: str, users: UserRepository, schemes: SchemeRepository) -> str:
     user_info = session["user"]
-    user = users.get(user_info["email"])
+    user = await asyncio.to_thread(users.get, user_info["email"])
     assert user
     scheme = await schemes.get(reference)
 
@@ -237,7 +303,7 @@ async def spend_to_date_form(reference: str, users: UserRepository, schemes: Sch
 
     context = ChangeSpendToDateContext.from_domain(scheme)
     context.form.validate_on_submit()
-    return render_template("scheme/spend_to_date.html", **as_shallow_dict(context))
+    return await asyncio.to_thread(render_template, "scheme/spend_to_date.html", **as_shallow_dict(context))
 
 
 @bp.post("<reference>/spend-to-date")
@@ -247,7 +313,7 @@ async def spend_to_date(
     clock: Clock, users: UserRepository, schemes: SchemeRepository, reference: str
 ) -> str | BaseResponse:
     user_info = session["user"]
-    user = users.get(user_info["email"])
+    user = await asyncio.to_thread(users.get, user_info["email"])
     assert user
     scheme = await schemes.get(reference)
 
@@ -264,6 +330,7 @@ async def spend_to_date(
 
     form.update_domain(scheme.funding, clock.now)
     await schemes.update(scheme)
+    _mark_schemes_updated()
 
     return redirect(url_for("schemes.get", reference=reference))
 
@@ -273,7 +340,7 @@ async def spend_to_date(
 @inject.autoparams()
 async def milestones_form(reference: str, clock: Clock, users: UserRepository, schemes: SchemeRepository) -> str:
     user_info = session["user"]
-    user = users.get(user_info["email"])
+    user = await asyncio.to_thread(users.get, user_info["email"])
     assert user
     scheme = await schemes.get(reference)
 
@@ -285,7 +352,7 @@ async def milestones_form(reference: str, clock: Clock, users: UserRepository, s
 
     context = ChangeMilestoneDatesContext.from_domain(scheme, clock.now)
     context.form.validate_on_submit()
-    return render_template("scheme/milestones.html", **as_shallow_dict(context))
+    return await asyncio.to_thread(render_template, "scheme/milestones.html", **as_shallow_dict(context))
 
 
 @bp.post("<reference>/milestones")
@@ -295,7 +362,7 @@ async def milestones(
     clock: Clock, users: UserRepository, schemes: SchemeRepository, reference: str
 ) -> str | BaseResponse:
     user_info = session["user"]
-    user = users.get(user_info["email"])
+    user = await asyncio.to_thread(users.get, user_info["email"])
     assert user
     scheme = await schemes.get(reference)
 
@@ -313,6 +380,7 @@ async def milestones(
 
     form.update_domain(scheme, now)
     await schemes.update(scheme)
+    _mark_schemes_updated()
 
     return redirect(url_for("schemes.get", reference=reference))
 
@@ -322,7 +390,7 @@ async def milestones(
 @inject.autoparams()
 async def review(clock: Clock, users: UserRepository, schemes: SchemeRepository, reference: str) -> BaseResponse:
     user_info = session["user"]
-    user = users.get(user_info["email"])
+    user = await asyncio.to_thread(users.get, user_info["email"])
     assert user
     scheme = await schemes.get(reference)
 
@@ -339,6 +407,42 @@ async def review(clock: Clock, users: UserRepository, schemes: SchemeRepository,
 
     form.update_domain(scheme.reviews, clock.now)
     await schemes.update(scheme)
+    _mark_schemes_updated()
 
     flash(f"{scheme.overview.name} has been reviewed")
     return redirect(url_for("schemes.index"))
+
+
+def _mark_schemes_updated() -> None:
+    """
+    Marks that the user has updated a scheme so that their next list of schemes is read fresh, since updating a scheme
+    only invalidates the cache of the worker that handled it. The mark is a cookie rather than part of the session so
+    that setting and clearing it does not save the session.
+    """
+    max_age = current_app.config["SCHEMES_CACHE_TTL"] + current_app.config["SCHEMES_CACHE_STALE_TTL"]
+
+    @after_this_request
+    def set_cookie(response: BaseResponse) -> BaseResponse:
+        response.set_cookie(
+            _SCHEMES_UPDATED_COOKIE,
+            "1",
+            max_age=max_age,
+            path=url_for("schemes.index"),
+            secure=current_app.config["SESSION_COOKIE_SECURE"],
+            httponly=True,
+            samesite="Lax",
+        )
+        return response
+
+
+def _unmark_schemes_updated() -> None:
+    @after_this_request
+    def delete_cookie(response: BaseResponse) -> BaseResponse:
+        response.delete_cookie(
+            _SCHEMES_UPDATED_COOKIE,
+            path=url_for("schemes.index"),
+            secure=current_app.config["SESSION_COOKIE_SECURE"],
+            httponly=True,
+            samesite="Lax",
+        )
+        return response
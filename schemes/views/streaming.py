@@ -0,0 +1,48 @@
+from collections.abc import Generator, Iterator
+from contextvars import copy_context
+from typing import Any
+
+from flask import current_app
+from flask.globals import request_ctx
+
+
+def stream_template(template_name: str, buffer_size: int = 4096, **context: Any) -> Iterator[str]:
+    """
+    Renders a template incrementally, yielding its output in chunks of at least `buffer_size` characters.
+
+    Unlike `flask.stream_template`, the request context is copied rather than captured, and the stream is always
+    consumed within the same context variables, so that it can be consumed on a different thread to the one that
+    created it, as happens for async views. The session has already been saved by the time the stream is consumed, so
+    templates must not modify it; for example, flashed messages should be passed to the template rather than read by
+    it.
+    """
+    ctx = request_ctx.copy()
+    context_vars = copy_context()
+
+    def generate() -> Generator[str]:
+        with ctx:
+            template = current_app.jinja_env.get_template(template_name)
+            current_app.update_template_context(context)
+            buffer: list[str] = []
+            buffer_length = 0
+            for chunk in template.generate(context):
+                buffer.append(chunk)
+                buffer_length += len(chunk)
+                if buffer_length >= buffer_size:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffer_length = 0
+            if buffer:
+                yield "".join(buffer)
+
+    def run_in_context(chunks: Generator[str]) -> Iterator[str]:
+        try:
+            while True:
+                try:
+                    yield context_vars.run(next, chunks)
+                except StopIteration:
+                    return
+        finally:
+            context_vars.run(chunks.close)
+
+    return run_in_context(generate())
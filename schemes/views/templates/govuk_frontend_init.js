@@ -0,0 +1,2 @@
+import { initAll } from "{{ asset_url('govuk-frontend/govuk-frontend.min.js') }}";
+initAll();
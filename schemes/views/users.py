@@ -2,7 +2,7 @@ from logging import Logger
 
 import inject
 from flask import Blueprint, Response, abort, request
-from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 
 from schemes.domain.users import User, UserRepository
 from schemes.views.auth.api_key import api_key_auth
@@ -15,7 +15,12 @@ bp = Blueprint("users", __name__)
 @inject.autoparams()
 def add_users(users: UserRepository, logger: Logger) -> Response:
     try:
-        users_repr = [UserRepr.model_validate(item) for item in request.json]
+        if request.mimetype == "application/x-ndjson":
+            users_repr = [UserRepr.model_validate_json(line) for line in request.stream if line.strip()]
+        elif request.is_json:
+            users_repr = _users_repr_adapter.validate_json(request.get_data())
+        else:
+            abort(415)
     except ValidationError as error:
         logger.error(error)
         abort(400)
@@ -40,3 +45,6 @@ class UserRepr(BaseModel):
 
     def to_domain(self) -> User:
         return User(email=self.email, authority_abbreviation=self.authority_abbreviation)
+
+
+_users_repr_adapter = TypeAdapter(list[UserRepr])
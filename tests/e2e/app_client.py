@@ -27,3 +27,7 @@ class AppClient:
     def clear_users(self) -> None:
         response = self._session.delete(f"{self._url}/users", timeout=self.DEFAULT_TIMEOUT)
         response.raise_for_status()
+
+    def clear_caches(self) -> None:
+        response = self._session.delete(f"{self._url}/caches", timeout=self.DEFAULT_TIMEOUT)
+        response.raise_for_status()
@@ -168,6 +168,7 @@ def app_client_fixture(live_server: LiveServer, app_api_key: str) -> Generator[A
     client = AppClient(_get_url(live_server), app_api_key)
     yield client
     client.clear_users()
+    client.clear_caches()
 
 
 # endregion
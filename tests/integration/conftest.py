@@ -17,6 +17,10 @@ from schemes import bindings, create_app, destroy_app
 from schemes.domain.authorities import AuthorityRepository
 from schemes.domain.schemes.schemes import SchemeRepository
 from schemes.domain.users import UserRepository
+from schemes.infrastructure.caching.authorities import CachingAuthorityRepository
+from schemes.infrastructure.caching.caches import StaleWhileRevalidateCache, TtlCache
+from schemes.infrastructure.caching.schemes import CachingSchemeRepository
+from schemes.infrastructure.caching.users import CachingUserRepository
 from schemes.infrastructure.clock import Clock
 from tests.integration.fakes import MemoryAuthorityRepository, MemorySchemeRepository, MemoryUserRepository
 
@@ -116,9 +120,34 @@ def _test_bindings(app: Flask) -> Callable[[Binder], None]:
         binder.install(bindings(app))
         authority_repository = MemoryAuthorityRepository()
         binder.bind(AuthorityRepository, authority_repository)
-        binder.bind(UserRepository, MemoryUserRepository())
+        binder.bind(
+            CachingAuthorityRepository,
+            CachingAuthorityRepository(
+                authority_repository,
+                TtlCache(app.config["AUTHORITY_CACHE_TTL"], app.config["AUTHORITY_CACHE_MAX_SIZE"]),
+            ),
+        )
+        user_repository = MemoryUserRepository()
+        binder.bind(UserRepository, user_repository)
+        binder.bind(
+            CachingUserRepository,
+            CachingUserRepository(
+                user_repository, TtlCache(app.config["USER_CACHE_TTL"], app.config["USER_CACHE_MAX_SIZE"])
+            ),
+        )
         scheme_repository = MemorySchemeRepository()
         binder.bind(SchemeRepository, scheme_repository)
+        binder.bind(
+            CachingSchemeRepository,
+            CachingSchemeRepository(
+                scheme_repository,
+                StaleWhileRevalidateCache(
+                    app.config["SCHEMES_CACHE_TTL"],
+                    app.config["SCHEMES_CACHE_STALE_TTL"],
+                    app.config["SCHEMES_CACHE_MAX_SIZE"],
+                ),
+            ),
+        )
 
     return _bindings
 
@@ -1,7 +1,7 @@
 from copy import deepcopy
 
 from schemes.domain.authorities import Authority, AuthorityRepository
-from schemes.domain.schemes.schemes import Scheme, SchemeRepository
+from schemes.domain.schemes.schemes import Scheme, SchemeRepository, SchemeSummary
 from schemes.domain.users import User, UserRepository
 
 
@@ -25,7 +25,8 @@ class MemoryUserRepository(UserRepository):
         self._users: list[User] = []
 
     def add(self, *users: User) -> None:
-        self._users.extend(users)
+        users_by_email = {user.email: user for user in users}
+        self._users = [user for user in self._users if user.email not in users_by_email] + list(users_by_email.values())
 
     def clear(self) -> None:
         self._users.clear()
@@ -48,14 +49,14 @@ class MemorySchemeRepository(SchemeRepository):
     async def get(self, reference: str) -> Scheme | None:
         return deepcopy(self._schemes.get(reference))
 
-    async def get_by_authority(self, authority_abbreviation: str) -> list[Scheme]:
+    async def get_summaries_by_authority(self, authority_abbreviation: str, fresh: bool = False) -> list[SchemeSummary]:
         return sorted(
             [
-                deepcopy(scheme)
+                scheme.summary
                 for scheme in self._schemes.values()
                 if scheme.overview.authority_abbreviation == authority_abbreviation
             ],
-            key=lambda scheme: scheme.reference,
+            key=lambda summary: summary.reference,
         )
 
     async def update(self, scheme: Scheme) -> None:
@@ -67,8 +67,8 @@ class StubOidcServer:
     def given_token_endpoint_returns_error(self, error: str, error_description: str) -> None:
         responses.post(self.token_endpoint, json={"error": error, "error_description": error_description})
 
-    def given_userinfo_endpoint_returns_claims(self, email: str) -> None:
-        responses.get(self.userinfo_endpoint, json={"email": email})
+    def given_userinfo_endpoint_returns_claims(self, email: str, **claims: Any) -> None:
+        responses.get(self.userinfo_endpoint, json={"email": email} | claims)
 
     def given_userinfo_endpoint_returns_error(self, error: str, error_description: str) -> None:
         responses.get(self.userinfo_endpoint, status=401, json={"error": error, "error_description": error_description})
@@ -144,6 +144,8 @@ class SchemesPage(PageObject):
         self.is_visible = self.heading.text == "Your schemes" if self.heading else False
         table = self._soup.select_one("main table")
         self.schemes = SchemesTableComponent(table) if table else None
+        pagination = self._soup.select_one("main nav.govuk-pagination")
+        self.pagination = PaginationComponent(pagination) if pagination else None
         paragraph = self._soup.select_one("main h1 ~ p")
         self.is_no_schemes_message_visible = (
             paragraph.string == "There are no schemes for your authority to update." if paragraph else False
@@ -154,10 +156,15 @@ class SchemesPage(PageObject):
         return ServiceHeaderComponent(one(self._soup.select("header")))
 
     @classmethod
-    async def open(cls, client: AsyncFlaskClient) -> Self:
-        response = await client.get("/schemes")
+    async def open(cls, client: AsyncFlaskClient, page: int | None = None) -> Self:
+        response = await client.get("/schemes", query_string={"page": page} if page else None)
         return cls(response)
 
+    @classmethod
+    async def open_when_not_found(cls, client: AsyncFlaskClient, page: int) -> NotFoundPage:
+        response = await client.get("/schemes", query_string={"page": page})
+        return NotFoundPage(response)
+
 
 class HeadingComponent:
     def __init__(self, heading: Tag):
@@ -202,6 +209,17 @@ class SchemesTableComponent:
         return [scheme.to_dict() for scheme in self]
 
 
+class PaginationComponent:
+    def __init__(self, pagination: Tag):
+        previous_link = pagination.select_one(".govuk-pagination__prev a")
+        next_link = pagination.select_one(".govuk-pagination__next a")
+        self.previous_url = previous_link.get("href") if previous_link else None
+        self.next_url = next_link.get("href") if next_link else None
+        self.pages = [(item.get_text() or "").strip() for item in pagination.select(".govuk-pagination__item")]
+        current_item = pagination.select_one(".govuk-pagination__item--current")
+        self.current_page = (current_item.get_text() or "").strip() if current_item else None
+
+
 class TagComponent:
     def __init__(self, tag: Tag):
         self.text = (tag.string or "").strip()
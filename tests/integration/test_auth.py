@@ -1,4 +1,5 @@
 import logging
+import math
 from collections.abc import Generator, Mapping
 from datetime import datetime
 from typing import Any
@@ -40,7 +41,7 @@ class TestAuth:
 
     @pytest.fixture(autouse=True)
     def stub_server_metadata(self, oauth: OAuth) -> None:
-        oauth.govuk.server_metadata = {"_loaded_at": 1}
+        oauth.govuk.server_metadata = {"_loaded_at": 1, "_expires_at": math.inf}
 
     @pytest.fixture(name="oidc_server")
     def oidc_server_fixture(self, client_id: str, oauth: OAuth) -> StubOidcServer:
@@ -87,6 +88,22 @@ class TestAuth:
 
             assert session["user"] == UserInfo({"email": "boardman@example.com"}) and session["id_token"] == id_token
 
+    @responses.activate
+    def test_callback_stores_only_email(
+        self, oidc_server: StubOidcServer, users: UserRepository, client: FlaskClient
+    ) -> None:
+        users.add(User("boardman@example.com", authority_abbreviation="LIV"))
+        oidc_server.given_token_endpoint_returns_id_token(nonce="456")
+        oidc_server.given_userinfo_endpoint_returns_claims(
+            email="boardman@example.com", sub="urn:fdc:gov.uk:2022:abc", phone_number="+447700900000"
+        )
+        given_session_has_authentication_request(client, state="123", nonce="456")
+
+        with client:
+            client.get("/auth", query_string={"code": "x", "state": "123"})
+
+            assert session["user"] == {"email": "boardman@example.com"}
+
     @responses.activate
     def test_callback_logs_successful_sign_in(
         self, oidc_server: StubOidcServer, users: UserRepository, client: FlaskClient, caplog: LogCaptureFixture
@@ -0,0 +1,144 @@
+from collections.abc import Generator, Mapping
+from typing import Any
+
+import inject
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from pydantic import AnyUrl
+
+from schemes.domain.authorities import Authority, AuthorityRepository
+from schemes.domain.schemes.schemes import SchemeRepository
+from schemes.domain.users import User, UserRepository
+from schemes.infrastructure.api.authorities import AuthorityModel, AuthorityModelCatalogue
+from schemes.infrastructure.api.funding_programmes import FundingProgrammeCatalogue, FundingProgrammeModel
+from schemes.infrastructure.caching.authorities import CachingAuthorityRepository
+from schemes.infrastructure.caching.schemes import CachingSchemeRepository
+from schemes.infrastructure.caching.users import CachingUserRepository
+from tests.unit.domain.builders import build_scheme
+
+
+class TestCachesApi:
+    @pytest.fixture(name="config", scope="class")
+    @classmethod
+    def config_fixture(cls, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        return dict(config) | {"API_KEY": "boardman"}
+
+    @pytest.fixture(name="caching_authorities")
+    def caching_authorities_fixture(self, app: Flask) -> Generator[CachingAuthorityRepository]:
+        caching_authorities = inject.instance(CachingAuthorityRepository)
+        yield caching_authorities
+        caching_authorities.invalidate()
+
+    async def test_clear_caches(
+        self,
+        authorities: AuthorityRepository,
+        caching_authorities: CachingAuthorityRepository,
+        client: FlaskClient,
+    ) -> None:
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool"))
+        await caching_authorities.get("LIV")
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        response = client.delete("/caches", headers={"Authorization": "API-Key boardman"})
+
+        assert response.status_code == 204
+        authority = await caching_authorities.get("LIV")
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+    def test_clear_caches_invalidates_authority_models(self, app: Flask, client: FlaskClient) -> None:
+        authority_models = inject.instance(AuthorityModelCatalogue)
+        authority_models.add(
+            "https://api.example/authorities/LIV",
+            AuthorityModel(
+                id=AnyUrl("https://api.example/authorities/LIV"),
+                abbreviation="LIV",
+                full_name="Liverpool City Region Combined Authority",
+                bid_submitting_capital_schemes=AnyUrl(
+                    "https://api.example/authorities/LIV/capital-schemes/bid-submitting"
+                ),
+            ),
+        )
+
+        response = client.delete("/caches", headers={"Authorization": "API-Key boardman"})
+
+        assert response.status_code == 204
+        assert not authority_models.get_by_url("https://api.example/authorities/LIV")
+
+    def test_clear_caches_invalidates_funding_programmes(self, app: Flask, client: FlaskClient) -> None:
+        funding_programmes = inject.instance(FundingProgrammeCatalogue)
+        funding_programmes.add(
+            FundingProgrammeModel(id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4")
+        )
+
+        response = client.delete("/caches", headers={"Authorization": "API-Key boardman"})
+
+        assert response.status_code == 204
+        assert not funding_programmes.get_by_code("ATF4")
+
+    async def test_clear_caches_invalidates_schemes(
+        self, app: Flask, schemes: SchemeRepository, client: FlaskClient
+    ) -> None:
+        caching_schemes = inject.instance(CachingSchemeRepository)
+        await schemes.add(build_scheme(reference="ATE00001", name="Wirral", authority_abbreviation="LIV"))
+        await caching_schemes.get_summaries_by_authority("LIV")
+        await schemes.clear()
+        await schemes.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+
+        response = client.delete("/caches", headers={"Authorization": "API-Key boardman"})
+
+        assert response.status_code == 204
+        (scheme1,) = await caching_schemes.get_summaries_by_authority("LIV")
+        assert scheme1.name == "Wirral Package"
+
+    def test_clear_caches_invalidates_users(self, app: Flask, users: UserRepository, client: FlaskClient) -> None:
+        caching_users = inject.instance(CachingUserRepository)
+        users.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+        caching_users.get("boardman@example.com")
+        users.clear()
+        users.add(User(email="boardman@example.com", authority_abbreviation="WYO"))
+
+        response = client.delete("/caches", headers={"Authorization": "API-Key boardman"})
+
+        assert response.status_code == 204
+        user = caching_users.get("boardman@example.com")
+        assert user and user.authority_abbreviation == "WYO"
+
+    async def test_cannot_clear_caches_when_no_credentials(
+        self,
+        authorities: AuthorityRepository,
+        caching_authorities: CachingAuthorityRepository,
+        client: FlaskClient,
+    ) -> None:
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool"))
+        await caching_authorities.get("LIV")
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        response = client.delete("/caches")
+
+        assert response.status_code == 401
+        authority = await caching_authorities.get("LIV")
+        assert authority and authority.name == "Liverpool"
+
+    async def test_cannot_clear_caches_when_incorrect_credentials(
+        self,
+        authorities: AuthorityRepository,
+        caching_authorities: CachingAuthorityRepository,
+        client: FlaskClient,
+    ) -> None:
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool"))
+        await caching_authorities.get("LIV")
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        response = client.delete("/caches", headers={"Authorization": "API-Key obree"})
+
+        assert response.status_code == 401
+        authority = await caching_authorities.get("LIV")
+        assert authority and authority.name == "Liverpool"
+
+
+class TestCachesApiWhenDisabled:
+    def test_cannot_clear_caches(self, client: FlaskClient) -> None:
+        response = client.delete("/caches", headers={"Authorization": "API-Key boardman"})
+
+        assert response.status_code == 401
@@ -1,10 +1,20 @@
-from collections.abc import Generator
+import logging
+from collections.abc import Generator, Mapping
+from typing import Any
 
+import alembic.config
 import inject
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from flask import Flask
+from pytest import LogCaptureFixture
 from sqlalchemy import Engine
 
+from schemes import _check_database_revision
+from schemes.infrastructure.database import HEAD_REVISION
+
 
 @pytest.mark.usefixtures("client")
 class TestProdDatabase:
@@ -28,3 +38,54 @@ class TestProdDatabase:
         engine = inject.instance(Engine)
 
         assert engine.pool._recycle == 1800
+
+
+class TestDatabaseMigration:
+    def test_database_is_migrated(self, app: Flask) -> None:
+        assert _revision() == _head_revision()
+
+    def test_head_revision_is_latest_migration(self) -> None:
+        assert HEAD_REVISION == _head_revision()
+
+
+class TestDatabaseMigrationWhenDisabled:
+    @pytest.fixture(name="config", scope="class")
+    @classmethod
+    def config_fixture(cls, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        return dict(config) | {"MIGRATE_DATABASE": False}
+
+    def test_database_is_not_migrated(self, app: Flask) -> None:
+        assert _revision() is None
+
+    def test_database_revision_is_checked(self, app: Flask, caplog: LogCaptureFixture) -> None:
+        with caplog.at_level(logging.WARNING):
+            _check_database_revision()
+
+        assert caplog.messages == [
+            f"Database is at revision 'None' rather than '{HEAD_REVISION}', run 'flask db-upgrade' to migrate it"
+        ]
+
+    def test_db_upgrade_migrates_database(self, app: Flask) -> None:
+        result = app.test_cli_runner().invoke(args=["db-upgrade"])
+
+        assert result.exit_code == 0
+        assert _revision() == _head_revision()
+
+    def test_database_revision_is_checked_when_migrated(self, app: Flask, caplog: LogCaptureFixture) -> None:
+        app.test_cli_runner().invoke(args=["db-upgrade"])
+
+        with caplog.at_level(logging.WARNING):
+            _check_database_revision()
+
+        assert not caplog.messages
+
+
+def _revision() -> str | None:
+    with inject.instance(Engine).connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def _head_revision() -> str | None:
+    alembic_config = alembic.config.Config()
+    alembic_config.set_main_option("script_location", "schemes:infrastructure/database/migrations")
+    return ScriptDirectory.from_config(alembic_config).get_current_head()
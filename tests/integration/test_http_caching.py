@@ -1,3 +1,6 @@
+import pytest
+from flask import session
+from flask.sessions import NullSession
 from flask.testing import FlaskClient
 
 
@@ -7,6 +10,32 @@ class TestHttpCaching:
 
         assert response.headers.get("Cache-Control") == "no-store"
 
+    @pytest.mark.parametrize("path", ["/privacy", "/accessibility", "/cookies"])
+    def test_legal_pages_are_cached_publicly_for_one_hour(self, client: FlaskClient, path: str) -> None:
+        response = client.get(path)
+
+        assert response.headers.get("Cache-Control") == "public, max-age=3600" and response.headers.get("ETag")
+
+    def test_legal_pages_are_not_modified_when_etag_matches(self, client: FlaskClient) -> None:
+        etag = client.get("/privacy").headers["ETag"]
+
+        response = client.get("/privacy", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_legal_pages_do_not_open_session(self, client: FlaskClient) -> None:
+        client.set_cookie("session", "abc")
+
+        with client:
+            client.get("/privacy")
+
+            assert isinstance(session, NullSession)
+
+    def test_security_txt_is_cached_publicly_for_one_hour(self, client: FlaskClient) -> None:
+        response = client.get("/.well-known/security.txt")
+
+        assert response.headers.get("Cache-Control") == "public, max-age=3600"
+
     def test_static_resources_are_cached_publicly_for_one_hour(self, client: FlaskClient) -> None:
         response = client.get("/static/application.min.css")
 
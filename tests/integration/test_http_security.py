@@ -1,5 +1,13 @@
+import base64
+import hashlib
+
+from _pytest.monkeypatch import MonkeyPatch
+from bs4 import BeautifulSoup
+from flask import Flask
 from flask.testing import FlaskClient
 
+from schemes.assets import AssetManifest
+
 
 class TestHttpSecurity:
     def test_strict_transport_security(self, client: FlaskClient) -> None:
@@ -22,6 +30,26 @@ class TestHttpSecurity:
 
         assert response.headers.get("Content-Security-Policy") == (
             "script-src 'sha256-GUQ5ad8JK5KmEWmROf3LZd9ge94daqNvd8xy9YS1iDw=' "
-            "'sha256-qlEoMJwhtzSzuQBNcUtKL5nwWlPXO6xVXHxEUboRWW4=' 'self'; "
+            "'sha256-vFSryD78DwIWcRMmZFAOxmpARV3cRdQwBDZbyI5UuQY=' 'self'; "
             "default-src 'self';"
         )
+
+    def test_content_security_policy_allows_inline_scripts_with_fingerprinted_assets(
+        self, app: Flask, client: FlaskClient, monkeypatch: MonkeyPatch
+    ) -> None:
+        manifest = AssetManifest(
+            {"govuk-frontend/govuk-frontend.min.js": "govuk-frontend/govuk-frontend.1a2b3c4d.min.js"}
+        )
+        monkeypatch.setitem(app.extensions, "assets", manifest)
+
+        response = client.get("/privacy")
+
+        inline_scripts = BeautifulSoup(response.text, "html.parser").select("script:not([src])")
+        assert "govuk-frontend.1a2b3c4d.min.js" in response.text
+        assert inline_scripts and all(
+            _csp_hash(script.get_text()) in response.headers["Content-Security-Policy"] for script in inline_scripts
+        )
+
+
+def _csp_hash(script: str) -> str:
+    return f"'sha256-{base64.b64encode(hashlib.sha256(script.encode()).digest()).decode()}'"
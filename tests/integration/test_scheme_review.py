@@ -1,15 +1,24 @@
+from collections.abc import Callable, Generator, Mapping
 from datetime import datetime
+from typing import Any
 
+import inject
 import pytest
+from flask import Flask
 from flask.testing import FlaskClient
+from inject import Binder
 
+from schemes import create_app, destroy_app
 from schemes.domain.authorities import Authority, AuthorityRepository
 from schemes.domain.schemes.data_sources import DataSource
 from schemes.domain.schemes.reviews import AuthorityReview
 from schemes.domain.schemes.schemes import SchemeRepository, Status
 from schemes.domain.users import User, UserRepository
+from schemes.infrastructure.caching.caches import StaleWhileRevalidateCache
+from schemes.infrastructure.caching.schemes import CachingSchemeRepository, RequestScopedSchemeRepository
 from schemes.infrastructure.clock import Clock
-from tests.integration.conftest import AsyncFlaskClient
+from tests.integration.conftest import AsyncFlaskClient, _test_bindings
+from tests.integration.fakes import MemorySchemeRepository
 from tests.integration.pages import SchemePage, SchemesPage
 from tests.unit.domain.builders import build_scheme
 
@@ -99,6 +108,16 @@ class TestSchemeReview:
         )
         assert not schemes_page.important_notification
 
+    async def test_review_marks_schemes_updated(
+        self, schemes: SchemeRepository, client: FlaskClient, async_client: AsyncFlaskClient, csrf_token: str
+    ) -> None:
+        await schemes.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+
+        await async_client.post("/schemes/ATE00001", data={"csrf_token": csrf_token, "up_to_date": "confirmed"})
+
+        cookie = client.get_cookie("schemes_updated", path="/schemes")
+        assert cookie and cookie.http_only and cookie.max_age == 3660
+
     async def test_cannot_review_when_error(
         self, schemes: SchemeRepository, async_client: AsyncFlaskClient, csrf_token: str
     ) -> None:
@@ -209,3 +228,72 @@ class TestSchemeReview:
         )
 
         assert response.status_code == 404
+
+
+class TestSchemeReviewAcrossWorkers:
+    @pytest.fixture(name="app", scope="class")
+    @classmethod
+    def app_fixture(cls, config: Mapping[str, Any]) -> Generator[Flask]:
+        app = create_app(config)
+        inject.clear_and_configure(_caching_scheme_bindings(app), bind_in_runtime=False, allow_override=True)
+        yield app
+        destroy_app(app)
+
+    @pytest.fixture(name="scheme_store")
+    def scheme_store_fixture(self, app: Flask) -> MemorySchemeRepository:
+        return inject.instance(MemorySchemeRepository)
+
+    @pytest.fixture(name="auth", autouse=True)
+    async def auth_fixture(self, authorities: AuthorityRepository, users: UserRepository, client: FlaskClient) -> None:
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+        users.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+        with client.session_transaction() as session:
+            session["user"] = {"email": "boardman@example.com"}
+
+    async def test_schemes_after_review_on_another_worker_shows_scheme_reviewed(
+        self,
+        clock: Clock,
+        schemes: SchemeRepository,
+        scheme_store: MemorySchemeRepository,
+        client: FlaskClient,
+        async_client: AsyncFlaskClient,
+    ) -> None:
+        clock.now = datetime(2023, 4, 24, 12)
+        scheme = build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV")
+        scheme.reviews.update_authority_review(
+            AuthorityReview(id_=1, review_date=datetime(2020, 1, 2), source=DataSource.ATF4_BID)
+        )
+        await schemes.add(scheme)
+        await SchemesPage.open(async_client)
+        reviewed_scheme = await scheme_store.get("ATE00001")
+        assert reviewed_scheme
+        reviewed_scheme.reviews.update_authority_review(
+            AuthorityReview(id_=2, review_date=datetime(2023, 4, 24, 12), source=DataSource.AUTHORITY_UPDATE)
+        )
+        await scheme_store.update(reviewed_scheme)
+        client.set_cookie("schemes_updated", "1", path="/schemes")
+
+        schemes_page = await SchemesPage.open(async_client)
+
+        assert schemes_page.schemes
+        assert [row.needs_review for row in schemes_page.schemes] == [False]
+        assert not client.get_cookie("schemes_updated", path="/schemes")
+
+
+def _caching_scheme_bindings(app: Flask) -> Callable[[Binder], None]:
+    def _bindings(binder: Binder) -> None:
+        binder.install(_test_bindings(app))
+        scheme_store = MemorySchemeRepository()
+        caching_schemes = CachingSchemeRepository(
+            scheme_store,
+            StaleWhileRevalidateCache(
+                app.config["SCHEMES_CACHE_TTL"],
+                app.config["SCHEMES_CACHE_STALE_TTL"],
+                app.config["SCHEMES_CACHE_MAX_SIZE"],
+            ),
+        )
+        binder.bind(MemorySchemeRepository, scheme_store)
+        binder.bind(CachingSchemeRepository, caching_schemes)
+        binder.bind(SchemeRepository, RequestScopedSchemeRepository(caching_schemes))
+
+    return _bindings
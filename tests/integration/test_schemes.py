@@ -1,6 +1,10 @@
+import threading
+from collections.abc import Mapping
 from datetime import datetime
+from typing import Any
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from flask.testing import FlaskClient
 
 from schemes.domain.authorities import Authority, AuthorityRepository
@@ -28,6 +32,33 @@ class TestSchemes:
 
         assert schemes_page.title == "Your schemes - Update your capital schemes - Active Travel England - GOV.UK"
 
+    async def test_schemes_gets_user_off_event_loop(
+        self, users: UserRepository, async_client: AsyncFlaskClient, monkeypatch: MonkeyPatch
+    ) -> None:
+        thread_names: list[str] = []
+        get = users.get
+
+        def recording_get(email: str) -> User | None:
+            thread_names.append(threading.current_thread().name)
+            return get(email)
+
+        monkeypatch.setattr(users, "get", recording_get)
+
+        await SchemesPage.open(async_client)
+
+        assert thread_names and "event-loop" not in thread_names
+
+    async def test_schemes_compacts_session_with_every_user_claim(
+        self, client: FlaskClient, async_client: AsyncFlaskClient
+    ) -> None:
+        with client.session_transaction() as session:
+            session["user"] = {"email": "boardman@example.com", "sub": "urn:fdc:gov.uk:2022:abc"}
+
+        await SchemesPage.open(async_client)
+
+        with client.session_transaction() as session:
+            assert session["user"] == {"email": "boardman@example.com"}
+
     @pytest.mark.parametrize(
         "now, expected_notification_banner",
         [
@@ -97,6 +128,25 @@ class TestSchemes:
         assert [row.reference for row in schemes_page.schemes] == ["ATE00001", "ATE00002"]
         assert not schemes_page.is_no_schemes_message_visible
 
+    async def test_schemes_does_not_show_pagination_when_one_page(
+        self, schemes: SchemeRepository, async_client: AsyncFlaskClient
+    ) -> None:
+        await schemes.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+
+        schemes_page = await SchemesPage.open(async_client)
+
+        assert not schemes_page.pagination
+
+    @pytest.mark.parametrize("page", [0, 2])
+    async def test_cannot_show_page_of_schemes_when_page_does_not_exist(
+        self, schemes: SchemeRepository, async_client: AsyncFlaskClient, page: int
+    ) -> None:
+        await schemes.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+
+        not_found_page = await SchemesPage.open_when_not_found(async_client, page)
+
+        assert not_found_page.is_visible and not_found_page.is_not_found
+
     async def test_schemes_shows_minimal_scheme(
         self, schemes: SchemeRepository, async_client: AsyncFlaskClient
     ) -> None:
@@ -175,3 +225,54 @@ class TestSchemes:
 
         assert not schemes_page.schemes
         assert schemes_page.is_no_schemes_message_visible
+
+
+class TestSchemesPagination:
+    @pytest.fixture(name="config", scope="class")
+    @classmethod
+    def config_fixture(cls, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        return dict(config) | {"SCHEMES_PAGE_SIZE": 2}
+
+    @pytest.fixture(name="auth", autouse=True)
+    async def auth_fixture(self, authorities: AuthorityRepository, users: UserRepository, client: FlaskClient) -> None:
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+        users.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+        with client.session_transaction() as session:
+            session["user"] = {"email": "boardman@example.com"}
+
+    async def test_schemes_shows_first_page_of_schemes(
+        self, schemes: SchemeRepository, async_client: AsyncFlaskClient
+    ) -> None:
+        await schemes.add(
+            *[
+                build_scheme(reference=f"ATE0000{index}", name="Wirral Package", authority_abbreviation="LIV")
+                for index in range(1, 6)
+            ]
+        )
+
+        schemes_page = await SchemesPage.open(async_client)
+
+        assert schemes_page.schemes
+        assert [row.reference for row in schemes_page.schemes] == ["ATE00001", "ATE00002"]
+        assert schemes_page.pagination
+        assert schemes_page.pagination.pages == ["1", "2", "3"] and schemes_page.pagination.current_page == "1"
+        assert not schemes_page.pagination.previous_url
+        assert schemes_page.pagination.next_url == "/schemes?page=2"
+
+    async def test_schemes_shows_page_of_schemes(
+        self, schemes: SchemeRepository, async_client: AsyncFlaskClient
+    ) -> None:
+        await schemes.add(
+            *[
+                build_scheme(reference=f"ATE0000{index}", name="Wirral Package", authority_abbreviation="LIV")
+                for index in range(1, 6)
+            ]
+        )
+
+        schemes_page = await SchemesPage.open(async_client, page=2)
+
+        assert schemes_page.schemes
+        assert [row.reference for row in schemes_page.schemes] == ["ATE00003", "ATE00004"]
+        assert schemes_page.pagination and schemes_page.pagination.current_page == "2"
+        assert schemes_page.pagination.previous_url == "/schemes?page=1"
+        assert schemes_page.pagination.next_url == "/schemes?page=3"
@@ -0,0 +1,66 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+import inject
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import Engine, event, inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from schemes.infrastructure.database import SessionEntity
+
+
+class TestSessions:
+    def test_sessions_are_cleaned_up_by_requests(self, app: Flask) -> None:
+        assert app.config["SESSION_CLEANUP_N_REQUESTS"] == 100
+
+    def test_sessions_are_indexed_by_expiry(self, app: Flask) -> None:
+        indexes = inspect(inject.instance(Engine)).get_indexes("sessions")
+
+        assert ("ix_sessions_expiry", ["expiry"]) in [(index["name"], index["column_names"]) for index in indexes]
+
+    def test_unmodified_session_is_not_read_or_written(self, client: FlaskClient) -> None:
+        with client.session_transaction() as session:
+            session["user"] = {"email": "boardman@example.com"}
+        statements: list[str] = []
+
+        def record_statement(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = inject.instance(Engine)
+        event.listen(engine, "before_cursor_execute", record_statement)
+        try:
+            client.get("/")
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+
+        assert not [statement for statement in statements if "sessions" in statement]
+
+
+class TestSessionsWhenSweeping:
+    @pytest.fixture(name="config", scope="class")
+    @classmethod
+    def config_fixture(cls, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        return dict(config) | {"SESSION_SWEEP": True}
+
+    def test_sessions_are_not_cleaned_up_by_requests(self, app: Flask) -> None:
+        assert app.config["SESSION_CLEANUP_N_REQUESTS"] is None
+
+    def test_sessions_sweep_deletes_expired_sessions(self, app: Flask) -> None:
+        session_maker = inject.instance(sessionmaker[Session])
+        with session_maker() as session:
+            session.add_all(
+                [
+                    SessionEntity(session_id="1", data=b"", expiry=datetime(2020, 1, 1)),
+                    SessionEntity(session_id="2", data=b"", expiry=datetime(9999, 1, 1)),
+                ]
+            )
+            session.commit()
+
+        result = app.test_cli_runner().invoke(args=["sessions-sweep"])
+
+        assert result.exit_code == 0
+        with session_maker() as session:
+            assert list(session.scalars(select(SessionEntity.session_id))) == ["2"]
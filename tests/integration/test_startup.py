@@ -0,0 +1,14 @@
+import logging
+
+from _pytest.logging import LogCaptureFixture
+from flask.testing import FlaskClient
+
+
+class TestStartup:
+    def test_first_response_is_reported(self, client: FlaskClient, caplog: LogCaptureFixture) -> None:
+        with caplog.at_level(logging.INFO):
+            client.get("/")
+            client.get("/")
+
+        messages = [record.message for record in caplog.records if record.message.startswith("Served first response")]
+        assert len(messages) == 1
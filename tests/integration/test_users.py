@@ -29,6 +29,48 @@ class TestUsersApi:
         assert user1 and user1.email == "boardman@example.com" and user1.authority_abbreviation == "LIV"
         assert user2 and user2.email == "obree@example.com" and user2.authority_abbreviation == "WYO"
 
+    def test_add_users_with_duplicate_email(self, users: UserRepository, client: FlaskClient) -> None:
+        response = client.post(
+            "/users",
+            headers={"Authorization": "API-Key boardman"},
+            json=[
+                {"email": "boardman@example.com", "authority_abbreviation": "LIV"},
+                {"email": "boardman@example.com", "authority_abbreviation": "WYO"},
+            ],
+        )
+
+        assert response.status_code == 201
+        user = users.get("boardman@example.com")
+        assert user and user.authority_abbreviation == "WYO"
+
+    def test_add_users_updates_existing_user(self, users: UserRepository, client: FlaskClient) -> None:
+        users.add(User("boardman@example.com", authority_abbreviation="LIV"))
+
+        response = client.post(
+            "/users",
+            headers={"Authorization": "API-Key boardman"},
+            json=[{"email": "boardman@example.com", "authority_abbreviation": "WYO"}],
+        )
+
+        assert response.status_code == 201
+        user = users.get("boardman@example.com")
+        assert user and user.authority_abbreviation == "WYO"
+
+    def test_add_users_as_ndjson(self, users: UserRepository, client: FlaskClient) -> None:
+        response = client.post(
+            "/users",
+            headers={"Authorization": "API-Key boardman"},
+            content_type="application/x-ndjson",
+            data='{"email": "boardman@example.com", "authority_abbreviation": "LIV"}\n'
+            '{"email": "obree@example.com", "authority_abbreviation": "WYO"}\n',
+        )
+
+        assert response.status_code == 201
+        user1 = users.get("boardman@example.com")
+        user2 = users.get("obree@example.com")
+        assert user1 and user1.email == "boardman@example.com" and user1.authority_abbreviation == "LIV"
+        assert user2 and user2.email == "obree@example.com" and user2.authority_abbreviation == "WYO"
+
     def test_cannot_add_users_when_no_credentials(self, users: UserRepository, client: FlaskClient) -> None:
         response = client.post("/users", json=[{"email": "boardman@example.com", "authority_abbreviation": "LIV"}])
 
@@ -55,6 +97,29 @@ class TestUsersApi:
         assert response.status_code == 400
         assert not users.get("boardman@example.com")
 
+    def test_cannot_add_users_with_invalid_ndjson_repr(self, users: UserRepository, client: FlaskClient) -> None:
+        response = client.post(
+            "/users",
+            headers={"Authorization": "API-Key boardman"},
+            content_type="application/x-ndjson",
+            data='{"email": "boardman@example.com", "authority_abbreviation": "LIV"}\n'
+            '{"email": "obree@example.com", "authority_abbreviation": "WYO", "foo": "bar"}\n',
+        )
+
+        assert response.status_code == 400
+        assert not users.get("boardman@example.com") and not users.get("obree@example.com")
+
+    def test_cannot_add_users_with_unsupported_media_type(self, users: UserRepository, client: FlaskClient) -> None:
+        response = client.post(
+            "/users",
+            headers={"Authorization": "API-Key boardman"},
+            content_type="text/plain",
+            data="boardman@example.com,LIV",
+        )
+
+        assert response.status_code == 415
+        assert not users.get("boardman@example.com")
+
     def test_clear_users(self, users: UserRepository, client: FlaskClient) -> None:
         users.add(User("boardman@example.com", authority_abbreviation="LIV"))
 
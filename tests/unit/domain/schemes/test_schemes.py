@@ -1,11 +1,16 @@
+from datetime import datetime
+
 import pytest
 
+from schemes.domain.dates import DateRange
+from schemes.domain.reporting_window import ReportingWindow
+from schemes.domain.schemes.data_sources import DataSource
 from schemes.domain.schemes.funding import SchemeFunding
 from schemes.domain.schemes.milestones import Milestone, SchemeMilestones
 from schemes.domain.schemes.outputs import SchemeOutputs
 from schemes.domain.schemes.overview import FundingProgramme, FundingProgrammes, SchemeOverview, SchemeType
-from schemes.domain.schemes.reviews import SchemeReviews
-from schemes.domain.schemes.schemes import Scheme, Status
+from schemes.domain.schemes.reviews import AuthorityReview, SchemeReviews
+from schemes.domain.schemes.schemes import Scheme, SchemeSummary, Status
 from tests.unit.domain.builders import build_scheme
 
 
@@ -104,6 +109,64 @@ class TestScheme:
             Milestone.CONSTRUCTION_COMPLETED,
         }
 
+    def test_get_summary(self) -> None:
+        scheme = build_scheme(
+            reference="ATE00001", name="Wirral Package", funding_programme=FundingProgrammes.ATF4, status=Status.ACTIVE
+        )
+        scheme.reviews.update_authority_reviews(
+            AuthorityReview(id_=1, review_date=datetime(2020, 1, 2), source=DataSource.ATF4_BID),
+            AuthorityReview(id_=2, review_date=datetime(2020, 1, 3), source=DataSource.ATF4_BID),
+        )
+
+        assert scheme.summary == SchemeSummary(
+            reference="ATE00001",
+            status=Status.ACTIVE,
+            name="Wirral Package",
+            funding_programme=FundingProgrammes.ATF4,
+            last_reviewed=datetime(2020, 1, 3),
+        )
+
+    def test_get_summary_when_no_overview_revision(self) -> None:
+        scheme = build_scheme(reference="ATE00001", status=Status.ACTIVE, overview_revisions=[])
+
+        assert scheme.summary.name is None and scheme.summary.funding_programme is None
+
+
+class TestSchemeSummary:
+    @pytest.mark.parametrize(
+        "status, funding_programme, expected_updateable",
+        [
+            (Status.ACTIVE, FundingProgrammes.ATF4, True),
+            (Status.PAUSED, FundingProgrammes.ATF4, False),
+            (Status.ACTIVE, FundingProgramme("ATF100", False), False),
+            (Status.ACTIVE, None, True),
+        ],
+    )
+    def test_is_updateable(
+        self, status: Status, funding_programme: FundingProgramme | None, expected_updateable: bool
+    ) -> None:
+        summary = SchemeSummary(
+            reference="ATE00001", status=status, name=None, funding_programme=funding_programme, last_reviewed=None
+        )
+
+        assert summary.is_updateable == expected_updateable
+
+    @pytest.mark.parametrize(
+        "last_reviewed, expected_needs_review",
+        [
+            (datetime(2023, 1, 2), True),
+            (datetime(2023, 4, 2), False),
+            (None, True),
+        ],
+    )
+    def test_needs_review(self, last_reviewed: datetime | None, expected_needs_review: bool) -> None:
+        reporting_window = ReportingWindow(DateRange(datetime(2023, 4, 1), datetime(2023, 5, 1)))
+        summary = SchemeSummary(
+            reference="ATE00001", status=Status.ACTIVE, name=None, funding_programme=None, last_reviewed=last_reviewed
+        )
+
+        assert summary.needs_review(reporting_window) == expected_needs_review
+
 
 class TestFundingProgrammes:
     @pytest.mark.parametrize(
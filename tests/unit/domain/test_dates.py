@@ -27,3 +27,23 @@ class TestDateRange:
             ValueError, match="From date '2020-01-01 12:00:00' must not be after to date '2019-12-31 13:00:00'"
         ):
             DateRange(datetime(2020, 1, 1, 12), datetime(2019, 12, 31, 13))
+
+    def test_equal(self) -> None:
+        date_range = DateRange(datetime(2020, 1, 1), datetime(2020, 2, 1))
+
+        assert date_range == DateRange(datetime(2020, 1, 1), datetime(2020, 2, 1))
+
+    def test_not_equal(self) -> None:
+        date_range = DateRange(datetime(2020, 1, 1), datetime(2020, 2, 1))
+
+        assert date_range != DateRange(datetime(2020, 1, 1), None)
+
+    def test_hash(self) -> None:
+        date_range = DateRange(datetime(2020, 1, 1), datetime(2020, 2, 1))
+
+        assert hash(date_range) == hash(DateRange(datetime(2020, 1, 1), datetime(2020, 2, 1)))
+
+    def test_repr(self) -> None:
+        date_range = DateRange(datetime(2020, 1, 1), None)
+
+        assert repr(date_range) == "DateRange(date_from=datetime.datetime(2020, 1, 1, 0, 0), date_to=None)"
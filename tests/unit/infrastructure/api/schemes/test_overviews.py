@@ -37,7 +37,9 @@ class TestCapitalSchemeOverviewModel:
             type=CapitalSchemeTypeModel.CONSTRUCTION,
         )
 
-        overview_revision = overview_model.to_domain([authority_model], [funding_programme_item_model])
+        overview_revision = overview_model.to_domain(
+            [authority_model], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         assert (
             overview_revision.name == "Wirral Package"
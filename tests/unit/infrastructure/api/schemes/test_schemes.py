@@ -1,7 +1,13 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from typing import Any
 
 import pytest
+from _pytest.logging import LogCaptureFixture
+from httpx import HTTPStatusError, Request, Response
 from pydantic import AnyUrl
 from respx import MockRouter
 
@@ -14,11 +20,11 @@ from schemes.domain.schemes.outputs import OutputTypeMeasure
 from schemes.domain.schemes.overview import FundingProgrammes, SchemeType
 from schemes.domain.schemes.reviews import AuthorityReview
 from schemes.domain.schemes.schemes import Status
-from schemes.infrastructure.api.authorities import AuthorityModel
+from schemes.infrastructure.api.authorities import AuthorityModel, AuthorityModelCatalogue
 from schemes.infrastructure.api.collections import CollectionModel
 from schemes.infrastructure.api.data_sources import DataSourceModel
 from schemes.infrastructure.api.financial_types import FinancialTypeModel
-from schemes.infrastructure.api.funding_programmes import FundingProgrammeItemModel
+from schemes.infrastructure.api.funding_programmes import FundingProgrammeCatalogue, FundingProgrammeItemModel
 from schemes.infrastructure.api.observation_types import ObservationTypeModel
 from schemes.infrastructure.api.schemes.authority_reviews import CapitalSchemeAuthorityReviewModel
 from schemes.infrastructure.api.schemes.financials import CapitalSchemeFinancialModel
@@ -60,8 +66,11 @@ class TestCapitalSchemeModel:
             milestones=CollectionModel[CapitalSchemeMilestoneModel](items=[]),
             outputs=CollectionModel[CapitalSchemeOutputModel](items=[]),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        scheme = capital_scheme_model.to_domain(
+            [build_authority_model()], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         assert scheme.reference == "ATE00001"
         assert not scheme.funding.financial_revisions
@@ -93,7 +102,9 @@ class TestCapitalSchemeModel:
             outputs=CollectionModel[CapitalSchemeOutputModel](items=[]),
         )
 
-        scheme = capital_scheme_model.to_domain([authority_model], [funding_programme_item_model])
+        scheme = capital_scheme_model.to_domain(
+            [authority_model], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         (overview_revision1,) = scheme.overview.overview_revisions
         assert (
@@ -112,8 +123,11 @@ class TestCapitalSchemeModel:
             milestones=CollectionModel[CapitalSchemeMilestoneModel](items=[]),
             outputs=CollectionModel[CapitalSchemeOutputModel](items=[]),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        scheme = capital_scheme_model.to_domain(
+            [build_authority_model()], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         assert scheme.status == Status.ACTIVE
 
@@ -135,8 +149,11 @@ class TestCapitalSchemeModel:
             milestones=CollectionModel[CapitalSchemeMilestoneModel](items=[]),
             outputs=CollectionModel[CapitalSchemeOutputModel](items=[]),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        scheme = capital_scheme_model.to_domain(
+            [build_authority_model()], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         financial_revision1, financial_revision2 = scheme.funding.financial_revisions
         assert (
@@ -176,8 +193,11 @@ class TestCapitalSchemeModel:
             ),
             outputs=CollectionModel[CapitalSchemeOutputModel](items=[]),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        scheme = capital_scheme_model.to_domain(
+            [build_authority_model()], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         milestone_revision1, milestone_revision2 = scheme.milestones.milestone_revisions
         assert (
@@ -219,8 +239,11 @@ class TestCapitalSchemeModel:
                 ]
             ),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        scheme = capital_scheme_model.to_domain(
+            [build_authority_model()], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         output_revision1, output_revision2 = scheme.outputs.output_revisions
         assert (
@@ -246,8 +269,11 @@ class TestCapitalSchemeModel:
                 review_date=datetime(2020, 1, 2, tzinfo=UTC), source=DataSourceModel.AUTHORITY_UPDATE
             ),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        scheme = capital_scheme_model.to_domain(
+            [build_authority_model()], {funding_programme_item_model.id: funding_programme_item_model}
+        )
 
         (authority_review1,) = scheme.reviews.authority_reviews
         assert (
@@ -258,22 +284,17 @@ class TestCapitalSchemeModel:
 
 
 class TestCapitalSchemeItemModel:
-    def test_to_domain(self) -> None:
+    def test_to_summary(self) -> None:
         capital_scheme_item_model = CapitalSchemeItemModel(
             reference="ATE00001", overview=build_overview_model(), status=build_status_model()
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_item_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        summary = capital_scheme_item_model.to_summary({funding_programme_item_model.id: funding_programme_item_model})
 
-        assert scheme.reference == "ATE00001"
+        assert summary.reference == "ATE00001"
 
-    def test_to_domain_sets_overview_revision(self) -> None:
-        authority_model = AuthorityModel(
-            id=AnyUrl("https://api.example/authorities/LIV"),
-            abbreviation="LIV",
-            full_name="Liverpool City Region Combined Authority",
-            bid_submitting_capital_schemes=AnyUrl("https://api.example/authorities/LIV/capital-schemes/bid-submitting"),
-        )
+    def test_to_summary_sets_overview(self) -> None:
         funding_programme_item_model = FundingProgrammeItemModel(
             id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4"
         )
@@ -288,28 +309,23 @@ class TestCapitalSchemeItemModel:
             status=build_status_model(),
         )
 
-        scheme = capital_scheme_item_model.to_domain([authority_model], [funding_programme_item_model])
+        summary = capital_scheme_item_model.to_summary({funding_programme_item_model.id: funding_programme_item_model})
 
-        (overview_revision1,) = scheme.overview.overview_revisions
-        assert (
-            overview_revision1.name == "Wirral Package"
-            and overview_revision1.authority_abbreviation == "LIV"
-            and overview_revision1.funding_programme == FundingProgrammes.ATF4
-            and overview_revision1.type == SchemeType.CONSTRUCTION
-        )
+        assert summary.name == "Wirral Package" and summary.funding_programme == FundingProgrammes.ATF4
 
-    def test_to_domain_sets_status(self) -> None:
+    def test_to_summary_sets_status(self) -> None:
         capital_scheme_item_model = CapitalSchemeItemModel(
             reference="ATE00001",
             overview=build_overview_model(),
             status=CapitalSchemeStatusModel(status=StatusModel.ACTIVE),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_item_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        summary = capital_scheme_item_model.to_summary({funding_programme_item_model.id: funding_programme_item_model})
 
-        assert scheme.status == Status.ACTIVE
+        assert summary.status == Status.ACTIVE
 
-    def test_to_domain_sets_authority_review(self) -> None:
+    def test_to_summary_sets_last_reviewed(self) -> None:
         capital_scheme_item_model = CapitalSchemeItemModel(
             reference="ATE00001",
             overview=build_overview_model(),
@@ -318,21 +334,40 @@ class TestCapitalSchemeItemModel:
                 review_date=datetime(2020, 1, 2, tzinfo=UTC), source=DataSourceModel.AUTHORITY_UPDATE
             ),
         )
+        funding_programme_item_model = build_funding_programme_item_model()
 
-        scheme = capital_scheme_item_model.to_domain([build_authority_model()], [build_funding_programme_item_model()])
+        summary = capital_scheme_item_model.to_summary({funding_programme_item_model.id: funding_programme_item_model})
 
-        (authority_review1,) = scheme.reviews.authority_reviews
-        assert (
-            authority_review1.id is not None
-            and authority_review1.review_date == datetime(2020, 1, 2)
-            and authority_review1.source == DataSource.AUTHORITY_UPDATE
+        assert summary.last_reviewed == datetime(2020, 1, 2)
+
+    def test_to_summary_when_no_authority_review(self) -> None:
+        capital_scheme_item_model = CapitalSchemeItemModel(
+            reference="ATE00001", overview=build_overview_model(), status=build_status_model(), authority_review=None
         )
+        funding_programme_item_model = build_funding_programme_item_model()
+
+        summary = capital_scheme_item_model.to_summary({funding_programme_item_model.id: funding_programme_item_model})
+
+        assert summary.last_reviewed is None
 
 
 class TestApiSchemeRepository:
+    @pytest.fixture(name="funding_programmes")
+    def funding_programmes_fixture(self) -> FundingProgrammeCatalogue:
+        return FundingProgrammeCatalogue(ttl=60)
+
+    @pytest.fixture(name="authority_models")
+    def authority_models_fixture(self) -> AuthorityModelCatalogue:
+        return AuthorityModelCatalogue(ttl=60, max_size=10)
+
     @pytest.fixture(name="schemes")
-    def schemes_fixture(self, remote_app: ClientAsyncBaseApp) -> ApiSchemeRepository:
-        return ApiSchemeRepository(remote_app)
+    def schemes_fixture(
+        self,
+        remote_app: ClientAsyncBaseApp,
+        funding_programmes: FundingProgrammeCatalogue,
+        authority_models: AuthorityModelCatalogue,
+    ) -> ApiSchemeRepository:
+        return ApiSchemeRepository(remote_app, funding_programmes, authority_models)
 
     async def test_get_scheme(self, api_mock: MockRouter, schemes: ApiSchemeRepository) -> None:
         api_mock.get(build_funding_programme_json()["@id"]).respond(200, json=build_funding_programme_json())
@@ -343,6 +378,34 @@ class TestApiSchemeRepository:
 
         assert scheme and scheme.reference == "ATE00001"
 
+    async def test_get_scheme_logs_fetch_times(
+        self, api_mock: MockRouter, schemes: ApiSchemeRepository, caplog: LogCaptureFixture
+    ) -> None:
+        api_mock.get(build_funding_programme_json()["@id"]).respond(200, json=build_funding_programme_json())
+        api_mock.get(build_authority_json()["@id"]).respond(200, json=build_authority_json())
+        api_mock.get("/capital-schemes/ATE00001").respond(200, json=build_capital_scheme_json(reference="ATE00001"))
+
+        with caplog.at_level(logging.DEBUG, logger="schemes.infrastructure.api.schemes.schemes"):
+            await schemes.get("ATE00001")
+
+        fetched_urls = [
+            record.message.split("'")[1] for record in caplog.records if record.message.startswith("Fetched")
+        ]
+        assert sorted(fetched_urls) == sorted(
+            ["/capital-schemes/ATE00001", build_authority_json()["@id"], build_funding_programme_json()["@id"]]
+        )
+
+    async def test_get_scheme_caches_authority(self, api_mock: MockRouter, schemes: ApiSchemeRepository) -> None:
+        api_mock.get(build_funding_programme_json()["@id"]).respond(200, json=build_funding_programme_json())
+        authority_route = api_mock.get(build_authority_json()["@id"]).respond(200, json=build_authority_json())
+        api_mock.get("/capital-schemes/ATE00001").respond(200, json=build_capital_scheme_json(reference="ATE00001"))
+
+        await schemes.get("ATE00001")
+        scheme = await schemes.get("ATE00001")
+
+        assert scheme and scheme.overview.authority_abbreviation == build_authority_json()["abbreviation"]
+        assert authority_route.call_count == 1
+
     async def test_get_scheme_sets_overview_revision(
         self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
     ) -> None:
@@ -551,7 +614,64 @@ class TestApiSchemeRepository:
 
         assert remote_app.client_count == 1
 
-    async def test_get_schemes_by_authority(
+    async def test_get_scheme_gets_authority_and_funding_programme_concurrently(
+        self, api_mock: MockRouter, schemes: ApiSchemeRepository
+    ) -> None:
+        barrier = asyncio.Barrier(2)
+        api_mock.get(build_funding_programme_json()["@id"]).mock(
+            side_effect=_respond_when_all_requested(barrier, build_funding_programme_json())
+        )
+        api_mock.get(build_authority_json()["@id"]).mock(
+            side_effect=_respond_when_all_requested(barrier, build_authority_json())
+        )
+        api_mock.get("/capital-schemes/ATE00001").respond(200, json=build_capital_scheme_json("ATE00001"))
+
+        scheme = await schemes.get("ATE00001")
+
+        assert scheme and scheme.reference == "ATE00001"
+
+    async def test_get_scheme_caches_funding_programme(
+        self, api_mock: MockRouter, schemes: ApiSchemeRepository
+    ) -> None:
+        funding_programme_route = api_mock.get(build_funding_programme_json()["@id"]).respond(
+            200, json=build_funding_programme_json()
+        )
+        api_mock.get(build_authority_json()["@id"]).respond(200, json=build_authority_json())
+        api_mock.get("/capital-schemes/ATE00001").respond(200, json=build_capital_scheme_json("ATE00001"))
+        api_mock.get("/capital-schemes/ATE00002").respond(200, json=build_capital_scheme_json("ATE00002"))
+
+        await schemes.get("ATE00001")
+        scheme = await schemes.get("ATE00002")
+
+        assert scheme and scheme.reference == "ATE00002"
+        assert funding_programme_route.call_count == 1
+
+    async def test_get_scheme_uses_funding_programme_catalogue(
+        self,
+        api_mock: MockRouter,
+        api_base_url: str,
+        funding_programmes: FundingProgrammeCatalogue,
+        schemes: ApiSchemeRepository,
+    ) -> None:
+        funding_programmes.add(
+            FundingProgrammeItemModel(id=AnyUrl(f"{api_base_url}/funding-programmes/ATF4"), code="ATF4")
+        )
+        api_mock.get(build_authority_json()["@id"]).respond(200, json=build_authority_json())
+        api_mock.get("/capital-schemes/ATE00001").respond(
+            200,
+            json=build_capital_scheme_json(
+                reference="ATE00001",
+                overview=build_overview_json(funding_programme=f"{api_base_url}/funding-programmes/ATF4"),
+            ),
+        )
+
+        scheme = await schemes.get("ATE00001")
+
+        assert scheme
+        (overview_revision1,) = scheme.overview.overview_revisions
+        assert overview_revision1.funding_programme == FundingProgrammes.ATF4
+
+    async def test_get_scheme_summaries_by_authority(
         self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
     ) -> None:
         api_mock.get("/funding-programmes").respond(200, json={"items": [build_funding_programme_item_json()]})
@@ -579,12 +699,12 @@ class TestApiSchemeRepository:
             },
         )
 
-        scheme1, scheme2 = await schemes.get_by_authority("LIV")
+        scheme1, scheme2 = await schemes.get_summaries_by_authority("LIV")
 
         assert scheme1.reference == "ATE00001"
         assert scheme2.reference == "ATE00002"
 
-    async def test_get_schemes_by_authority_sets_overview_revision(
+    async def test_get_scheme_summaries_by_authority_sets_overview_revision(
         self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
     ) -> None:
         api_mock.get("/funding-programmes").respond(
@@ -618,17 +738,11 @@ class TestApiSchemeRepository:
             },
         )
 
-        (scheme1,) = await schemes.get_by_authority("LIV")
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
 
-        (overview_revision1,) = scheme1.overview.overview_revisions
-        assert (
-            overview_revision1.name == "Wirral Package"
-            and overview_revision1.authority_abbreviation == "LIV"
-            and overview_revision1.funding_programme == FundingProgrammes.ATF4
-            and overview_revision1.type == SchemeType.CONSTRUCTION
-        )
+        assert scheme1.name == "Wirral Package" and scheme1.funding_programme == FundingProgrammes.ATF4
 
-    async def test_get_schemes_by_authority_sets_status(
+    async def test_get_scheme_summaries_by_authority_sets_status(
         self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
     ) -> None:
         api_mock.get("/funding-programmes").respond(200, json={"items": [build_funding_programme_item_json()]})
@@ -653,11 +767,11 @@ class TestApiSchemeRepository:
             },
         )
 
-        (scheme1,) = await schemes.get_by_authority("LIV")
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
 
         assert scheme1.status == Status.ACTIVE
 
-    async def test_get_schemes_by_authority_sets_authority_review(
+    async def test_get_scheme_summaries_by_authority_sets_authority_review(
         self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
     ) -> None:
         api_mock.get("/funding-programmes").respond(200, json={"items": [build_funding_programme_item_json()]})
@@ -684,16 +798,11 @@ class TestApiSchemeRepository:
             },
         )
 
-        (scheme1,) = await schemes.get_by_authority("LIV")
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
 
-        (authority_review1,) = scheme1.reviews.authority_reviews
-        assert (
-            authority_review1.id is not None
-            and authority_review1.review_date == datetime(2020, 1, 2)
-            and authority_review1.source == DataSource.AUTHORITY_UPDATE
-        )
+        assert scheme1.last_reviewed == datetime(2020, 1, 2)
 
-    async def test_get_schemes_by_authority_filters_by_funding_programme_eligible_for_authority_update(
+    async def test_get_scheme_summaries_by_authority_filters_by_funding_programme_eligible_for_authority_update(
         self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
     ) -> None:
         api_mock.get("/funding-programmes", params={"eligible-for-authority-update": "true"}).respond(
@@ -730,11 +839,11 @@ class TestApiSchemeRepository:
             },
         )
 
-        (scheme1,) = await schemes.get_by_authority("LIV")
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
 
         assert scheme1.reference == "ATE00001"
 
-    async def test_get_schemes_by_authority_filters_by_status_active(
+    async def test_get_scheme_summaries_by_authority_filters_by_status_active(
         self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
     ) -> None:
         api_mock.get("/funding-programmes").respond(200, json={"items": [build_funding_programme_item_json()]})
@@ -758,11 +867,11 @@ class TestApiSchemeRepository:
             },
         )
 
-        (scheme1,) = await schemes.get_by_authority("LIV")
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
 
         assert scheme1.reference == "ATE00001"
 
-    async def test_get_schemes_by_authority_reuses_client(
+    async def test_get_scheme_summaries_by_authority_reuses_client(
         self, api_mock: MockRouter, api_base_url: str, remote_app: StubRemoteApp, schemes: ApiSchemeRepository
     ) -> None:
         api_mock.get("/funding-programmes").respond(200, json={"items": [build_funding_programme_item_json()]})
@@ -790,10 +899,111 @@ class TestApiSchemeRepository:
             },
         )
 
-        await schemes.get_by_authority("LIV")
+        await schemes.get_summaries_by_authority("LIV")
 
         assert remote_app.client_count == 1
 
+    async def test_get_scheme_summaries_by_authority_gets_authority_and_funding_programmes_concurrently(
+        self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
+    ) -> None:
+        barrier = asyncio.Barrier(2)
+        api_mock.get("/funding-programmes").mock(
+            side_effect=_respond_when_all_requested(barrier, {"items": [build_funding_programme_item_json()]})
+        )
+        api_mock.get("/authorities/LIV").mock(
+            side_effect=_respond_when_all_requested(
+                barrier,
+                build_authority_json(
+                    id_=f"{api_base_url}/authorities/LIV",
+                    abbreviation="LIV",
+                    bid_submitting_capital_schemes=f"{api_base_url}/authorities/LIV/capital-schemes/bid-submitting",
+                ),
+            )
+        )
+        api_mock.get("/authorities/LIV/capital-schemes/bid-submitting").respond(
+            200,
+            json={
+                "items": [
+                    build_capital_scheme_item_json(
+                        reference="ATE00001",
+                        overview=build_overview_json(bid_submitting_authority=f"{api_base_url}/authorities/LIV"),
+                    )
+                ]
+            },
+        )
+
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
+
+        assert scheme1.reference == "ATE00001"
+
+    async def test_get_scheme_summaries_by_authority_caches_funding_programmes(
+        self, api_mock: MockRouter, api_base_url: str, schemes: ApiSchemeRepository
+    ) -> None:
+        funding_programmes_route = api_mock.get("/funding-programmes").respond(
+            200,
+            json={
+                "items": [build_funding_programme_item_json(id_=f"{api_base_url}/funding-programmes/ATF4", code="ATF4")]
+            },
+        )
+        api_mock.get("/authorities/LIV").respond(
+            200,
+            json=build_authority_json(
+                id_=f"{api_base_url}/authorities/LIV",
+                abbreviation="LIV",
+                bid_submitting_capital_schemes=f"{api_base_url}/authorities/LIV/capital-schemes/bid-submitting",
+            ),
+        )
+        capital_schemes_route = api_mock.get(
+            "/authorities/LIV/capital-schemes/bid-submitting", params={"funding-programme-code": "ATF4"}
+        ).respond(
+            200,
+            json={
+                "items": [
+                    build_capital_scheme_item_json(
+                        reference="ATE00001",
+                        overview=build_overview_json(
+                            bid_submitting_authority=f"{api_base_url}/authorities/LIV",
+                            funding_programme=f"{api_base_url}/funding-programmes/ATF4",
+                        ),
+                    )
+                ]
+            },
+        )
+
+        await schemes.get_summaries_by_authority("LIV")
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
+
+        assert scheme1.reference == "ATE00001"
+        assert funding_programmes_route.call_count == 1 and capital_schemes_route.call_count == 2
+
+    async def test_get_scheme_summaries_by_authority_refreshes_funding_programmes_when_expired(
+        self, api_mock: MockRouter, api_base_url: str, remote_app: ClientAsyncBaseApp
+    ) -> None:
+        now = 0.0
+        schemes = ApiSchemeRepository(
+            remote_app,
+            FundingProgrammeCatalogue(ttl=60, timer=lambda: now),
+            AuthorityModelCatalogue(ttl=60, max_size=10),
+        )
+        funding_programmes_route = api_mock.get("/funding-programmes").respond(
+            200, json={"items": [build_funding_programme_item_json()]}
+        )
+        api_mock.get("/authorities/LIV").respond(
+            200,
+            json=build_authority_json(
+                id_=f"{api_base_url}/authorities/LIV",
+                abbreviation="LIV",
+                bid_submitting_capital_schemes=f"{api_base_url}/authorities/LIV/capital-schemes/bid-submitting",
+            ),
+        )
+        api_mock.get("/authorities/LIV/capital-schemes/bid-submitting").respond(200, json={"items": []})
+        await schemes.get_summaries_by_authority("LIV")
+
+        now = 60
+        await schemes.get_summaries_by_authority("LIV")
+
+        assert funding_programmes_route.call_count == 2
+
     async def test_update_scheme_financials(self, api_mock: MockRouter, schemes: ApiSchemeRepository) -> None:
         scheme = build_scheme(reference="ATE00001", name="Wirral Package")
         scheme.funding.update_financials(
@@ -969,3 +1179,84 @@ class TestApiSchemeRepository:
         await schemes.update(scheme)
 
         assert remote_app.client_count == 1
+
+    async def test_update_scheme_creates_revisions_concurrently(
+        self, api_mock: MockRouter, schemes: ApiSchemeRepository
+    ) -> None:
+        scheme = build_scheme(reference="ATE00001", name="Wirral Package")
+        scheme.funding.update_financials(
+            FinancialRevision(
+                id_=None,
+                effective=DateRange(datetime(2020, 2, 1), None),
+                type_=FinancialType.SPEND_TO_DATE,
+                amount=60_000,
+                source=DataSource.AUTHORITY_UPDATE,
+            )
+        )
+        scheme.milestones.update_milestones(
+            MilestoneRevision(
+                id_=None,
+                effective=DateRange(datetime(2020, 2, 1), None),
+                milestone=Milestone.DETAILED_DESIGN_COMPLETED,
+                observation_type=ObservationType.ACTUAL,
+                status_date=date(2020, 4, 1),
+                source=DataSource.AUTHORITY_UPDATE,
+            )
+        )
+        scheme.reviews.update_authority_review(
+            AuthorityReview(id_=None, review_date=datetime(2020, 2, 1), source=DataSource.AUTHORITY_UPDATE)
+        )
+        barrier = asyncio.Barrier(3)
+        create_financial_response = api_mock.post("/capital-schemes/ATE00001/financials").mock(
+            side_effect=_respond_when_all_requested(barrier, {})
+        )
+        create_milestones_response = api_mock.post("/capital-schemes/ATE00001/milestones").mock(
+            side_effect=_respond_when_all_requested(barrier, {})
+        )
+        create_authority_review_response = api_mock.post("/capital-schemes/ATE00001/authority-reviews").mock(
+            side_effect=_respond_when_all_requested(barrier, {})
+        )
+
+        await schemes.update(scheme)
+
+        assert (
+            create_financial_response.call_count == 1
+            and create_milestones_response.call_count == 1
+            and create_authority_review_response.call_count == 1
+        )
+
+    async def test_update_scheme_reports_partial_failure(
+        self, api_mock: MockRouter, schemes: ApiSchemeRepository
+    ) -> None:
+        scheme = build_scheme(reference="ATE00001", name="Wirral Package")
+        scheme.funding.update_financials(
+            FinancialRevision(
+                id_=None,
+                effective=DateRange(datetime(2020, 2, 1), None),
+                type_=FinancialType.SPEND_TO_DATE,
+                amount=60_000,
+                source=DataSource.AUTHORITY_UPDATE,
+            )
+        )
+        scheme.reviews.update_authority_review(
+            AuthorityReview(id_=None, review_date=datetime(2020, 2, 1), source=DataSource.AUTHORITY_UPDATE)
+        )
+        api_mock.post("/capital-schemes/ATE00001/financials").respond(500)
+        create_authority_review_response = api_mock.post("/capital-schemes/ATE00001/authority-reviews").respond(201)
+
+        with pytest.raises(ExceptionGroup, match="Failed to update capital scheme ATE00001") as exc_info:
+            await schemes.update(scheme)
+
+        (error,) = exc_info.value.exceptions
+        assert isinstance(error, HTTPStatusError) and error.request.url.path == "/capital-schemes/ATE00001/financials"
+        assert create_authority_review_response.call_count == 1
+
+
+def _respond_when_all_requested(
+    barrier: asyncio.Barrier, json: dict[str, Any]
+) -> Callable[[Request], Awaitable[Response]]:
+    async def side_effect(request: Request) -> Response:
+        await asyncio.wait_for(barrier.wait(), timeout=1)
+        return Response(200, json=json)
+
+    return side_effect
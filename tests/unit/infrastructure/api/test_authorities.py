@@ -1,11 +1,14 @@
 from typing import Any
 
 import pytest
+from httpx import Response
 from pydantic import AnyUrl
 from respx import MockRouter
 
-from schemes.infrastructure.api.authorities import ApiAuthorityRepository, AuthorityModel
+from schemes.infrastructure.api.authorities import ApiAuthorityRepository, AuthorityModel, AuthorityModelCatalogue
 from schemes.oauth import AsyncBaseApp
+from tests.unit.infrastructure.api.builders import build_authority_model
+from tests.unit.infrastructure.api.conftest import StubRemoteApp
 
 
 class TestAuthorityModel:
@@ -22,6 +25,47 @@ class TestAuthorityModel:
         assert authority.abbreviation == "LIV" and authority.name == "Liverpool City Region Combined Authority"
 
 
+class TestAuthorityModelCatalogue:
+    @pytest.fixture(name="authority_models")
+    def authority_models_fixture(self) -> AuthorityModelCatalogue:
+        return AuthorityModelCatalogue(ttl=60, max_size=10)
+
+    def test_get_by_url(self, authority_models: AuthorityModelCatalogue) -> None:
+        authority_models.add("https://api.example/authorities/LIV", build_authority_model(abbreviation="LIV"))
+
+        authority_model = authority_models.get_by_url("https://api.example/authorities/LIV")
+
+        assert authority_model and authority_model.abbreviation == "LIV"
+
+    def test_get_by_url_when_missing(self, authority_models: AuthorityModelCatalogue) -> None:
+        assert authority_models.get_by_url("https://api.example/authorities/LIV") is None
+
+    def test_get_by_url_when_expired(self) -> None:
+        now = 0.0
+        authority_models = AuthorityModelCatalogue(ttl=60, max_size=10, timer=lambda: now)
+        authority_models.add("https://api.example/authorities/LIV", build_authority_model(abbreviation="LIV"))
+
+        now = 60.0
+
+        assert authority_models.get_by_url("https://api.example/authorities/LIV") is None
+
+    def test_add_evicts_least_recently_used(self) -> None:
+        authority_models = AuthorityModelCatalogue(ttl=60, max_size=1)
+        authority_models.add("https://api.example/authorities/LIV", build_authority_model(abbreviation="LIV"))
+
+        authority_models.add("https://api.example/authorities/WYO", build_authority_model(abbreviation="WYO"))
+
+        assert authority_models.get_by_url("https://api.example/authorities/LIV") is None
+        assert authority_models.get_by_url("https://api.example/authorities/WYO")
+
+    def test_invalidate(self, authority_models: AuthorityModelCatalogue) -> None:
+        authority_models.add("https://api.example/authorities/LIV", build_authority_model(abbreviation="LIV"))
+
+        authority_models.invalidate()
+
+        assert authority_models.get_by_url("https://api.example/authorities/LIV") is None
+
+
 class TestApiAuthorityRepository:
     @pytest.fixture(name="authorities")
     def authorities_fixture(self, remote_app: AsyncBaseApp) -> ApiAuthorityRepository:
@@ -57,6 +101,73 @@ class TestApiAuthorityRepository:
             and authority.name == "Liverpool City Region Combined Authority"
         )
 
+    async def test_get_authority_reuses_client(
+        self, api_mock: MockRouter, remote_app: StubRemoteApp, authorities: ApiAuthorityRepository
+    ) -> None:
+        api_mock.get("/authorities/LIV").respond(200, json=_build_authority_json(abbreviation="LIV"))
+        api_mock.get("/authorities/WYO").respond(200, json=_build_authority_json(abbreviation="WYO"))
+
+        await authorities.get("LIV")
+        await authorities.get("WYO")
+
+        assert remote_app.client_count == 1
+
+    async def test_get_authority_revalidates_etag(
+        self, api_mock: MockRouter, authorities: ApiAuthorityRepository
+    ) -> None:
+        route = api_mock.get("/authorities/LIV")
+        route.side_effect = [
+            Response(
+                200,
+                headers={"ETag": '"1"'},
+                json=_build_authority_json(abbreviation="LIV", full_name="Liverpool City Region Combined Authority"),
+            ),
+            Response(304),
+        ]
+        await authorities.get("LIV")
+
+        authority = await authorities.get("LIV")
+
+        assert route.calls[1].request.headers["If-None-Match"] == '"1"'
+        assert (
+            authority
+            and authority.abbreviation == "LIV"
+            and authority.name == "Liverpool City Region Combined Authority"
+        )
+
+    async def test_get_authority_replaces_etag_when_modified(
+        self, api_mock: MockRouter, authorities: ApiAuthorityRepository
+    ) -> None:
+        route = api_mock.get("/authorities/LIV")
+        route.side_effect = [
+            Response(
+                200, headers={"ETag": '"1"'}, json=_build_authority_json(abbreviation="LIV", full_name="Liverpool")
+            ),
+            Response(
+                200,
+                headers={"ETag": '"2"'},
+                json=_build_authority_json(abbreviation="LIV", full_name="Liverpool City Region Combined Authority"),
+            ),
+            Response(304),
+        ]
+        await authorities.get("LIV")
+        await authorities.get("LIV")
+
+        authority = await authorities.get("LIV")
+
+        assert route.calls[2].request.headers["If-None-Match"] == '"2"'
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+    async def test_get_authority_without_etag_does_not_revalidate(
+        self, api_mock: MockRouter, authorities: ApiAuthorityRepository
+    ) -> None:
+        route = api_mock.get("/authorities/LIV").respond(200, json=_build_authority_json(abbreviation="LIV"))
+        await authorities.get("LIV")
+
+        await authorities.get("LIV")
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+
     async def test_get_authority_that_does_not_exist(
         self, api_mock: MockRouter, authorities: ApiAuthorityRepository
     ) -> None:
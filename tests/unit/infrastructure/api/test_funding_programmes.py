@@ -1,7 +1,12 @@
+import pytest
 from pydantic import AnyUrl
 
 from schemes.domain.schemes.overview import FundingProgrammes
-from schemes.infrastructure.api.funding_programmes import FundingProgrammeItemModel, FundingProgrammeModel
+from schemes.infrastructure.api.funding_programmes import (
+    FundingProgrammeCatalogue,
+    FundingProgrammeItemModel,
+    FundingProgrammeModel,
+)
 
 
 class TestFundingProgrammeModel:
@@ -24,3 +29,102 @@ class TestFundingProgrammeItemModel:
         funding_programme = funding_programme_item_model.to_domain()
 
         assert funding_programme == FundingProgrammes.ATF4
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFundingProgrammeCatalogue:
+    @pytest.fixture(name="timer")
+    def timer_fixture(self) -> FakeTimer:
+        return FakeTimer()
+
+    @pytest.fixture(name="funding_programmes")
+    def funding_programmes_fixture(self, timer: FakeTimer) -> FundingProgrammeCatalogue:
+        return FundingProgrammeCatalogue(ttl=60, timer=timer)
+
+    def test_get_by_id(self, funding_programmes: FundingProgrammeCatalogue) -> None:
+        funding_programmes.add(
+            FundingProgrammeModel(id=AnyUrl("https://api.example/funding-programmes/ATF3"), code="ATF3"),
+            FundingProgrammeModel(id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4"),
+        )
+
+        funding_programme_model = funding_programmes.get_by_id(AnyUrl("https://api.example/funding-programmes/ATF4"))
+
+        assert funding_programme_model and funding_programme_model.code == "ATF4"
+
+    def test_get_by_id_when_missing(self, funding_programmes: FundingProgrammeCatalogue) -> None:
+        assert funding_programmes.get_by_id(AnyUrl("https://api.example/funding-programmes/ATF4")) is None
+
+    def test_get_by_code(self, funding_programmes: FundingProgrammeCatalogue) -> None:
+        funding_programmes.add(
+            FundingProgrammeModel(id=AnyUrl("https://api.example/funding-programmes/ATF3"), code="ATF3"),
+            FundingProgrammeModel(id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4"),
+        )
+
+        funding_programme_model = funding_programmes.get_by_code("ATF4")
+
+        assert funding_programme_model and funding_programme_model.id == AnyUrl(
+            "https://api.example/funding-programmes/ATF4"
+        )
+
+    def test_get_by_code_when_missing(self, funding_programmes: FundingProgrammeCatalogue) -> None:
+        assert funding_programmes.get_by_code("ATF4") is None
+
+    def test_eligible_for_authority_update_when_unknown(self, funding_programmes: FundingProgrammeCatalogue) -> None:
+        assert funding_programmes.eligible_for_authority_update is None
+
+    def test_update_eligible_for_authority_update(self, funding_programmes: FundingProgrammeCatalogue) -> None:
+        funding_programmes.update_eligible_for_authority_update(
+            FundingProgrammeItemModel(id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4")
+        )
+
+        eligible_for_authority_update = funding_programmes.eligible_for_authority_update
+        assert eligible_for_authority_update is not None
+        assert [funding_programme_model.code for funding_programme_model in eligible_for_authority_update] == ["ATF4"]
+        assert funding_programmes.get_by_code("ATF4")
+
+    def test_update_eligible_for_authority_update_when_none(
+        self, timer: FakeTimer, funding_programmes: FundingProgrammeCatalogue
+    ) -> None:
+        funding_programmes.update_eligible_for_authority_update()
+
+        assert funding_programmes.eligible_for_authority_update == []
+        timer.now = 60
+        assert funding_programmes.eligible_for_authority_update is None
+
+    def test_expires(self, timer: FakeTimer, funding_programmes: FundingProgrammeCatalogue) -> None:
+        funding_programmes.update_eligible_for_authority_update(
+            FundingProgrammeItemModel(id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4")
+        )
+
+        timer.now = 60
+
+        assert funding_programmes.eligible_for_authority_update is None and not funding_programmes.get_by_code("ATF4")
+
+    def test_does_not_expire_before_ttl(self, timer: FakeTimer, funding_programmes: FundingProgrammeCatalogue) -> None:
+        funding_programmes.add(
+            FundingProgrammeModel(id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4")
+        )
+        timer.now = 30
+        funding_programmes.add(
+            FundingProgrammeModel(id=AnyUrl("https://api.example/funding-programmes/ATF5"), code="ATF5")
+        )
+
+        timer.now = 59
+
+        assert funding_programmes.get_by_code("ATF4") and funding_programmes.get_by_code("ATF5")
+
+    def test_invalidate(self, funding_programmes: FundingProgrammeCatalogue) -> None:
+        funding_programmes.update_eligible_for_authority_update(
+            FundingProgrammeItemModel(id=AnyUrl("https://api.example/funding-programmes/ATF4"), code="ATF4")
+        )
+
+        funding_programmes.invalidate()
+
+        assert funding_programmes.eligible_for_authority_update is None and not funding_programmes.get_by_code("ATF4")
@@ -0,0 +1,15 @@
+from collections.abc import Generator
+
+import pytest
+from flask import Flask
+
+
+@pytest.fixture(name="app")
+def app_fixture() -> Flask:
+    return Flask("test")
+
+
+@pytest.fixture(name="app_context")
+def app_context_fixture(app: Flask) -> Generator[None]:
+    with app.app_context():
+        yield
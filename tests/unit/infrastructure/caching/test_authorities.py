@@ -0,0 +1,173 @@
+import pytest
+
+from schemes.domain.authorities import Authority, AuthorityRepository
+from schemes.infrastructure.caching.authorities import CachingAuthorityRepository, RequestScopedAuthorityRepository
+from schemes.infrastructure.caching.caches import TtlCache
+
+
+class CountingAuthorityRepository(AuthorityRepository):
+    def __init__(self) -> None:
+        self._authorities: dict[str, Authority] = {}
+        self.get_count = 0
+
+    async def add(self, *authorities: Authority) -> None:
+        for authority in authorities:
+            self._authorities[authority.abbreviation] = authority
+
+    async def clear(self) -> None:
+        self._authorities.clear()
+
+    async def get(self, abbreviation: str) -> Authority | None:
+        self.get_count += 1
+        return self._authorities.get(abbreviation)
+
+
+class TestCachingAuthorityRepository:
+    @pytest.fixture(name="delegate")
+    def delegate_fixture(self) -> CountingAuthorityRepository:
+        return CountingAuthorityRepository()
+
+    @pytest.fixture(name="authorities")
+    def authorities_fixture(self, delegate: CountingAuthorityRepository) -> CachingAuthorityRepository:
+        return CachingAuthorityRepository(delegate, TtlCache(ttl=60, max_size=10))
+
+    async def test_add_authorities(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        authority = await delegate.get("LIV")
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+    async def test_add_authorities_invalidates_authority(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool"))
+        await authorities.get("LIV")
+
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        authority = await authorities.get("LIV")
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+    async def test_clear_all_authorities(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+        await authorities.get("LIV")
+
+        await authorities.clear()
+
+        assert not await delegate.get("LIV") and not await authorities.get("LIV")
+
+    async def test_get_authority(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        authority = await authorities.get("LIV")
+
+        assert (
+            authority
+            and authority.abbreviation == "LIV"
+            and authority.name == "Liverpool City Region Combined Authority"
+        )
+
+    async def test_get_authority_caches_authority(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        await authorities.get("LIV")
+        authority = await authorities.get("LIV")
+
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+        assert delegate.get_count == 1
+
+    async def test_get_authority_that_does_not_exist(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        assert await authorities.get("LIV") is None
+
+    async def test_get_authority_that_does_not_exist_is_not_cached(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        await authorities.get("LIV")
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        authority = await authorities.get("LIV")
+
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+    async def test_invalidate(
+        self, delegate: CountingAuthorityRepository, authorities: CachingAuthorityRepository
+    ) -> None:
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool"))
+        await authorities.get("LIV")
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        authorities.invalidate()
+
+        authority = await authorities.get("LIV")
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+
+class TestRequestScopedAuthorityRepositoryWithoutAppContext:
+    async def test_get_authority(self) -> None:
+        delegate = CountingAuthorityRepository()
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+        authorities = RequestScopedAuthorityRepository(delegate)
+
+        authority = await authorities.get("LIV")
+
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+
+@pytest.mark.usefixtures("app_context")
+class TestRequestScopedAuthorityRepository:
+    @pytest.fixture(name="delegate")
+    def delegate_fixture(self) -> CountingAuthorityRepository:
+        return CountingAuthorityRepository()
+
+    @pytest.fixture(name="authorities")
+    def authorities_fixture(self, delegate: CountingAuthorityRepository) -> RequestScopedAuthorityRepository:
+        return RequestScopedAuthorityRepository(delegate)
+
+    async def test_add_authorities(
+        self, delegate: CountingAuthorityRepository, authorities: RequestScopedAuthorityRepository
+    ) -> None:
+        await authorities.get("LIV")
+
+        await authorities.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        authority = await authorities.get("LIV")
+        assert authority and authority.name == "Liverpool City Region Combined Authority"
+
+    async def test_clear_all_authorities(
+        self, delegate: CountingAuthorityRepository, authorities: RequestScopedAuthorityRepository
+    ) -> None:
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+        await authorities.get("LIV")
+
+        await authorities.clear()
+
+        assert not await delegate.get("LIV") and not await authorities.get("LIV")
+
+    async def test_get_authority(
+        self, delegate: CountingAuthorityRepository, authorities: RequestScopedAuthorityRepository
+    ) -> None:
+        await delegate.add(Authority(abbreviation="LIV", name="Liverpool City Region Combined Authority"))
+
+        authority1 = await authorities.get("LIV")
+        authority2 = await authorities.get("LIV")
+
+        assert authority1 and authority1 is authority2
+        assert delegate.get_count == 1
+
+    async def test_get_authority_that_does_not_exist(
+        self, delegate: CountingAuthorityRepository, authorities: RequestScopedAuthorityRepository
+    ) -> None:
+        await authorities.get("LIV")
+
+        assert await authorities.get("LIV") is None
+        assert delegate.get_count == 1
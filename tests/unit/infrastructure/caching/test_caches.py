@@ -0,0 +1,302 @@
+import asyncio
+
+import pytest
+from flask import Flask
+
+from schemes.infrastructure.caching.caches import RequestCache, StaleWhileRevalidateCache, TtlCache
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTtlCache:
+    @pytest.fixture(name="timer")
+    def timer_fixture(self) -> FakeTimer:
+        return FakeTimer()
+
+    def test_get(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+
+        assert cache.get("LIV") == "Liverpool City Region Combined Authority"
+
+    def test_get_when_missing(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+
+        assert cache.get("LIV") is None
+
+    def test_get_when_expired(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+
+        timer.now = 60
+
+        assert cache.get("LIV") is None and len(cache) == 0
+
+    def test_get_before_expired(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+
+        timer.now = 59
+
+        assert cache.get("LIV") == "Liverpool City Region Combined Authority"
+
+    def test_set_evicts_least_recently_used(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=2, timer=timer)
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+        cache.set("WYO", "West Yorkshire Combined Authority")
+        cache.get("LIV")
+
+        cache.set("GMA", "Greater Manchester Combined Authority")
+
+        assert cache.get("LIV") and not cache.get("WYO") and cache.get("GMA") and len(cache) == 2
+
+    def test_set_replaces_value(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+        cache.set("LIV", "Liverpool")
+
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+
+        assert cache.get("LIV") == "Liverpool City Region Combined Authority" and len(cache) == 1
+
+    def test_delete(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+        cache.set("WYO", "West Yorkshire Combined Authority")
+
+        cache.delete("LIV")
+
+        assert not cache.get("LIV") and cache.get("WYO")
+
+    def test_delete_when_missing(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+
+        cache.delete("LIV")
+
+        assert len(cache) == 0
+
+    def test_clear(self, timer: FakeTimer) -> None:
+        cache = TtlCache[str, str](ttl=60, max_size=10, timer=timer)
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+        cache.set("WYO", "West Yorkshire Combined Authority")
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class StubLoader:
+    def __init__(self, *values: str):
+        self._values = list(values)
+        self.count = 0
+
+    async def __call__(self) -> str:
+        self.count += 1
+        value = self._values.pop(0)
+        if value == "error":
+            raise RuntimeError("Cannot load")
+        return value
+
+
+class TestStaleWhileRevalidateCache:
+    @pytest.fixture(name="timer")
+    def timer_fixture(self) -> FakeTimer:
+        return FakeTimer()
+
+    @pytest.fixture(name="cache")
+    def cache_fixture(self, timer: FakeTimer) -> StaleWhileRevalidateCache[str, str]:
+        return StaleWhileRevalidateCache[str, str](ttl=60, stale_ttl=600, max_size=10, timer=timer)
+
+    async def test_get_loads_when_missing(self, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("Wirral Package")
+
+        assert await cache.get("LIV", load) == "Wirral Package"
+        assert load.count == 1
+
+    async def test_get_when_fresh(self, timer: FakeTimer, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+        await cache.get("LIV", load)
+        timer.now = 59
+
+        value = await cache.get("LIV", load)
+
+        assert value == "Wirral Package" and load.count == 1
+
+    async def test_get_when_stale_returns_stale_value(
+        self, timer: FakeTimer, cache: StaleWhileRevalidateCache[str, str]
+    ) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+        await cache.get("LIV", load)
+        timer.now = 60
+
+        value = await cache.get("LIV", load)
+
+        assert value == "Wirral Package"
+
+    async def test_get_when_stale_revalidates(
+        self, timer: FakeTimer, cache: StaleWhileRevalidateCache[str, str]
+    ) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+        await cache.get("LIV", load)
+        timer.now = 60
+        await cache.get("LIV", load)
+
+        await asyncio.sleep(0)
+
+        assert await cache.get("LIV", load) == "School Streets" and load.count == 2
+
+    async def test_get_when_stale_revalidates_once(
+        self, timer: FakeTimer, cache: StaleWhileRevalidateCache[str, str]
+    ) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+        await cache.get("LIV", load)
+        timer.now = 60
+
+        await cache.get("LIV", load)
+        await cache.get("LIV", load)
+        await asyncio.sleep(0)
+
+        assert load.count == 2
+
+    async def test_get_when_revalidation_fails_returns_stale_value(
+        self, timer: FakeTimer, cache: StaleWhileRevalidateCache[str, str]
+    ) -> None:
+        load = StubLoader("Wirral Package", "error")
+        await cache.get("LIV", load)
+        timer.now = 60
+        await cache.get("LIV", load)
+
+        await asyncio.sleep(0)
+
+        assert await cache.get("LIV", load) == "Wirral Package" and load.count == 2
+
+    async def test_get_when_expired_loads(self, timer: FakeTimer, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+        await cache.get("LIV", load)
+        timer.now = 660
+
+        value = await cache.get("LIV", load)
+
+        assert value == "School Streets" and load.count == 2
+
+    async def test_delete(self, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+        await cache.get("LIV", load)
+
+        cache.delete("LIV")
+
+        assert await cache.get("LIV", load) == "School Streets"
+
+    async def test_delete_discards_value_loading(self, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+
+        async def load_then_delete() -> str:
+            value = await load()
+            cache.delete("LIV")
+            return value
+
+        await cache.get("LIV", load_then_delete)
+
+        assert await cache.get("LIV", load) == "School Streets"
+
+    async def test_delete_keeps_value_loading_for_other_key(self, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("Wirral Package", "School Streets")
+
+        async def load_then_delete_other() -> str:
+            value = await load()
+            cache.delete("WYO")
+            return value
+
+        await cache.get("LIV", load_then_delete_other)
+
+        assert await cache.get("LIV", load) == "Wirral Package" and load.count == 1
+
+    async def test_failed_load_does_not_discard_value_loading(self, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("error", "Wirral Package", "School Streets")
+
+        async def load_after_failed_load() -> str:
+            with pytest.raises(RuntimeError):
+                await cache.get("LIV", load)
+            return await load()
+
+        await cache.get("LIV", load_after_failed_load)
+
+        assert await cache.get("LIV", load) == "Wirral Package" and load.count == 2
+
+    async def test_clear(self, cache: StaleWhileRevalidateCache[str, str]) -> None:
+        load = StubLoader("Wirral Package", "School Streets", "Hospital Fields Road", "Hospital Fields Road")
+        await cache.get("LIV", load)
+        await cache.get("WYO", load)
+
+        cache.clear()
+
+        assert await cache.get("LIV", load) == "Hospital Fields Road" and load.count == 3
+
+
+class TestRequestCache:
+    @pytest.mark.usefixtures("app_context")
+    def test_get(self) -> None:
+        cache = RequestCache[str, str]("test")
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+
+        assert "LIV" in cache and cache.get("LIV") == "Liverpool City Region Combined Authority"
+
+    @pytest.mark.usefixtures("app_context")
+    def test_get_when_missing(self) -> None:
+        cache = RequestCache[str, str]("test")
+
+        assert "LIV" not in cache and cache.get("LIV") is None
+
+    @pytest.mark.usefixtures("app_context")
+    def test_get_when_none(self) -> None:
+        cache = RequestCache[str, str | None]("test")
+        cache.set("LIV", None)
+
+        assert "LIV" in cache and cache.get("LIV") is None
+
+    def test_get_when_different_request(self, app: Flask) -> None:
+        cache = RequestCache[str, str]("test")
+        with app.app_context():
+            cache.set("LIV", "Liverpool City Region Combined Authority")
+
+        with app.app_context():
+            assert "LIV" not in cache
+
+    def test_get_when_no_request(self) -> None:
+        cache = RequestCache[str, str]("test")
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+
+        assert "LIV" not in cache
+
+    @pytest.mark.usefixtures("app_context")
+    def test_get_when_different_name(self) -> None:
+        cache1 = RequestCache[str, str]("test1")
+        cache2 = RequestCache[str, str]("test2")
+        cache1.set("LIV", "Liverpool City Region Combined Authority")
+
+        assert "LIV" not in cache2
+
+    @pytest.mark.usefixtures("app_context")
+    def test_delete(self) -> None:
+        cache = RequestCache[str, str]("test")
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+        cache.set("WYO", "West Yorkshire Combined Authority")
+
+        cache.delete("LIV")
+
+        assert "LIV" not in cache and "WYO" in cache
+
+    @pytest.mark.usefixtures("app_context")
+    def test_clear(self) -> None:
+        cache = RequestCache[str, str]("test")
+        cache.set("LIV", "Liverpool City Region Combined Authority")
+        cache.set("WYO", "West Yorkshire Combined Authority")
+
+        cache.clear()
+
+        assert "LIV" not in cache and "WYO" not in cache
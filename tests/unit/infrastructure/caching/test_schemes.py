@@ -0,0 +1,255 @@
+import pytest
+
+from schemes.domain.schemes.schemes import Scheme, SchemeRepository, SchemeSummary
+from schemes.infrastructure.caching.caches import StaleWhileRevalidateCache
+from schemes.infrastructure.caching.schemes import CachingSchemeRepository, RequestScopedSchemeRepository
+from tests.unit.domain.builders import build_scheme
+
+
+class CountingSchemeRepository(SchemeRepository):
+    def __init__(self) -> None:
+        self._schemes: dict[str, Scheme] = {}
+        self.get_count = 0
+        self.get_summaries_by_authority_count = 0
+        self.updated: list[Scheme] = []
+
+    async def add(self, *schemes: Scheme) -> None:
+        for scheme in schemes:
+            self._schemes[scheme.reference] = scheme
+
+    async def clear(self) -> None:
+        self._schemes.clear()
+
+    async def get(self, reference: str) -> Scheme | None:
+        self.get_count += 1
+        return self._schemes.get(reference)
+
+    async def get_summaries_by_authority(self, authority_abbreviation: str, fresh: bool = False) -> list[SchemeSummary]:
+        self.get_summaries_by_authority_count += 1
+        return [
+            scheme.summary
+            for scheme in self._schemes.values()
+            if scheme.overview.authority_abbreviation == authority_abbreviation
+        ]
+
+    async def update(self, scheme: Scheme) -> None:
+        self.updated.append(scheme)
+
+
+class FailingSchemeRepository(CountingSchemeRepository):
+    async def update(self, scheme: Scheme) -> None:
+        raise RuntimeError("Cannot update")
+
+
+class TestCachingSchemeRepository:
+    @pytest.fixture(name="delegate")
+    def delegate_fixture(self) -> CountingSchemeRepository:
+        return CountingSchemeRepository()
+
+    @pytest.fixture(name="schemes")
+    def schemes_fixture(self, delegate: CountingSchemeRepository) -> CachingSchemeRepository:
+        return CachingSchemeRepository(delegate, StaleWhileRevalidateCache(ttl=60, stale_ttl=600, max_size=10))
+
+    async def test_add_schemes_invalidates_authority(
+        self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository
+    ) -> None:
+        await schemes.get_summaries_by_authority("LIV")
+
+        await schemes.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
+        assert scheme1.reference == "ATE00001"
+
+    async def test_clear_all_schemes(
+        self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository
+    ) -> None:
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+        await schemes.get_summaries_by_authority("LIV")
+
+        await schemes.clear()
+
+        assert not await delegate.get("ATE00001") and not await schemes.get_summaries_by_authority("LIV")
+
+    async def test_get_scheme(self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository) -> None:
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package"))
+
+        await schemes.get("ATE00001")
+        scheme = await schemes.get("ATE00001")
+
+        assert scheme and scheme.reference == "ATE00001"
+        assert delegate.get_count == 2
+
+    async def test_get_scheme_summaries_by_authority(
+        self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository
+    ) -> None:
+        await delegate.add(
+            build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"),
+            build_scheme(reference="ATE00002", name="School Streets", authority_abbreviation="WYO"),
+        )
+
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
+
+        assert scheme1.reference == "ATE00001"
+
+    async def test_get_scheme_summaries_by_authority_caches_schemes(
+        self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository
+    ) -> None:
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+
+        await schemes.get_summaries_by_authority("LIV")
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
+
+        assert scheme1.reference == "ATE00001"
+        assert delegate.get_summaries_by_authority_count == 1
+
+    async def test_update_scheme(self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository) -> None:
+        scheme = build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV")
+
+        await schemes.update(scheme)
+
+        assert delegate.updated == [scheme]
+
+    async def test_update_scheme_invalidates_authority(
+        self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository
+    ) -> None:
+        scheme = build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV")
+        await delegate.add(scheme)
+        await schemes.get_summaries_by_authority("LIV")
+        await schemes.get_summaries_by_authority("WYO")
+
+        await schemes.update(scheme)
+
+        await schemes.get_summaries_by_authority("LIV")
+        await schemes.get_summaries_by_authority("WYO")
+        assert delegate.get_summaries_by_authority_count == 3
+
+    async def test_update_scheme_when_fails_invalidates_authority(self) -> None:
+        delegate = FailingSchemeRepository()
+        schemes = CachingSchemeRepository(delegate, StaleWhileRevalidateCache(ttl=60, stale_ttl=600, max_size=10))
+        scheme = build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV")
+        await schemes.get_summaries_by_authority("LIV")
+
+        with pytest.raises(RuntimeError):
+            await schemes.update(scheme)
+
+        await schemes.get_summaries_by_authority("LIV")
+        assert delegate.get_summaries_by_authority_count == 2
+
+    async def test_invalidate(self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository) -> None:
+        await schemes.get_summaries_by_authority("LIV")
+
+        schemes.invalidate()
+
+        await schemes.get_summaries_by_authority("LIV")
+        assert delegate.get_summaries_by_authority_count == 2
+
+    async def test_get_fresh_scheme_summaries_by_authority(
+        self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository
+    ) -> None:
+        await schemes.get_summaries_by_authority("LIV")
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"))
+
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV", fresh=True)
+
+        assert scheme1.reference == "ATE00001"
+
+    async def test_get_fresh_scheme_summaries_by_authority_caches_schemes(
+        self, delegate: CountingSchemeRepository, schemes: CachingSchemeRepository
+    ) -> None:
+        await schemes.get_summaries_by_authority("LIV", fresh=True)
+        await schemes.get_summaries_by_authority("LIV")
+        await schemes.get_summaries_by_authority("WYO")
+
+        assert delegate.get_summaries_by_authority_count == 2
+
+
+class TestRequestScopedSchemeRepositoryWithoutAppContext:
+    async def test_get_scheme(self) -> None:
+        delegate = CountingSchemeRepository()
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package"))
+        schemes = RequestScopedSchemeRepository(delegate)
+
+        scheme = await schemes.get("ATE00001")
+
+        assert scheme and scheme.overview.name == "Wirral Package"
+
+
+@pytest.mark.usefixtures("app_context")
+class TestRequestScopedSchemeRepository:
+    @pytest.fixture(name="delegate")
+    def delegate_fixture(self) -> CountingSchemeRepository:
+        return CountingSchemeRepository()
+
+    @pytest.fixture(name="schemes")
+    def schemes_fixture(self, delegate: CountingSchemeRepository) -> RequestScopedSchemeRepository:
+        return RequestScopedSchemeRepository(delegate)
+
+    async def test_add_schemes(self, schemes: RequestScopedSchemeRepository) -> None:
+        await schemes.get("ATE00001")
+
+        await schemes.add(build_scheme(reference="ATE00001", name="Wirral Package"))
+
+        scheme = await schemes.get("ATE00001")
+        assert scheme and scheme.overview.name == "Wirral Package"
+
+    async def test_clear_all_schemes(
+        self, delegate: CountingSchemeRepository, schemes: RequestScopedSchemeRepository
+    ) -> None:
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package"))
+        await schemes.get("ATE00001")
+
+        await schemes.clear()
+
+        assert not await delegate.get("ATE00001") and not await schemes.get("ATE00001")
+
+    async def test_get_scheme(self, delegate: CountingSchemeRepository, schemes: RequestScopedSchemeRepository) -> None:
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package"))
+
+        scheme1 = await schemes.get("ATE00001")
+        scheme2 = await schemes.get("ATE00001")
+
+        assert scheme1 and scheme1 is scheme2
+        assert delegate.get_count == 1
+
+    async def test_get_scheme_that_does_not_exist(
+        self, delegate: CountingSchemeRepository, schemes: RequestScopedSchemeRepository
+    ) -> None:
+        await schemes.get("ATE00001")
+
+        assert await schemes.get("ATE00001") is None
+        assert delegate.get_count == 1
+
+    async def test_get_scheme_summaries_by_authority(
+        self, delegate: CountingSchemeRepository, schemes: RequestScopedSchemeRepository
+    ) -> None:
+        await delegate.add(
+            build_scheme(reference="ATE00001", name="Wirral Package", authority_abbreviation="LIV"),
+            build_scheme(reference="ATE00002", name="School Streets", authority_abbreviation="WYO"),
+        )
+
+        (scheme1,) = await schemes.get_summaries_by_authority("LIV")
+
+        assert scheme1.reference == "ATE00001"
+
+    async def test_update_scheme(
+        self, delegate: CountingSchemeRepository, schemes: RequestScopedSchemeRepository
+    ) -> None:
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package"))
+        scheme = await schemes.get("ATE00001")
+        assert scheme
+
+        await schemes.update(scheme)
+
+        assert delegate.updated == [scheme]
+
+    async def test_update_scheme_evicts_scheme(
+        self, delegate: CountingSchemeRepository, schemes: RequestScopedSchemeRepository
+    ) -> None:
+        await delegate.add(build_scheme(reference="ATE00001", name="Wirral Package"))
+        scheme = await schemes.get("ATE00001")
+        assert scheme
+
+        await schemes.update(scheme)
+        await schemes.get("ATE00001")
+
+        assert delegate.get_count == 2
@@ -0,0 +1,160 @@
+import pytest
+from flask import Flask
+
+from schemes.domain.users import User, UserRepository
+from schemes.infrastructure.caching.caches import TtlCache
+from schemes.infrastructure.caching.users import CachingUserRepository, RequestScopedUserRepository
+
+
+class CountingUserRepository(UserRepository):
+    def __init__(self) -> None:
+        self._users: dict[str, User] = {}
+        self.get_count = 0
+
+    def add(self, *users: User) -> None:
+        for user in users:
+            self._users[user.email] = user
+
+    def clear(self) -> None:
+        self._users.clear()
+
+    def get(self, email: str) -> User | None:
+        self.get_count += 1
+        return self._users.get(email)
+
+
+class TestCachingUserRepository:
+    @pytest.fixture(name="delegate")
+    def delegate_fixture(self) -> CountingUserRepository:
+        return CountingUserRepository()
+
+    @pytest.fixture(name="users")
+    def users_fixture(self, delegate: CountingUserRepository) -> CachingUserRepository:
+        return CachingUserRepository(delegate, TtlCache(ttl=60, max_size=10))
+
+    def test_add_users(self, delegate: CountingUserRepository, users: CachingUserRepository) -> None:
+        users.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        user = delegate.get("boardman@example.com")
+        assert user and user.authority_abbreviation == "LIV"
+
+    def test_add_users_invalidates_user(self, delegate: CountingUserRepository, users: CachingUserRepository) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+        users.get("boardman@example.com")
+
+        users.add(User(email="boardman@example.com", authority_abbreviation="WYO"))
+
+        user = users.get("boardman@example.com")
+        assert user and user.authority_abbreviation == "WYO"
+
+    def test_clear_all_users(self, delegate: CountingUserRepository, users: CachingUserRepository) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+        users.get("boardman@example.com")
+
+        users.clear()
+
+        assert not delegate.get("boardman@example.com") and not users.get("boardman@example.com")
+
+    def test_get_user(self, delegate: CountingUserRepository, users: CachingUserRepository) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        user = users.get("boardman@example.com")
+
+        assert user and user.email == "boardman@example.com" and user.authority_abbreviation == "LIV"
+
+    def test_get_user_caches_user(self, delegate: CountingUserRepository, users: CachingUserRepository) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        users.get("boardman@example.com")
+        user = users.get("boardman@example.com")
+
+        assert user and user.authority_abbreviation == "LIV"
+        assert delegate.get_count == 1
+
+    def test_get_user_who_does_not_exist_is_not_cached(
+        self, delegate: CountingUserRepository, users: CachingUserRepository
+    ) -> None:
+        users.get("boardman@example.com")
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        user = users.get("boardman@example.com")
+
+        assert user and user.authority_abbreviation == "LIV"
+
+    def test_invalidate(self, delegate: CountingUserRepository, users: CachingUserRepository) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+        users.get("boardman@example.com")
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="WYO"))
+
+        users.invalidate()
+
+        user = users.get("boardman@example.com")
+        assert user and user.authority_abbreviation == "WYO"
+
+
+class TestRequestScopedUserRepository:
+    @pytest.fixture(name="delegate")
+    def delegate_fixture(self) -> CountingUserRepository:
+        return CountingUserRepository()
+
+    @pytest.fixture(name="users")
+    def users_fixture(self, delegate: CountingUserRepository) -> RequestScopedUserRepository:
+        return RequestScopedUserRepository(delegate)
+
+    @pytest.mark.usefixtures("app_context")
+    def test_add_users(self, users: RequestScopedUserRepository) -> None:
+        users.get("boardman@example.com")
+
+        users.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        user = users.get("boardman@example.com")
+        assert user and user.authority_abbreviation == "LIV"
+
+    @pytest.mark.usefixtures("app_context")
+    def test_clear_all_users(self, delegate: CountingUserRepository, users: RequestScopedUserRepository) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+        users.get("boardman@example.com")
+
+        users.clear()
+
+        assert not delegate.get("boardman@example.com") and not users.get("boardman@example.com")
+
+    @pytest.mark.usefixtures("app_context")
+    def test_get_user(self, delegate: CountingUserRepository, users: RequestScopedUserRepository) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        user1 = users.get("boardman@example.com")
+        user2 = users.get("boardman@example.com")
+
+        assert user1 and user1 is user2
+        assert delegate.get_count == 1
+
+    def test_get_user_in_each_request(
+        self, app: Flask, delegate: CountingUserRepository, users: RequestScopedUserRepository
+    ) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        with app.app_context():
+            users.get("boardman@example.com")
+        with app.app_context():
+            users.get("boardman@example.com")
+
+        assert delegate.get_count == 2
+
+    def test_get_user_without_app_context(
+        self, delegate: CountingUserRepository, users: RequestScopedUserRepository
+    ) -> None:
+        delegate.add(User(email="boardman@example.com", authority_abbreviation="LIV"))
+
+        user = users.get("boardman@example.com")
+
+        assert user and user.email == "boardman@example.com"
+
+    @pytest.mark.usefixtures("app_context")
+    def test_get_user_who_does_not_exist(
+        self, delegate: CountingUserRepository, users: RequestScopedUserRepository
+    ) -> None:
+        users.get("boardman@example.com")
+
+        assert users.get("boardman@example.com") is None
+        assert delegate.get_count == 1
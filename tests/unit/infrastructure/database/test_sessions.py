@@ -0,0 +1,77 @@
+import logging
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from schemes.infrastructure.database import SessionEntity
+from schemes.infrastructure.database.sessions import SessionSweeper
+
+
+class TestSessionSweeper:
+    @pytest.fixture(name="sweeper")
+    def sweeper_fixture(self, session_maker: sessionmaker[Session]) -> SessionSweeper:
+        sweeper: SessionSweeper = SessionSweeper(
+            2, session_maker, logging.getLogger("test"), now=lambda: datetime(2020, 1, 2, 12), timer=lambda: 0.0
+        )
+        return sweeper
+
+    def test_sweep_deletes_expired_sessions(
+        self, sweeper: SessionSweeper, session_maker: sessionmaker[Session]
+    ) -> None:
+        _add_sessions(
+            session_maker,
+            ("1", datetime(2020, 1, 2, 11)),
+            ("2", datetime(2020, 1, 2, 12)),
+            ("3", datetime(2020, 1, 2, 13)),
+        )
+
+        sweeper.sweep()
+
+        assert _session_ids(session_maker) == ["3"]
+
+    def test_sweep_deletes_expired_sessions_in_batches(
+        self, sweeper: SessionSweeper, session_maker: sessionmaker[Session]
+    ) -> None:
+        _add_sessions(session_maker, *((str(index), datetime(2020, 1, 1, index)) for index in range(5)))
+
+        count = sweeper.sweep()
+
+        assert count == 5 and _session_ids(session_maker) == []
+
+    def test_sweep_when_no_expired_sessions(
+        self, sweeper: SessionSweeper, session_maker: sessionmaker[Session]
+    ) -> None:
+        _add_sessions(session_maker, ("1", datetime(2020, 1, 2, 13)))
+
+        count = sweeper.sweep()
+
+        assert count == 0 and _session_ids(session_maker) == ["1"]
+
+    def test_sweep_logs_count_and_duration(
+        self, session_maker: sessionmaker[Session], caplog: pytest.LogCaptureFixture
+    ) -> None:
+        times = iter([1.0, 1.25])
+        sweeper = SessionSweeper(
+            2, session_maker, logging.getLogger("test"), now=lambda: datetime(2020, 1, 2, 12), timer=lambda: next(times)
+        )
+        _add_sessions(session_maker, ("1", datetime(2020, 1, 2, 11)))
+
+        with caplog.at_level(logging.INFO):
+            sweeper.sweep()
+
+        assert caplog.messages == ["Swept 1 expired sessions in 0.250 seconds"]
+
+
+def _add_sessions(session_maker: sessionmaker[Session], *sessions: tuple[str, datetime]) -> None:
+    with session_maker() as session:
+        session.add_all(
+            SessionEntity(session_id=session_id, data=b"", expiry=expiry) for session_id, expiry in sessions
+        )
+        session.commit()
+
+
+def _session_ids(session_maker: sessionmaker[Session]) -> list[str | None]:
+    with session_maker() as session:
+        return list(session.scalars(select(SessionEntity.session_id).order_by(SessionEntity.session_id)))
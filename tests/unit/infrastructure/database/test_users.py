@@ -1,5 +1,8 @@
+from collections.abc import Sequence
+from typing import Any
+
 import pytest
-from sqlalchemy import func, select
+from sqlalchemy import Connection, Engine, event, func, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from schemes.domain.users import User
@@ -26,6 +29,61 @@ class TestDatabaseUserRepository:
         assert row1.email == "boardman@example.com" and row1.authority_abbreviation == "LIV"
         assert row2.email == "obree@example.com" and row2.authority_abbreviation == "LIV"
 
+    def test_add_users_updates_existing_user(
+        self, users: DatabaseUserRepository, session_maker: sessionmaker[Session]
+    ) -> None:
+        with session_maker() as session:
+            session.add(UserEntity(email="boardman@example.com", authority_abbreviation="LIV"))
+            session.commit()
+
+        users.add(
+            User(email="boardman@example.com", authority_abbreviation="WYO"),
+            User(email="obree@example.com", authority_abbreviation="LIV"),
+        )
+
+        row1: UserEntity
+        row2: UserEntity
+        with session_maker() as session:
+            row1, row2 = session.scalars(select(UserEntity).order_by(UserEntity.user_id))
+        assert row1.email == "boardman@example.com" and row1.authority_abbreviation == "WYO"
+        assert row2.email == "obree@example.com" and row2.authority_abbreviation == "LIV"
+
+    def test_add_users_with_duplicate_email(
+        self, users: DatabaseUserRepository, engine: Engine, session_maker: sessionmaker[Session]
+    ) -> None:
+        parameters: list[Any] = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record_parameters(
+            _connection: Connection,
+            _cursor: Any,
+            _statement: str,
+            statement_parameters: Sequence[Any],
+            _context: Any,
+            _executemany: bool,
+        ) -> None:
+            parameters.extend(statement_parameters)
+
+        users.add(
+            User(email="boardman@example.com", authority_abbreviation="LIV"),
+            User(email="obree@example.com", authority_abbreviation="LIV"),
+            User(email="boardman@example.com", authority_abbreviation="WYO"),
+        )
+
+        row1: UserEntity
+        row2: UserEntity
+        with session_maker() as session:
+            row1, row2 = session.scalars(select(UserEntity).order_by(UserEntity.user_id))
+        assert row1.email == "boardman@example.com" and row1.authority_abbreviation == "WYO"
+        assert row2.email == "obree@example.com" and row2.authority_abbreviation == "LIV"
+        assert parameters.count("boardman@example.com") == 1
+
+    def test_add_many_users(self, users: DatabaseUserRepository, session_maker: sessionmaker[Session]) -> None:
+        users.add(*[User(email=f"user{index}@example.com", authority_abbreviation="LIV") for index in range(2500)])
+
+        with session_maker() as session:
+            assert session.execute(select(func.count()).select_from(UserEntity)).scalar_one() == 2500
+
     def test_get_user(self, users: DatabaseUserRepository, session_maker: sessionmaker[Session]) -> None:
         with session_maker() as session:
             session.add(UserEntity(email="boardman@example.com", authority_abbreviation="LIV"))
@@ -28,8 +28,23 @@ class StubAuthorizationServer:
     def token_endpoint(self) -> str:
         return f"{self._url}/token"
 
-    def given_configuration_endpoint_returns_configuration(self) -> None:
-        self._respx_mock.get(self.configuration_endpoint).respond(200, json={"token_endpoint": self.token_endpoint})
+    def given_configuration_endpoint_returns_configuration(self, max_age: int | None = None) -> Route:
+        headers = {"Cache-Control": f"max-age={max_age}"} if max_age is not None else {}
+        return self._given_configuration_endpoint_returns(
+            Response(200, headers=headers, json={"token_endpoint": self.token_endpoint})
+        )
+
+    def given_configuration_endpoint_returns_error(self) -> Route:
+        return self._given_configuration_endpoint_returns(Response(500))
+
+    def _given_configuration_endpoint_returns(self, response: Response) -> Route:
+        # Support multiple method calls to mock different responses
+        route = self._respx_mock.pop("configuration_endpoint", default=None)
+        side_effects = list(cast(Iterator[Response], route.side_effect)) if route else []
+
+        return self._respx_mock.get(self.configuration_endpoint, name="configuration_endpoint").mock(
+            side_effect=side_effects + [response]
+        )
 
     def given_token_endpoint_returns_access_token(self, access_token: str, expires_in: int) -> Route:
         # Support multiple method calls to mock different responses
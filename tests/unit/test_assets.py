@@ -0,0 +1,195 @@
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import brotli
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from flask import Flask, render_template_string
+
+from schemes.assets import MANIFEST_FILENAME, AssetManifest, build_assets, configure_assets, main
+
+_CSS = b"body { color: black; }\n" * 100
+
+
+@pytest.fixture(name="static_folder")
+def static_folder_fixture(tmp_path: Path) -> Path:
+    static_folder = tmp_path / "static"
+    (static_folder / "css").mkdir(parents=True)
+    (static_folder / "css" / "main.css").write_bytes(_CSS)
+    (static_folder / "logo.png").write_bytes(b"\x89PNG")
+    return static_folder
+
+
+def _create_app(static_folder: Path) -> Flask:
+    app = Flask("schemes", static_folder=str(static_folder))
+    configure_assets(app)
+    return app
+
+
+class TestAssetManifest:
+    def test_resolve(self) -> None:
+        manifest = AssetManifest({"main.css": "main.1a2b3c4d.css"})
+
+        assert manifest.resolve("main.css") == "main.1a2b3c4d.css"
+
+    def test_resolve_when_not_fingerprinted(self) -> None:
+        manifest = AssetManifest({})
+
+        assert manifest.resolve("main.css") == "main.css"
+
+    def test_is_fingerprinted(self) -> None:
+        manifest = AssetManifest({"main.css": "main.1a2b3c4d.css"})
+
+        assert manifest.is_fingerprinted("main.1a2b3c4d.css") and not manifest.is_fingerprinted("main.css")
+
+    def test_encodings(self) -> None:
+        manifest = AssetManifest({"main.css": "main.1a2b3c4d.css"}, {"main.1a2b3c4d.css": ["br", "gzip"]})
+
+        assert manifest.encodings("main.1a2b3c4d.css") == ["br", "gzip"]
+
+    def test_load_when_missing(self, static_folder: Path) -> None:
+        manifest = AssetManifest.load(str(static_folder))
+
+        assert len(manifest) == 0
+
+
+class TestBuildAssets:
+    def test_build_fingerprints_assets(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+
+        fingerprinted = manifest.resolve("css/main.css")
+        assert fingerprinted.startswith("css/main.") and fingerprinted.endswith(".css")
+        assert (static_folder / fingerprinted).read_bytes() == _CSS
+
+    def test_build_fingerprints_assets_by_content(self, static_folder: Path) -> None:
+        fingerprinted = build_assets(str(static_folder)).resolve("css/main.css")
+        (static_folder / "css" / "main.css").write_bytes(_CSS + b"p { color: red; }\n")
+
+        rebuilt = build_assets(str(static_folder)).resolve("css/main.css")
+
+        assert rebuilt != fingerprinted
+
+    def test_build_precompresses_text_assets(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+
+        fingerprinted = manifest.resolve("css/main.css")
+        assert manifest.encodings(fingerprinted) == ["br", "gzip"]
+        assert gzip.decompress((static_folder / f"{fingerprinted}.gz").read_bytes()) == _CSS
+        assert brotli.decompress((static_folder / f"{fingerprinted}.br").read_bytes()) == _CSS
+
+    def test_build_does_not_precompress_binary_assets(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+
+        assert manifest.encodings(manifest.resolve("logo.png")) == []
+
+    def test_build_writes_manifest(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+
+        assets = json.loads((static_folder / MANIFEST_FILENAME).read_text())
+        assert assets == {"css/main.css": manifest.resolve("css/main.css"), "logo.png": manifest.resolve("logo.png")}
+
+    def test_build_replaces_previous_assets(self, static_folder: Path) -> None:
+        fingerprinted = build_assets(str(static_folder)).resolve("css/main.css")
+        (static_folder / "css" / "main.css").write_bytes(b"p { color: red; }\n")
+
+        manifest = build_assets(str(static_folder))
+
+        assert len(manifest) == 2
+        assert not (static_folder / fingerprinted).exists() and not (static_folder / f"{fingerprinted}.gz").exists()
+
+    def test_main(self, static_folder: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(sys, "argv", ["schemes-build-assets", str(static_folder)])
+
+        main()
+
+        assert len(AssetManifest.load(str(static_folder))) == 2
+
+    def test_main_without_static_folder(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(sys, "argv", ["schemes-build-assets"])
+
+        with pytest.raises(SystemExit, match="Usage"):
+            main()
+
+    def test_main_when_static_folder_missing(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(sys, "argv", ["schemes-build-assets", str(tmp_path / "static")])
+
+        with pytest.raises(SystemExit, match="not found"):
+            main()
+
+    def test_main_when_static_folder_empty(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(sys, "argv", ["schemes-build-assets", str(tmp_path)])
+
+        with pytest.raises(SystemExit, match="No assets were fingerprinted"):
+            main()
+
+
+class TestAssets:
+    def test_asset_url(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+        app = _create_app(static_folder)
+
+        with app.test_request_context():
+            url = render_template_string("{{ asset_url('css/main.css') }}")
+
+        assert url == f"/static/{manifest.resolve('css/main.css')}"
+
+    def test_asset_url_when_not_fingerprinted(self, static_folder: Path) -> None:
+        app = _create_app(static_folder)
+
+        with app.test_request_context():
+            url = render_template_string("{{ asset_url('css/main.css', _external=True) }}")
+
+        assert url == "http://localhost/static/css/main.css"
+
+    def test_fingerprinted_asset_is_cached_immutably(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+        app = _create_app(static_folder)
+
+        response = app.test_client().get(f"/static/{manifest.resolve('logo.png')}")
+
+        assert response.status_code == 200
+        assert response.cache_control.public and response.cache_control.immutable
+        assert response.cache_control.max_age == 31536000
+
+    def test_fingerprinted_asset_is_sent_with_brotli(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+        app = _create_app(static_folder)
+
+        response = app.test_client().get(
+            f"/static/{manifest.resolve('css/main.css')}", headers={"Accept-Encoding": "gzip, deflate, br"}
+        )
+
+        assert response.content_encoding == "br" and response.mimetype == "text/css"
+        assert brotli.decompress(response.data) == _CSS
+        assert "Accept-Encoding" in response.vary
+
+    def test_fingerprinted_asset_is_sent_with_gzip(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+        app = _create_app(static_folder)
+
+        response = app.test_client().get(
+            f"/static/{manifest.resolve('css/main.css')}", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.content_encoding == "gzip" and response.mimetype == "text/css"
+        assert gzip.decompress(response.data) == _CSS
+
+    def test_fingerprinted_asset_is_sent_uncompressed(self, static_folder: Path) -> None:
+        manifest = build_assets(str(static_folder))
+        app = _create_app(static_folder)
+
+        response = app.test_client().get(f"/static/{manifest.resolve('css/main.css')}")
+
+        assert response.content_encoding is None and response.data == _CSS
+        assert "Accept-Encoding" in response.vary
+
+    def test_asset_that_is_not_fingerprinted_uses_default_caching(self, static_folder: Path) -> None:
+        build_assets(str(static_folder))
+        app = _create_app(static_folder)
+
+        response = app.test_client().get("/static/css/main.css", headers={"Accept-Encoding": "br"})
+
+        assert response.content_encoding is None and response.data == _CSS
+        assert not response.cache_control.immutable
@@ -0,0 +1,157 @@
+import asyncio
+import os
+from asyncio import AbstractEventLoop
+from collections.abc import Generator
+from contextvars import ContextVar
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, g
+
+from schemes.event_loops import EventLoopFlask, EventLoopThread
+
+_name: ContextVar[str] = ContextVar("name")
+
+
+class TestEventLoopThread:
+    @pytest.fixture(name="event_loop_thread")
+    def event_loop_thread_fixture(self) -> Generator[EventLoopThread]:
+        event_loop_thread = EventLoopThread()
+        yield event_loop_thread
+        event_loop_thread.stop()
+
+    def test_run(self, event_loop_thread: EventLoopThread) -> None:
+        async def add(x: int, y: int) -> int:
+            await asyncio.sleep(0)
+            return x + y
+
+        assert event_loop_thread.run(add(1, 2)) == 3
+
+    def test_run_raises_error(self, event_loop_thread: EventLoopThread) -> None:
+        async def fail() -> None:
+            raise ValueError("Cannot run")
+
+        with pytest.raises(ValueError, match="Cannot run"):
+            event_loop_thread.run(fail())
+
+    def test_run_reuses_loop(self, event_loop_thread: EventLoopThread) -> None:
+        loop1 = event_loop_thread.run(_get_running_loop())
+        loop2 = event_loop_thread.run(_get_running_loop())
+
+        assert loop1 is loop2 and not loop1.is_closed()
+
+    def test_run_propagates_context(self, event_loop_thread: EventLoopThread) -> None:
+        async def get_name() -> str:
+            return _name.get()
+
+        _name.set("boardman")
+
+        assert event_loop_thread.run(get_name()) == "boardman"
+
+    def test_run_after_stop_starts_loop(self, event_loop_thread: EventLoopThread) -> None:
+        loop1 = event_loop_thread.run(_get_running_loop())
+
+        event_loop_thread.stop()
+        loop2 = event_loop_thread.run(_get_running_loop())
+
+        assert loop1 is not loop2
+
+    def test_run_after_fork_starts_loop(self, event_loop_thread: EventLoopThread) -> None:
+        loop1 = event_loop_thread.run(_get_running_loop())
+
+        with patch("os.getpid", return_value=os.getpid() + 1):
+            loop2 = event_loop_thread.run(_get_running_loop())
+
+        assert loop1 is not loop2
+
+    def test_stop_runs_callbacks_on_loop(self, event_loop_thread: EventLoopThread) -> None:
+        loop = event_loop_thread.run(_get_running_loop())
+        callback_loops: list[AbstractEventLoop] = []
+
+        async def callback() -> None:
+            callback_loops.append(asyncio.get_running_loop())
+
+        event_loop_thread.on_stop(callback)
+        event_loop_thread.stop()
+
+        assert callback_loops == [loop]
+
+    def test_stop_runs_callbacks_after_one_fails(self, event_loop_thread: EventLoopThread) -> None:
+        event_loop_thread.run(_get_running_loop())
+        calls: list[str] = []
+
+        async def fail() -> None:
+            raise ValueError("Cannot stop")
+
+        async def callback() -> None:
+            calls.append("callback")
+
+        event_loop_thread.on_stop(fail)
+        event_loop_thread.on_stop(callback)
+        event_loop_thread.stop()
+
+        assert calls == ["callback"]
+
+    def test_stop_does_not_run_callbacks_when_not_started(self, event_loop_thread: EventLoopThread) -> None:
+        calls: list[str] = []
+
+        async def callback() -> None:
+            calls.append("callback")
+
+        event_loop_thread.on_stop(callback)
+        event_loop_thread.stop()
+
+        assert not calls
+
+
+class TestEventLoopFlask:
+    @pytest.fixture(name="loops")
+    def loops_fixture(self) -> list[AbstractEventLoop]:
+        return []
+
+    @pytest.fixture(name="app")
+    def app_fixture(self, loops: list[AbstractEventLoop]) -> Generator[EventLoopFlask]:
+        app = EventLoopFlask("test")
+        app.config["PERSISTENT_EVENT_LOOP"] = True
+
+        @app.get("/loop")
+        async def loop() -> str:
+            loops.append(asyncio.get_running_loop())
+            return ""
+
+        @app.get("/name")
+        async def name() -> str:
+            g.name = "boardman"
+            await asyncio.sleep(0)
+            return str(g.name)
+
+        yield app
+        app.event_loop.stop()
+
+    def test_async_view_reuses_loop(self, app: Flask, loops: list[AbstractEventLoop]) -> None:
+        client = app.test_client()
+
+        client.get("/loop")
+        client.get("/loop")
+
+        loop1, loop2 = loops
+        assert loop1 is loop2 and not loop1.is_closed()
+
+    def test_async_view_uses_loop_per_request_when_disabled(self, app: Flask, loops: list[AbstractEventLoop]) -> None:
+        app.config["PERSISTENT_EVENT_LOOP"] = False
+        client = app.test_client()
+
+        client.get("/loop")
+        client.get("/loop")
+
+        loop1, loop2 = loops
+        assert loop1 is not loop2
+
+    def test_async_view_has_app_context(self, app: Flask) -> None:
+        response = app.test_client().get("/name")
+
+        assert response.text == "boardman"
+
+
+async def _get_running_loop() -> AbstractEventLoop:
+    return asyncio.get_running_loop()
@@ -1,14 +1,25 @@
+import asyncio
+import logging
+import time
 from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
+import responses
+from _pytest.logging import LogCaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+from authlib.integrations.httpx_client import AsyncOAuth2Client
+from authlib.oauth2.rfc6749 import wrappers
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from cryptography.hazmat.primitives.serialization import Encoding, NoEncryption, PrivateFormat, PublicFormat
 from flask import Flask, request
-from httpx import Timeout
+from httpx import HTTPStatusError, Limits, Request, Response, Timeout
 from respx import MockRouter
 
+from schemes.event_loops import EventLoopFlask
 from schemes.oauth import OAuthExtension
 from tests.unit.oauth import StubAuthorizationServer
 
@@ -85,6 +96,9 @@ class TestOAuthExtension:
                 "ATE_ISSUER": authorization_server.issuer,
                 "ATE_AUDIENCE": api_resource_server.identifier,
                 "ATE_URL": api_server.url,
+                "ATE_MAX_CONNECTIONS": 10,
+                "ATE_KEEPALIVE_EXPIRY": 60,
+                "ATE_TOKEN_REFRESH_LEEWAY": 5 * 60,
             }
         )
         return app
@@ -104,6 +118,117 @@ class TestOAuthExtension:
 
         assert oauth.ate.client_kwargs.get("timeout") == Timeout(10)
 
+    def test_ate_api_uses_connection_limits(self, app: Flask) -> None:
+        oauth = OAuthExtension(app)
+
+        assert oauth.ate.client_kwargs.get("limits") == Limits(max_connections=10, keepalive_expiry=60)
+
+    async def test_ate_api_reuses_client_across_requests(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+        respx_mock.get(api_server.url)
+
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        with app.app_context():
+            async with oauth.ate.client() as client:
+                await client.get("/", request=request)
+
+        assert oauth.ate.client_pool_misses == 1 and oauth.ate.client_pool_hits == 1
+
+    async def test_ate_api_logs_client_pool_miss(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+        caplog: LogCaptureFixture,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+        respx_mock.get(api_server.url)
+
+        with app.app_context(), caplog.at_level(logging.DEBUG, logger="schemes.oauth"):
+            await oauth.ate.get("/", request=request)
+            await oauth.ate.get("/", request=request)
+
+        assert [record.message for record in caplog.records if "client pool" in record.message] == [
+            "Created pooled HTTP client for 'ate' (client pool hits: 0, misses: 1)"
+        ]
+
+    async def test_ate_api_counts_connections(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+        caplog: LogCaptureFixture,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+
+        async def open_connection(api_request: Request) -> Response:
+            if oauth.ate.request_count == 1:
+                await api_request.extensions["trace"]("connection.connect_tcp.complete", {})
+            return Response(200)
+
+        respx_mock.get(api_server.url).mock(side_effect=open_connection)
+
+        with app.app_context(), caplog.at_level(logging.INFO, logger="schemes.oauth"):
+            await oauth.ate.get("/", request=request)
+            await oauth.ate.get("/", request=request)
+
+        assert oauth.ate.request_count == 2 and oauth.ate.connection_count == 1
+        assert [record.message for record in caplog.records if record.levelname == "INFO"] == [
+            "Opened HTTP connection for 'ate' (requests: 1, connections: 1, client pool hits: 0, misses: 1)"
+        ]
+
+    async def test_ate_api_closes_client(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+        respx_mock.get(api_server.url)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+
+        with patch.object(AsyncOAuth2Client, "aclose", new_callable=AsyncMock) as aclose:
+            await oauth.ate.aclose()
+
+        aclose.assert_awaited_once()
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        assert oauth.ate.client_pool_misses == 2
+
+    def test_ate_api_closes_client_when_event_loop_stops(
+        self, respx_mock: MockRouter, app: Flask, authorization_server: StubAuthorizationServer, api_server: ApiServer
+    ) -> None:
+        event_loop_app = EventLoopFlask("test")
+        event_loop_app.config.from_mapping(app.config)
+        oauth = OAuthExtension(event_loop_app)
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+        respx_mock.get(api_server.url)
+
+        async def get() -> None:
+            with event_loop_app.app_context():
+                await oauth.ate.get("/", request=request)
+
+        event_loop_app.event_loop.run(get())
+        with patch.object(AsyncOAuth2Client, "aclose", new_callable=AsyncMock) as aclose:
+            event_loop_app.event_loop.stop()
+
+        aclose.assert_awaited_once()
+
     async def test_ate_api_uses_compression(
         self,
         respx_mock: MockRouter,
@@ -209,3 +334,176 @@ class TestOAuthExtension:
             await oauth.ate.get("/", request=request)
 
         assert token_response.call_count == 2 and api_response.call_count == 2
+
+    async def test_ate_api_refreshes_access_token_in_background_when_expiring(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        authorization_server.given_token_endpoint_returns_access_token("expiring_jwt", expires_in=15 * 60)
+        token_response = authorization_server.given_token_endpoint_returns_access_token(
+            "refreshed_jwt", expires_in=15 * 60
+        )
+        expiring_api_response = respx_mock.get(api_server.url, headers={"Authorization": "Bearer expiring_jwt"})
+        refreshed_api_response = respx_mock.get(api_server.url, headers={"Authorization": "Bearer refreshed_jwt"})
+
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        _given_time_passes(monkeypatch, 11 * 60)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        await asyncio.sleep(0)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+
+        assert token_response.call_count == 2
+        assert expiring_api_response.call_count == 2 and refreshed_api_response.call_count == 1
+
+    async def test_ate_api_caps_access_token_refresh_leeway_for_short_lived_token(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        authorization_server.given_token_endpoint_returns_access_token("short_lived_jwt", expires_in=4 * 60)
+        token_response = authorization_server.given_token_endpoint_returns_access_token(
+            "refreshed_jwt", expires_in=15 * 60
+        )
+        respx_mock.get(api_server.url)
+
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        await asyncio.sleep(0)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+
+        assert token_response.call_count == 1
+
+    async def test_ate_api_uses_expiring_access_token_when_refresh_fails(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+        monkeypatch: MonkeyPatch,
+        caplog: LogCaptureFixture,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        token_response = authorization_server.given_token_endpoint_returns_access_token(
+            "expiring_jwt", expires_in=15 * 60
+        )
+        api_response = respx_mock.get(api_server.url, headers={"Authorization": "Bearer expiring_jwt"})
+
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        _given_time_passes(monkeypatch, 11 * 60)
+        token_response.mock(side_effect=ValueError("Invalid token response"))
+        with app.app_context(), caplog.at_level(logging.WARNING, logger="schemes.oauth"):
+            await oauth.ate.get("/", request=request)
+            await asyncio.sleep(0)
+
+        assert api_response.call_count == 2
+        assert [record.message for record in caplog.records if record.levelname == "WARNING"] == [
+            "Cannot refresh ATE API access token: Invalid token response"
+        ]
+
+    async def test_ate_api_caches_server_metadata(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+        respx_mock.get(api_server.url)
+
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+
+        assert respx_mock["configuration_endpoint"].call_count == 1
+
+    async def test_ate_api_refreshes_server_metadata_when_expired(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        respx_mock.pop("configuration_endpoint")
+        authorization_server.given_configuration_endpoint_returns_configuration(max_age=0)
+        configuration_response = authorization_server.given_configuration_endpoint_returns_configuration()
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+        respx_mock.get(api_server.url)
+
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+
+        assert configuration_response.call_count == 2
+
+    async def test_ate_api_uses_last_known_good_server_metadata_when_refresh_fails(
+        self,
+        respx_mock: MockRouter,
+        app: Flask,
+        authorization_server: StubAuthorizationServer,
+        api_server: ApiServer,
+    ) -> None:
+        oauth = OAuthExtension(app)
+        respx_mock.pop("configuration_endpoint")
+        authorization_server.given_configuration_endpoint_returns_configuration(max_age=0)
+        configuration_response = authorization_server.given_configuration_endpoint_returns_error()
+        authorization_server.given_token_endpoint_returns_access_token("dummy_jwt", expires_in=15 * 60)
+        api_response = respx_mock.get(api_server.url, headers={"Authorization": "Bearer dummy_jwt"})
+
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+        with app.app_context():
+            await oauth.ate.get("/", request=request)
+
+        assert configuration_response.call_count == 2 and api_response.call_count == 2
+
+    async def test_ate_api_raises_error_when_server_metadata_unavailable(
+        self, respx_mock: MockRouter, app: Flask, authorization_server: StubAuthorizationServer
+    ) -> None:
+        oauth = OAuthExtension(app)
+        respx_mock.pop("configuration_endpoint")
+        authorization_server.given_configuration_endpoint_returns_error()
+
+        with app.app_context(), pytest.raises(HTTPStatusError):
+            await oauth.ate.get("/", request=request)
+
+    def test_govuk_uses_timeout(self, app: Flask) -> None:
+        oauth = OAuthExtension(app)
+
+        assert oauth.govuk.client_kwargs.get("default_timeout") == 10
+
+    @responses.activate
+    def test_govuk_caches_server_metadata(self, app: Flask) -> None:
+        app.config["GOVUK_SERVER_METADATA_URL"] = "https://oidc.example/.well-known/openid-configuration"
+        configuration_response = responses.get(
+            "https://oidc.example/.well-known/openid-configuration", json={"issuer": "https://oidc.example"}
+        )
+        oauth = OAuthExtension(app)
+
+        oauth.govuk.load_server_metadata()
+        server_metadata = oauth.govuk.load_server_metadata()
+
+        assert server_metadata["issuer"] == "https://oidc.example" and configuration_response.call_count == 1
+
+
+def _given_time_passes(monkeypatch: MonkeyPatch, seconds: int) -> None:
+    now = time.time() + seconds
+    monkeypatch.setattr(wrappers, "time", SimpleNamespace(time=lambda: now))
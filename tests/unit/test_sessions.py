@@ -1,12 +1,20 @@
 from collections.abc import Iterator
+from itertools import count
 from typing import Any
 from unittest.mock import patch
 
 import pytest
-from flask import Flask, Response, request
+from flask import Flask, Request, Response, request
 from flask.sessions import NullSession, SessionInterface, SessionMixin
+from flask_session.base import ServerSideSession
 
-from schemes.sessions import DelegatingSessionInterface, RequestFilteringSessionInterface
+from schemes.infrastructure.caching.caches import TtlCache
+from schemes.sessions import (
+    CachingSessionInterface,
+    DelegatingSessionInterface,
+    RequestFilteringSessionInterface,
+    session_exempt,
+)
 
 
 @pytest.fixture(name="app")
@@ -58,6 +66,257 @@ class TestRequestFilteringSessionInterface:
 
             assert actual_session is session
 
+    def test_open_session_filters_session_exempt_view(self, app: Flask) -> None:
+        app.add_url_rule("/privacy", view_func=session_exempt(lambda: ""), endpoint="privacy")
+        delegate = DummySessionInterface()
+        filtering = RequestFilteringSessionInterface(delegate, "/static/")
+
+        with app.test_request_context(path="/privacy"):
+            actual_session = filtering.open_session(app, request)
+
+            assert isinstance(actual_session, NullSession)
+
+    def test_open_session_delegates_unexempt_view(self, app: Flask) -> None:
+        app.add_url_rule("/home", view_func=lambda: "", endpoint="home")
+        delegate = DummySessionInterface()
+        filtering = RequestFilteringSessionInterface(delegate, "/static/")
+        session = DummySession()
+
+        with patch.object(delegate, "open_session", return_value=session), app.test_request_context(path="/home"):
+            actual_session = filtering.open_session(app, request)
+
+            assert actual_session is session
+
+    def test_open_session_delegates_unrouted_request(self, app: Flask) -> None:
+        delegate = DummySessionInterface()
+        filtering = RequestFilteringSessionInterface(delegate, "/static/")
+        session = DummySession()
+
+        with patch.object(delegate, "open_session", return_value=session), app.test_request_context(path="/missing"):
+            actual_session = filtering.open_session(app, request)
+
+            assert actual_session is session
+
+
+class FakeServerSideSessionInterface(SessionInterface):
+    def __init__(self) -> None:
+        self.sessions: dict[str, dict[str, Any]] = {}
+        self.open_count = 0
+        self.save_count = 0
+
+    def open_session(self, app: Flask, request: Request) -> ServerSideSession:
+        self.open_count += 1
+        sid = request.cookies.get(app.config["SESSION_COOKIE_NAME"])
+        if sid in self.sessions:
+            return ServerSideSession(self.sessions[sid], sid=sid)
+        return ServerSideSession(sid="new")
+
+    def save_session(self, app: Flask, session: ServerSideSession, response: Response) -> None:
+        self.save_count += 1
+        if session:
+            self.sessions[session.sid] = dict(session)
+        else:
+            self.sessions.pop(session.sid, None)
+
+
+class TestCachingSessionInterface:
+    @pytest.fixture(name="delegate")
+    def delegate_fixture(self) -> FakeServerSideSessionInterface:
+        return FakeServerSideSessionInterface()
+
+    @pytest.fixture(name="now")
+    def now_fixture(self) -> list[float]:
+        return [1000.0]
+
+    @pytest.fixture(name="caching")
+    def caching_fixture(self, delegate: FakeServerSideSessionInterface, now: list[float]) -> CachingSessionInterface:
+        versions = count(1)
+        return CachingSessionInterface(
+            delegate, TtlCache[str, dict[str, Any]](30, 10), 300, lambda: now[0], lambda: f"v{next(versions)}"
+        )
+
+    def test_open_session_delegates(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        delegate.sessions["abc"] = {"user": "boardman"}
+
+        with app.test_request_context(headers={"Cookie": "session=abc"}):
+            session = caching.open_session(app, request)
+
+        assert session.sid == "abc" and dict(session) == {"user": "boardman"}
+
+    def test_open_session_caches_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        delegate.sessions["abc"] = {"user": "boardman", "_version": "v1"}
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v1"}):
+            caching.open_session(app, request)
+        delegate.sessions["abc"] = {"user": "obree", "_version": "v1"}
+
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v1"}):
+            session = caching.open_session(app, request)
+
+        assert session.sid == "abc" and dict(session) == {"user": "boardman", "_version": "v1"}
+        assert delegate.open_count == 1
+
+    def test_open_session_delegates_when_version_changed(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        delegate.sessions["abc"] = {"user": "boardman", "_version": "v1"}
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v1"}):
+            caching.open_session(app, request)
+        delegate.sessions["abc"] = {"user": "obree", "_version": "v2"}
+
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v2"}):
+            session = caching.open_session(app, request)
+
+        assert dict(session) == {"user": "obree", "_version": "v2"}
+        assert delegate.open_count == 2
+
+    def test_open_session_delegates_without_version(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        delegate.sessions["abc"] = {"user": "boardman"}
+        with app.test_request_context(headers={"Cookie": "session=abc"}):
+            caching.open_session(app, request)
+
+        with app.test_request_context(headers={"Cookie": "session=abc"}):
+            caching.open_session(app, request)
+
+        assert delegate.open_count == 2
+
+    def test_open_session_does_not_cache_new_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        with app.test_request_context(headers={"Cookie": "session=abc"}):
+            caching.open_session(app, request)
+
+        with app.test_request_context(headers={"Cookie": "session=abc"}):
+            caching.open_session(app, request)
+
+        assert delegate.open_count == 2
+
+    def test_open_session_returns_copy_of_cached_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        delegate.sessions["abc"] = {"user": {"email": "boardman@example.com"}, "_version": "v1"}
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v1"}):
+            caching.open_session(app, request)["user"]["email"] = "obree@example.com"
+
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v1"}):
+            session = caching.open_session(app, request)
+
+        assert session["user"] == {"email": "boardman@example.com"}
+
+    def test_save_session_saves_modified_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        session = ServerSideSession(sid="abc")
+        session["user"] = "boardman"
+
+        caching.save_session(app, session, Response())
+
+        assert delegate.sessions["abc"] == {"user": "boardman", "_refreshed_at": 1000, "_version": "v1"}
+
+    def test_save_session_caches_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        session = ServerSideSession(sid="abc")
+        session["user"] = "boardman"
+        caching.save_session(app, session, Response())
+
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v1"}):
+            cached_session = caching.open_session(app, request)
+
+        assert dict(cached_session) == {"user": "boardman", "_refreshed_at": 1000, "_version": "v1"}
+        assert delegate.open_count == 0
+
+    def test_save_session_sets_version_cookie(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        session = ServerSideSession(sid="abc")
+        session["user"] = "boardman"
+        response = Response()
+
+        with app.test_request_context():
+            caching.save_session(app, session, response)
+
+        assert "session_version=v1" in response.headers.getlist("Set-Cookie")[0]
+
+    def test_save_session_invalidates_session_cached_by_other_worker(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface, now: list[float]
+    ) -> None:
+        other_caching = CachingSessionInterface(
+            delegate, TtlCache[str, dict[str, Any]](30, 10), 300, lambda: now[0], lambda: "v2"
+        )
+        session = ServerSideSession(sid="abc")
+        session["user"] = "boardman"
+        with app.test_request_context():
+            caching.save_session(app, session, Response())
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v1"}):
+            other_session = other_caching.open_session(app, request)
+        other_session["_flashes"] = [("message", "Scheme has been reviewed")]
+        with app.test_request_context():
+            other_caching.save_session(app, other_session, Response())
+
+        with app.test_request_context(headers={"Cookie": "session=abc; session_version=v2"}):
+            session = caching.open_session(app, request)
+
+        assert session["_flashes"] == [("message", "Scheme has been reviewed")]
+
+    def test_save_session_skips_unmodified_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface, now: list[float]
+    ) -> None:
+        session = ServerSideSession({"user": "boardman", "_refreshed_at": 1000}, sid="abc")
+        now[0] = 1299
+
+        caching.save_session(app, session, Response())
+
+        assert delegate.save_count == 0
+
+    def test_save_session_saves_unmodified_session_when_refresh_threshold_reached(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface, now: list[float]
+    ) -> None:
+        session = ServerSideSession({"user": "boardman", "_refreshed_at": 1000}, sid="abc")
+        now[0] = 1300
+
+        caching.save_session(app, session, Response())
+
+        assert delegate.sessions["abc"] == {"user": "boardman", "_refreshed_at": 1300, "_version": "v1"}
+
+    def test_save_session_saves_unmodified_session_when_never_refreshed(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        session = ServerSideSession({"user": "boardman"}, sid="abc")
+
+        caching.save_session(app, session, Response())
+
+        assert delegate.sessions["abc"] == {"user": "boardman", "_refreshed_at": 1000, "_version": "v1"}
+
+    def test_save_session_does_not_access_unmodified_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        session = ServerSideSession({"user": "boardman", "_refreshed_at": 1000}, sid="abc")
+        response = Response()
+
+        caching.save_session(app, session, response)
+
+        assert "Cookie" not in response.vary
+
+    def test_save_session_evicts_deleted_session(
+        self, app: Flask, delegate: FakeServerSideSessionInterface, caching: CachingSessionInterface
+    ) -> None:
+        session = ServerSideSession(sid="abc")
+        session["user"] = "boardman"
+        caching.save_session(app, session, Response())
+        session.clear()
+
+        caching.save_session(app, session, Response())
+
+        with app.test_request_context(headers={"Cookie": "session=abc"}):
+            caching.open_session(app, request)
+        assert "abc" not in delegate.sessions and delegate.open_count == 1
+
 
 class DummySessionInterface(SessionInterface):
     pass
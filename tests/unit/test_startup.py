@@ -0,0 +1,55 @@
+import pytest
+
+from schemes.startup import StartupTimer
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStartupTimer:
+    @pytest.fixture(name="timer")
+    def timer_fixture(self) -> FakeTimer:
+        return FakeTimer()
+
+    @pytest.fixture(name="startup")
+    def startup_fixture(self, timer: FakeTimer) -> StartupTimer:
+        return StartupTimer(timer=timer, cpu_timer=lambda: 0.5)
+
+    def test_cpu_time_before_startup(self, startup: StartupTimer) -> None:
+        assert startup.cpu_time_before_startup == 0.5
+
+    def test_phases(self, timer: FakeTimer, startup: StartupTimer) -> None:
+        with startup.phase("config"):
+            timer.now = 1
+        with startup.phase("database"):
+            timer.now = 3
+
+        assert startup.phases == {"config": 1, "database": 2}
+
+    def test_phase_is_timed_when_error(self, timer: FakeTimer, startup: StartupTimer) -> None:
+        with pytest.raises(ValueError), startup.phase("config"):
+            timer.now = 1
+            raise ValueError()
+
+        assert startup.phases == {"config": 1}
+
+    def test_elapsed(self, timer: FakeTimer, startup: StartupTimer) -> None:
+        timer.now = 2
+
+        assert startup.elapsed == 2
+
+    def test_first_response(self, timer: FakeTimer, startup: StartupTimer) -> None:
+        timer.now = 2
+
+        assert startup.first_response() == 2
+
+    def test_first_response_only_once(self, timer: FakeTimer, startup: StartupTimer) -> None:
+        startup.first_response()
+        timer.now = 2
+
+        assert startup.first_response() is None
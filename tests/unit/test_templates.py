@@ -0,0 +1,65 @@
+import os
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from flask import Flask
+
+from schemes.templates import compile_templates, configure_jinja, main
+
+
+def _create_app(template_cache_dir: Path | None) -> Flask:
+    app = Flask("schemes", template_folder="views/templates")
+    app.config["TEMPLATE_CACHE_DIR"] = str(template_cache_dir) if template_cache_dir else None
+    return app
+
+
+class TestTemplates:
+    def test_configure_jinja_without_bytecode_cache(self) -> None:
+        app = _create_app(None)
+
+        configure_jinja(app)
+
+        assert app.jinja_env.bytecode_cache is None
+
+    def test_configure_jinja_with_bytecode_cache(self, tmp_path: Path) -> None:
+        app = _create_app(tmp_path / "templates")
+
+        configure_jinja(app)
+
+        assert app.jinja_env.bytecode_cache and (tmp_path / "templates").is_dir()
+
+    def test_compile_templates(self, tmp_path: Path) -> None:
+        app = _create_app(tmp_path)
+        configure_jinja(app)
+
+        template_names = compile_templates(app)
+
+        assert "base.html" in template_names
+        assert "govuk_frontend_jinja/template.html" in template_names
+        assert len(os.listdir(tmp_path)) == len(template_names)
+
+    def test_compiled_templates_are_reused_from_another_path(self, tmp_path: Path) -> None:
+        app = _create_app(tmp_path)
+        configure_jinja(app)
+        compile_templates(app)
+        bytecode_cache = app.jinja_env.bytecode_cache
+        assert bytecode_cache
+        source = Path(app.root_path, "views/templates/base.html").read_text()
+
+        bucket = bytecode_cache.get_bucket(app.jinja_env, "base.html", "/elsewhere/base.html", source)
+
+        assert bucket.code is not None
+
+    def test_main(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv("FLASK_TEMPLATE_CACHE_DIR", str(tmp_path))
+
+        main()
+
+        assert os.listdir(tmp_path)
+
+    def test_main_when_no_template_cache_dir(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.delenv("FLASK_TEMPLATE_CACHE_DIR", raising=False)
+
+        with pytest.raises(SystemExit):
+            main()
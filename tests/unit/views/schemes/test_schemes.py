@@ -16,6 +16,7 @@ from schemes.domain.schemes.reviews import AuthorityReview
 from schemes.views.schemes.milestones import MilestoneContext
 from schemes.views.schemes.schemes import (
     FundingProgrammeContext,
+    PaginationContext,
     SchemeContext,
     SchemeOverviewContext,
     SchemeRowContext,
@@ -33,7 +34,9 @@ class TestSchemesContext:
             build_scheme(reference="ATE00002", name="School Streets", authority_abbreviation="LIV"),
         ]
 
-        context = SchemesContext.from_domain(datetime.min, dummy_reporting_window(), authority, schemes)
+        context = SchemesContext.from_domain(
+            datetime.min, dummy_reporting_window(), authority, [scheme.summary for scheme in schemes]
+        )
 
         assert (
             context.authority_name == "Liverpool City Region Combined Authority"
@@ -49,7 +52,7 @@ class TestSchemesContext:
             AuthorityReview(id_=1, review_date=datetime(2020, 1, 2), source=DataSource.ATF4_BID)
         )
 
-        context = SchemesContext.from_domain(datetime(2020, 4, 24, 12), reporting_window, authority, [scheme])
+        context = SchemesContext.from_domain(datetime(2020, 4, 24, 12), reporting_window, authority, [scheme.summary])
 
         assert context.reporting_window_days_left == 7
 
@@ -61,7 +64,7 @@ class TestSchemesContext:
             AuthorityReview(id_=1, review_date=datetime(2020, 4, 1), source=DataSource.ATF4_BID)
         )
 
-        context = SchemesContext.from_domain(datetime(2020, 4, 24, 12), reporting_window, authority, [scheme])
+        context = SchemesContext.from_domain(datetime(2020, 4, 24, 12), reporting_window, authority, [scheme.summary])
 
         assert context.reporting_window_days_left is None
 
@@ -82,16 +85,74 @@ class TestSchemesContext:
             AuthorityReview(id_=1, review_date=datetime(2020, 1, 2), source=DataSource.ATF4_BID)
         )
 
-        context = SchemesContext.from_domain(datetime.min, reporting_window, authority, [scheme])
+        context = SchemesContext.from_domain(datetime.min, reporting_window, authority, [scheme.summary])
 
         assert context.schemes[0].needs_review
 
+    def test_from_domain_sets_page_of_schemes(self) -> None:
+        authority = Authority(abbreviation="LIV", name="")
+        schemes = [
+            build_scheme(reference=f"ATE0000{index}", name="", authority_abbreviation="LIV") for index in range(1, 6)
+        ]
+
+        context = SchemesContext.from_domain(
+            datetime.min, dummy_reporting_window(), authority, [scheme.summary for scheme in schemes], 2, 2
+        )
+
+        assert [scheme.reference for scheme in context.schemes] == ["ATE00003", "ATE00004"]
+        assert context.pagination == PaginationContext(page=2, page_count=3)
+
+    def test_from_domain_sets_reporting_window_days_left_when_scheme_on_another_page_needs_review(self) -> None:
+        reporting_window = ReportingWindow(DateRange(datetime(2020, 4, 1), datetime(2020, 5, 1)))
+        authority = Authority(abbreviation="LIV", name="")
+        scheme1 = build_scheme(reference="ATE00001", name="", authority_abbreviation="LIV")
+        scheme1.reviews.update_authority_review(
+            AuthorityReview(id_=1, review_date=datetime(2020, 1, 2), source=DataSource.ATF4_BID)
+        )
+        scheme2 = build_scheme(reference="ATE00002", name="", authority_abbreviation="LIV")
+        scheme2.reviews.update_authority_review(
+            AuthorityReview(id_=2, review_date=datetime(2020, 4, 1), source=DataSource.ATF4_BID)
+        )
+
+        context = SchemesContext.from_domain(
+            datetime(2020, 4, 24, 12), reporting_window, authority, [scheme1.summary, scheme2.summary], 2, 1
+        )
+
+        assert context.reporting_window_days_left == 7
+
+
+class TestPaginationContext:
+    @pytest.mark.parametrize(
+        "count, page_size, expected_page_count",
+        [(0, 2, 1), (1, 2, 1), (2, 2, 1), (3, 2, 2), (3, None, 1)],
+    )
+    def test_from_count(self, count: int, page_size: int | None, expected_page_count: int) -> None:
+        context = PaginationContext.from_count(1, count, page_size)
+
+        assert context.page_count == expected_page_count
+
+    @pytest.mark.parametrize(
+        "page, page_count, expected_pages",
+        [
+            (1, 1, [1]),
+            (1, 3, [1, 2, 3]),
+            (1, 10, [1, 2, None, 10]),
+            (5, 10, [1, None, 4, 5, 6, None, 10]),
+            (3, 10, [1, 2, 3, 4, None, 10]),
+            (10, 10, [1, None, 9, 10]),
+        ],
+    )
+    def test_pages(self, page: int, page_count: int, expected_pages: list[int | None]) -> None:
+        context = PaginationContext(page=page, page_count=page_count)
+
+        assert context.pages == expected_pages
+
 
 class TestSchemeRowContext:
     def test_from_domain(self) -> None:
         scheme = build_scheme(reference="ATE00001", name="Wirral Package", funding_programme=FundingProgrammes.ATF4)
 
-        context = SchemeRowContext.from_domain(dummy_reporting_window(), scheme)
+        context = SchemeRowContext.from_domain(dummy_reporting_window(), scheme.summary)
 
         assert context == SchemeRowContext(
             reference="ATE00001",
@@ -115,7 +176,7 @@ class TestSchemeRowContext:
             AuthorityReview(id_=1, review_date=review_date, source=DataSource.ATF4_BID)
         )
 
-        context = SchemeRowContext.from_domain(reporting_window, scheme)
+        context = SchemeRowContext.from_domain(reporting_window, scheme.summary)
 
         assert context.needs_review == expected_needs_review
 
@@ -126,7 +187,7 @@ class TestSchemeRowContext:
             AuthorityReview(id_=2, review_date=datetime(2020, 1, 3, 12), source=DataSource.ATF4_BID),
         )
 
-        context = SchemeRowContext.from_domain(dummy_reporting_window(), scheme)
+        context = SchemeRowContext.from_domain(dummy_reporting_window(), scheme.summary)
 
         assert context.last_reviewed == datetime(2020, 1, 3, 12)
 
@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask, request
+from jinja2 import DictLoader
+
+from schemes.views.streaming import stream_template
+
+
+class TestStreaming:
+    @pytest.fixture(name="app", autouse=True)
+    def app_fixture(self, app: Flask) -> Flask:
+        app.jinja_loader = DictLoader(
+            {
+                "rows.html": "{% for row in rows %}<p>{{ row }}</p>{% endfor %}",
+                "request.html": "{{ request.path }}",
+            }
+        )
+        return app
+
+    def test_stream_template(self, app: Flask) -> None:
+        with app.test_request_context():
+            chunks = list(stream_template("rows.html", rows=["a", "b"]))
+
+        assert "".join(chunks) == "<p>a</p><p>b</p>"
+
+    def test_stream_template_buffers_chunks(self, app: Flask) -> None:
+        with app.test_request_context():
+            chunks = list(stream_template("rows.html", buffer_size=16, rows=["a", "b", "c"]))
+
+        assert chunks == ["<p>a</p><p>b</p>", "<p>c</p>"]
+
+    def test_stream_template_has_request_context(self, app: Flask) -> None:
+        with app.test_request_context("/schemes"):
+            chunks = stream_template("request.html")
+
+        assert "".join(chunks) == "/schemes"
+
+    def test_stream_template_consumed_on_another_thread(self, app: Flask) -> None:
+        with app.test_request_context("/schemes"):
+            chunks = stream_template("request.html")
+
+            with ThreadPoolExecutor() as executor:
+                output = executor.submit(lambda: "".join(chunks)).result()
+
+            assert output == "/schemes" and request.path == "/schemes"